@@ -0,0 +1,200 @@
+# benchmark_pipeline.py
+# date: 2026-10-18
+
+import click
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import zipfile
+import pandas as pd
+import altair as alt
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+from utils.benchmark import make_synthetic_heart, run_measured
+import validate_data
+import preprocessing
+import eda
+import evaluate_default_models
+import hyperparameter_tuning
+import evaluate_scores
+
+RAW_CSV = "heart.csv"
+POS_LABEL = "Heart Disease"
+
+
+def _paths(work_dir):
+    return {
+        "zip": os.path.join(work_dir, "dataset.zip"),
+        "raw": os.path.join(work_dir, "raw"),
+        "validated": os.path.join(work_dir, "validated"),
+        "processed": os.path.join(work_dir, "processed"),
+        "preprocessor": os.path.join(work_dir, "preprocessor"),
+        "eda": os.path.join(work_dir, "eda"),
+        "cv": os.path.join(work_dir, "cv_default_models"),
+        "final": os.path.join(work_dir, "final_model_results"),
+    }
+
+
+def _baseline(work_dir, search):
+    # imports only; its peak RSS is subtracted from each stage's to give stage_rss_mb
+    pass
+
+
+def _cli(command, args):
+    command.main(args, standalone_mode=False)
+
+
+def run_import_data(work_dir, search):
+    # read_zip downloads and then extracts; only the extraction is benchmarked, done here the same way
+    paths = _paths(work_dir)
+    with zipfile.ZipFile(paths["zip"]) as zip_ref:
+        zip_ref.extractall(paths["raw"])
+
+
+def run_validate_data(work_dir, search):
+    paths = _paths(work_dir)
+    _cli(validate_data.main, ["--raw-data", os.path.join(paths["raw"], RAW_CSV), "--data-to", paths["validated"]])
+
+
+def run_preprocessing(work_dir, search):
+    paths = _paths(work_dir)
+    _cli(preprocessing.main, ["--raw-data", os.path.join(paths["validated"], "heart_validated.csv"),
+                              "--data-to", paths["processed"], "--preprocessor-to", paths["preprocessor"],
+                              "--seed", "123", "--split", "0.3"])
+
+
+def run_eda(work_dir, search):
+    paths = _paths(work_dir)
+    alt.data_transformers.disable_max_rows()
+    _cli(eda.main, ["--data", os.path.join(paths["processed"], "train_heart.csv"), "--output-dir", paths["eda"],
+                    "--target-col", "target",
+                    "--num-cols", "age,resting_bp,serum_cholesterol,max_heart_rate,old_peak",
+                    "--cat-cols", "gender,chest_pain,fasting_blood_sugar,resting_electro,exercise_angina,slope,num_major_vessels"])
+
+
+def run_evaluate_default_models(work_dir, search):
+    paths = _paths(work_dir)
+    _cli(evaluate_default_models.main, ["--train-data", os.path.join(paths["processed"], "train_heart.csv"),
+                                        "--target-col", "target",
+                                        "--preprocessor-path", os.path.join(paths["preprocessor"], "heart_preprocessor.pickle"),
+                                        "--pos-label", POS_LABEL,
+                                        "--results", os.path.join(paths["cv"], "cv_scores_default_parameters.csv"),
+                                        "--fold-plan", os.path.join(paths["processed"], "train_heart_folds.csv")])
+
+
+def run_hyperparameter_tuning(work_dir, search):
+    paths = _paths(work_dir)
+    _cli(hyperparameter_tuning.main, ["--train-data", os.path.join(paths["processed"], "train_heart.csv"),
+                                      "--target-col", "target",
+                                      "--preprocessor-path", os.path.join(paths["preprocessor"], "heart_preprocessor.pickle"),
+                                      "--pos-label", POS_LABEL,
+                                      "--results-to", paths["final"],
+                                      "--search", search,
+                                      "--fold-plan", os.path.join(paths["processed"], "train_heart_folds.csv")])
+
+
+def run_evaluate_scores(work_dir, search):
+    paths = _paths(work_dir)
+    _cli(evaluate_scores.main, ["--test-data", os.path.join(paths["processed"], "test_heart.csv"),
+                                "--target-col", "target",
+                                "--final-model-path", os.path.join(paths["final"], "final_model.pickle"),
+                                "--pos-label", POS_LABEL,
+                                "--results-to", paths["final"]])
+
+
+# stages in pipeline order; each one reads the outputs of the stages before it
+STAGES = {
+    "import_data": run_import_data,
+    "validate_data": run_validate_data,
+    "preprocessing": run_preprocessing,
+    "eda": run_eda,
+    "evaluate_default_models": run_evaluate_default_models,
+    "hyperparameter_tuning": run_hyperparameter_tuning,
+    "evaluate_scores": run_evaluate_scores,
+}
+
+
+@click.command()
+@click.option('--raw-data', type=str, default='data/raw/Cardiovascular_Disease_Dataset/Cardiovascular_Disease_Dataset.csv',
+              show_default=True, help="Path to the raw dataset that is scaled up")
+@click.option('--sizes', type=str, default='1000,10000,100000,1000000', show_default=True,
+              help="Comma-separated dataset sizes (rows) to benchmark")
+@click.option('--stages', type=str, default=','.join(STAGES), show_default=True,
+              help="Comma-separated pipeline stages to benchmark")
+@click.option('--search', type=click.Choice(hyperparameter_tuning.SEARCH_MODES), default='random', show_default=True,
+              help="Search strategy used by the hyperparameter tuning stage")
+@click.option('--timeout', type=float, default=None, help="Seconds after which a single stage run is stopped")
+@click.option('--work-dir', type=str, default=None, help="Directory for intermediate outputs (a temporary directory by default)")
+@click.option('--output', type=str, required=True, help="Path of the JSON benchmark report")
+@click.option('--seed', type=int, help="Random seed", default=123)
+
+def main(raw_data, sizes, stages, search, timeout, work_dir, output, seed):
+    '''
+    Benchmark each pipeline stage on the bundled dataset and on scaled-up
+    synthetic versions, recording wall time, peak RSS (total, and above the
+    RSS of a process that only did the imports), the peak RSS of the largest
+    worker process and throughput.
+    '''
+    sizes = [int(size) for size in sizes.split(",") if size.strip()]
+    stages = [stage.strip() for stage in stages.split(",") if stage.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise click.BadParameter(f"unknown stages {sorted(unknown)}", param_hint="--stages")
+
+    raw_df = pd.read_csv(raw_data)
+    work_dir = work_dir or tempfile.mkdtemp(prefix="heart_benchmark_")
+
+    baseline = run_measured(_baseline, work_dir, search)
+    results = []
+    for n_rows in sizes:
+        size_dir = os.path.join(work_dir, f"rows_{n_rows}")
+        os.makedirs(size_dir, exist_ok=True)
+        data = raw_df if n_rows == len(raw_df) else make_synthetic_heart(raw_df, n_rows, seed=seed)
+        with zipfile.ZipFile(_paths(size_dir)["zip"], "w", zipfile.ZIP_DEFLATED) as zip_ref:
+            zip_ref.writestr(RAW_CSV, data.to_csv(index=False))
+
+        for stage in stages:
+            measurement = run_measured(STAGES[stage], size_dir, search, timeout=timeout)
+            wall_time = measurement["wall_time_s"]
+            record = {
+                "stage": stage,
+                "rows": n_rows,
+                "status": measurement["status"],
+                "wall_time_s": wall_time,
+                "peak_rss_mb": measurement["peak_rss_mb"],
+                "peak_rss_children_mb": measurement["peak_rss_children_mb"],
+                # peak RSS above the interpreter and imports, i.e. what the stage itself added
+                "stage_rss_mb": (measurement["peak_rss_mb"] - baseline["peak_rss_mb"]
+                                 if measurement["peak_rss_mb"] is not None and baseline["peak_rss_mb"] is not None
+                                 else None),
+                "rows_per_s": n_rows / wall_time if measurement["status"] == "ok" and wall_time > 0 else None,
+                "error": measurement["error"],
+            }
+            results.append(record)
+            stage_rss = record["stage_rss_mb"] if record["stage_rss_mb"] is not None else float("nan")
+            print(f"{stage:<25} {n_rows:>9} rows  {record['status']:<7} {wall_time:9.2f} s  {stage_rss:9.1f} MB  "
+                  f"(largest worker {record['peak_rss_children_mb'] or 0:.1f} MB)")
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "search": search,
+        "rss_measured": ("peak_rss_mb and stage_rss_mb cover the stage's own process only; "
+                         "peak_rss_children_mb is the largest of its worker processes"),
+        "baseline_rss_mb": baseline["peak_rss_mb"],
+        "results": results,
+    }
+    output_dir = os.path.dirname(output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,21 @@
 import click
+import csv
 import pandas as pd
 from pathlib import Path
 import pickle
 import os
 import sys
 
+from sklearn import set_config
 from sklearn.pipeline import make_pipeline
 from sklearn.metrics import make_scorer, fbeta_score
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.mean_std_cv_scores import mean_std_cross_val_scores
+from utils.mean_std_cv_scores import summarize_cv_scores, format_mean_std
+from utils.parallel_cv import cross_validate_models, SCORE_COLUMNS
 from utils.models import get_models
+from utils.transform_cache import TransformCache
+from utils.fold_plan import load_fold_plan, fold_plan_splits
 
     
 @click.command()
@@ -21,8 +26,12 @@ from utils.models import get_models
 @click.option('--beta', default=2.0, help='Beta parameter for fbeta_score')
 @click.option('--random-state', default=123, help='Random state for classifiers')
 @click.option('--results', required=True, help='File path to save results table, include name of the CSV file e.g., results/CV_scores_default_parameters.csv')
+@click.option('--transform-cache', default=None, help='Directory for cached preprocessor transforms shared across folds, models and stages')
+@click.option('--fold-plan', default=None, help='Path to the fold plan CSV written by preprocessing.py; defaults to 5 unshuffled stratified folds')
+@click.option('--n-jobs', default=-1, help='Number of workers evaluating (model, fold) pairs in parallel; -1 uses all CPUs')
+@click.option('--approximate-kernels', is_flag=True, default=False, help='Also evaluate the approximate kernel SVMs (Nystroem and random Fourier features)')
 
-def main(train_data, target_col, preprocessor_path, pos_label, beta, random_state, results):
+def main(train_data, target_col, preprocessor_path, pos_label, beta, random_state, results, transform_cache, fold_plan, n_jobs, approximate_kernels):
     """
     Evaluate default models using cross-validation and save results.
     Parameters
@@ -41,7 +50,16 @@ def main(train_data, target_col, preprocessor_path, pos_label, beta, random_stat
         Random state for classifiers.
     results : str
         File path to save results table.
+    transform_cache : str
+        Directory for cached preprocessor transforms, or None to disable caching.
+    fold_plan : str
+        Path to the fold plan CSV, or None for 5 stratified folds.
+    n_jobs : int
+        Number of workers evaluating (model, fold) pairs in parallel.
+    approximate_kernels : bool
+        Also evaluate the Nystroem and random Fourier feature SVMs.
     """
+    set_config(transform_output="pandas")
 
     df = pd.read_csv(train_data)
 
@@ -51,22 +69,36 @@ def main(train_data, target_col, preprocessor_path, pos_label, beta, random_stat
     with open(preprocessor_path, "rb") as f:
         preprocessor = pickle.load(f)
 
-    models = get_models(random_state=random_state)
+    models = get_models(random_state=random_state, approximate_kernels=approximate_kernels)
     scorer = make_scorer(fbeta_score, pos_label=pos_label, beta=beta)
+    memory = TransformCache(transform_cache) if transform_cache else None
+    cv = fold_plan_splits(load_fold_plan(fold_plan, n_rows=len(df))) if fold_plan else 5
 
-    results_dict = {}
-    for name, model in models.items():
-        pipe = make_pipeline(preprocessor, model)
-        results_dict[name] = mean_std_cross_val_scores(
-            pipe, X_train, y_train, cv=5, return_train_score=True, scoring=scorer
-        )
-    results_df = pd.DataFrame(results_dict).T
+    pipes = {name: make_pipeline(preprocessor, model, memory=memory) for name, model in models.items()}
 
     results_path = Path(results)
     results_path.parent.mkdir(parents=True, exist_ok=True)
-    
+
+    # each (model, fold) score is written as soon as it finishes
+    folds_path = results_path.with_name(f"{results_path.stem}_folds.csv")
+    with open(folds_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["model", "fold", *SCORE_COLUMNS])
+        writer.writeheader()
+
+        def write_fold(record):
+            writer.writerow(record)
+            f.flush()
+
+        scores = cross_validate_models(pipes, X_train, y_train, scorer, cv=cv, n_jobs=n_jobs,
+                                       return_train_score=True, on_result=write_fold)
+
+    results_df = format_mean_std(pd.DataFrame({name: summarize_cv_scores(scores[name]) for name in models}).T)
     results_df.to_csv(results_path, index=True)
 
+    if memory is not None:
+        stats = memory.stats()
+        print(f"Transform cache: {stats['hits']} hits, {stats['misses']} misses")
+
 
 if __name__ == "__main__":
     main()
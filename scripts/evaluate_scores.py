@@ -7,47 +7,93 @@ import os
 import numpy as np
 import pandas as pd
 import pickle
+import sys
+from pathlib import Path
 from sklearn.metrics import ConfusionMatrixDisplay
-from sklearn.metrics import fbeta_score
 from sklearn import set_config
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.bootstrap import bootstrap_confidence_intervals
+from utils.evaluation import evaluate_models
+from utils.registry import ArtifactRegistry, code_fingerprint, file_fingerprint
+
 @click.command()
 @click.option('--test-data', required=True, help='Path to test data CSV')
 @click.option('--target-col', required=True, help='Name of the target column')
-@click.option('--final-model-path', required=True, help='Path to the final model')
+@click.option('--final-model-path', required=True, multiple=True, help='Path to the final model; repeat to evaluate further models in the same pass')
+@click.option('--model-name', multiple=True, default=['RBF SVM'], show_default=True, help='Name of each model in the results, in --final-model-path order; unnamed models use their file name')
 @click.option('--pos-label', default='Heart Disease', help='Positive class label for fbeta_score')
 @click.option('--beta', default=2.0, help='Beta parameter for fbeta_score')
 @click.option('--results-to', type=str, help="Path to directory where the final model will be written to")
+@click.option('--bootstrap', type=int, default=0, help='Number of bootstrap resamples for confidence intervals of F2, recall and precision; 0 disables them')
+@click.option('--confidence', type=float, default=0.95, help='Confidence level of the bootstrap intervals')
+@click.option('--seed', type=int, default=123, help='Random seed for the bootstrap resampling')
+@click.option('--chunksize', type=int, default=None, help='Rows of the test data predicted at a time; by default all at once')
+@click.option('--registry', type=str, default=None, help='Artifact registry directory; results of an identical earlier evaluation (same data, models, code and settings) are restored from it instead of recomputed')
+@click.option('--registry-max-mb', type=float, default=None, help='Size cap of the registry in MB; least recently used entries are removed beyond it')
 
-def main(test_data, target_col, final_model_path, pos_label, beta, results_to):
+def main(test_data, target_col, final_model_path, model_name, pos_label, beta, results_to, bootstrap, confidence, seed, chunksize,
+         registry, registry_max_mb):
     '''
     Evaluate the final model on the test data and save the results.
     '''
     set_config(transform_output="pandas")
 
-    # Reading the test data
-    test_df = pd.read_csv(test_data)
-
-    X_test = test_df.drop(columns=[target_col])
-    y_test = test_df[target_col]
+    outputs = {name: os.path.join(results_to, name) for name in
+               ["evaluate_model_results.csv", "confusion_matrix.png", "confusion_matrix.csv",
+                "bootstrap_confidence_intervals.csv"]}
+    if bootstrap <= 0:
+        del outputs["bootstrap_confidence_intervals.csv"]
+    names = [model_name[i] if i < len(model_name) else Path(path).stem for i, path in enumerate(final_model_path)]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise click.BadParameter(f"models must have distinct names, got {duplicates} more than once; "
+                                 "name them with one --model-name per --final-model-path", param_hint="--model-name")
+    if registry is not None:
+        registry = ArtifactRegistry(registry, max_bytes=registry_max_mb * 1e6 if registry_max_mb else None)
+        inputs = dict(test_data=file_fingerprint(test_data), target_col=target_col,
+                      models=[[name, file_fingerprint(path)] for name, path in zip(names, final_model_path)],
+                      pos_label=pos_label, beta=beta, bootstrap=bootstrap, confidence=confidence, seed=seed,
+                      code=code_fingerprint(__file__, os.path.join(os.path.dirname(__file__), '..', 'utils')))
+        key = registry.key("evaluate_scores", **inputs)
+        if registry.restore(key, outputs):
+            print(f"Restored the evaluation results from the registry ({key[:12]})")
+            return
 
-    # Load the final model
-    with open(final_model_path, "rb") as f:
-        final_model = pickle.load(f)
+    # Load the final model and any further models to compare against it
+    models = {}
+    for name, path in zip(names, final_model_path):
+        with open(path, "rb") as f:
+            models[name] = pickle.load(f)
 
-    y_pred = final_model.predict(X_test)
-    result = fbeta_score(y_test, y_pred, beta=beta, pos_label=pos_label)
+    # One pass over the test data; every metric comes from the same predictions
+    evaluation = evaluate_models(models, test_data, target_col, pos_label, beta=beta, chunksize=chunksize,
+                                 return_predictions=bootstrap > 0)
 
-    result_df = pd.DataFrame({'Best Model': ['RBF SVM'], 
-                              'Test F2 Score': result})
-    result_df.columns = ['Best Model', 'Test F2 Score']
+    result_df = pd.DataFrame({
+        'Best Model': list(evaluation),
+        'Test F2 Score': [e["metrics"]["fbeta"] for e in evaluation.values()],
+        'Test Recall': [e["metrics"]["recall"] for e in evaluation.values()],
+        'Test Precision': [e["metrics"]["precision"] for e in evaluation.values()],
+        'Test Accuracy': [e["metrics"]["accuracy"] for e in evaluation.values()],
+    })
 
     os.makedirs(results_to, exist_ok=True)
     
     result_df.to_csv(os.path.join(results_to, "evaluate_model_results.csv"), index=False)
 
+    # The plots, confusion matrix and intervals describe the final model
+    final = evaluation[next(iter(evaluation))]
+    labels = list(final["labels"])
+    if bootstrap > 0:
+        ci_df = bootstrap_confidence_intervals(final["y_true"], final["y_pred"], pos_label, beta=beta,
+                                               n_resamples=bootstrap, confidence=confidence, seed=seed)
+        ci_df.to_csv(os.path.join(results_to, "bootstrap_confidence_intervals.csv"), index=False)
+
     # Save the confusion matrix plot
-    cm = ConfusionMatrixDisplay.from_estimator(final_model, X_test, y_test, labels = ['No Heart Disease','Heart Disease'])
+    display_labels = ['No Heart Disease', 'Heart Disease']
+    order = [labels.index(label) for label in display_labels]
+    cm = ConfusionMatrixDisplay(final["confusion"][np.ix_(order, order)], display_labels=display_labels).plot()
     fig = cm.figure_
     fig.set_figwidth(8)
     fig.set_figheight(6)
@@ -55,12 +101,13 @@ def main(test_data, target_col, final_model_path, pos_label, beta, results_to):
     fig.tight_layout()
     fig.savefig(os.path.join(results_to, "confusion_matrix.png"))
 
-    cm_df = pd.crosstab(
-        y_test, y_pred
-    )
+    cm_df = pd.DataFrame(final["confusion"], index=labels, columns=labels)
     cm_df.columns = ["Predicted No Heart Disease", "Predicted Heart Disease"]
     cm_df.index   = ["Actual No Heart Disease", "Actual Heart Disease"]
     cm_df.to_csv(os.path.join(results_to, "confusion_matrix.csv"), index=True)
 
+    if registry is not None:
+        registry.store(key, outputs, kind="evaluate_scores", inputs=inputs)
+
 if __name__ == '__main__':
     main()  
\ No newline at end of file
@@ -0,0 +1,62 @@
+# export_numpy_scorer.py
+# date: 2026-10-18
+
+import click
+import os
+import pickle
+import sys
+import time
+import pandas as pd
+from sklearn import set_config
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.numpy_scorer import export_numpy_scorer
+from utils.artifact_store import save_artifact, ARTIFACT_SUFFIX
+
+def _call_ms(predict, X, repeats=20):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        predict(X)
+    return (time.perf_counter() - start) / repeats * 1000
+
+@click.command()
+@click.option('--model-path', default='results/final_model_results/final_model.pickle', show_default=True,
+              help='Path to the fitted model (preprocessor + classifier pipeline)')
+@click.option('--output', default='results/final_model_results/final_model_numpy.npz', show_default=True,
+              help='Path the NumPy scorer is written to; a .artifact suffix writes the memory-mappable format, otherwise .npz')
+@click.option('--test-data', default=None, help='Optional CSV (e.g. data/processed/test_heart.csv) to check the scorer against the pipeline on')
+@click.option('--target-col', default='target', show_default=True, help='Target column dropped from --test-data')
+
+def main(model_path, output, test_data, target_col):
+    '''
+    Export the final model to a pure NumPy scorer and optionally check it against the pipeline.
+    '''
+    set_config(transform_output="pandas")
+
+    with open(model_path, "rb") as f:
+        model = pickle.load(f)
+
+    scorer = export_numpy_scorer(model)
+    output_dir = os.path.dirname(output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    if output.endswith(ARTIFACT_SUFFIX):
+        save_artifact(scorer, output)
+    else:
+        scorer.save(output)
+    print(f"Wrote the NumPy scorer ({scorer.model['kind']}, {scorer.n_features} features) to {output}")
+
+    if test_data is not None:
+        X = pd.read_csv(test_data).drop(columns=target_col, errors="ignore")
+        mismatches = int((scorer.predict(X) != model.predict(X)).sum())
+        if mismatches:
+            raise click.ClickException(f"{mismatches} of {len(X)} predictions differ from the pipeline")
+        X_array = X[scorer.input_columns].to_numpy(dtype=float)
+        for rows in (1, len(X)):
+            sklearn_ms = _call_ms(model.predict, X.iloc[:rows])
+            numpy_ms = _call_ms(scorer.predict, X_array[:rows])
+            print(f"{rows} rows: pipeline {sklearn_ms:.3f} ms, NumPy {numpy_ms:.3f} ms ({sklearn_ms / numpy_ms:.0f}x)")
+        print(f"All {len(X)} predictions match the pipeline")
+
+if __name__ == '__main__':
+    main()
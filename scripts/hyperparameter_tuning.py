@@ -8,11 +8,19 @@ import numpy as np
 import pandas as pd
 import pickle
 from sklearn import set_config
+from sklearn.pipeline import make_pipeline
 import sys
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.optimal_hyperparameters import tune_hyperparameters
-from utils.models import get_models, get_param_dist
+from utils.optimal_hyperparameters import tune_hyperparameters, SEARCH_MODES
+from utils.models import get_models, get_param_dist, get_halving_resources
+from utils.transform_cache import TransformCache
+from utils.scheduler import run_concurrently
+from utils.search_journal import SearchJournal
+from utils.fold_plan import load_fold_plan, fold_plan_splits
+from utils.nested_cv import nested_cross_validate, summarize_nested_cv
+from utils.artifact_store import save_artifact, ARTIFACT_SUFFIX
+from utils.registry import ArtifactRegistry, code_fingerprint, file_fingerprint, remove_unwritten
 
 @click.command()
 @click.option('--train-data', required=True, help='Path to train data CSV')
@@ -22,14 +30,57 @@ from utils.models import get_models, get_param_dist
 @click.option('--beta', default=2.0, help='Beta parameter for fbeta_score')
 @click.option('--seed', type=int, help="Random seed", default=123)
 @click.option('--results-to', type=str, help="Path to directory where the final model will be written to")
+@click.option('--cache-dir', type=str, default=None, help="Directory for cached search results; reruns with unchanged inputs reuse them")
+@click.option('--search', type=click.Choice(SEARCH_MODES), default='random', show_default=True,
+              help="Search strategy: full randomized search, successive halving, or model-specific paths that share work between candidates")
+@click.option('--transform-cache', type=str, default=None, help="Directory for cached preprocessor transforms shared across folds, candidates and stages")
+@click.option('--n-jobs', type=int, default=-1, show_default=True,
+              help="Total number of workers shared by the concurrent model searches (-1 uses all CPUs)")
+@click.option('--journal', is_flag=True, default=False,
+              help="Record every finished (model, candidate, fold) score in tuning_journal.jsonl (only with --search random); an existing journal is renamed, not overwritten")
+@click.option('--resume', is_flag=True, default=False,
+              help="Resume an interrupted journaled search, skipping evaluations already in the tuning journal (implies --journal; only with --search random)")
+@click.option('--fold-plan', type=str, default=None,
+              help="Path to the fold plan CSV written by preprocessing.py; defaults to 5 unshuffled stratified folds")
+@click.option('--nested-outer-splits', type=int, default=0, show_default=True,
+              help="Number of outer folds for a nested cross-validation estimate of each tuned model (0 skips it)")
+@click.option('--nested-repeats', type=int, default=1, show_default=True,
+              help="Number of times the nested cross-validation is repeated with reshuffled outer folds")
+@click.option('--approximate-kernels', is_flag=True, default=False,
+              help="Also tune the approximate kernel SVMs (Nystroem and random Fourier features + linear SVM)")
+@click.option('--registry', type=str, default=None,
+              help="Artifact registry directory; the final model and results of an identical earlier run (same data, code and settings) are restored from it instead of retrained")
+@click.option('--registry-max-mb', type=float, default=None,
+              help="Size cap of the registry in MB; least recently used entries are removed beyond it")
 
-def main(train_data, target_col, preprocessor_path, pos_label, beta, seed, results_to):
+def main(train_data, target_col, preprocessor_path, pos_label, beta, seed, results_to, cache_dir, search, transform_cache, n_jobs, journal, resume, fold_plan,
+         nested_outer_splits, nested_repeats, approximate_kernels, registry, registry_max_mb):
     '''
     Perform hyperparameter tuning on three classifiers: Decision Tree, Logistic Regression, and SVM.
     Also save the best classifier model and scores.
     '''
+    if (journal or resume) and search != "random":
+        # halving and path searches do not go through the journaled per-fold scoring
+        raise click.BadParameter(f"--journal and --resume only work with --search random, not {search}",
+                                 param_hint="--search")
     set_config(transform_output="pandas")
 
+    outputs = {name: os.path.join(results_to, name) for name in
+               ["final_model.pickle", "final_model" + ARTIFACT_SUFFIX, "hyperparameter_model_results.csv",
+                "nested_cv_results.csv", "nested_cv_summary.csv"]}
+    if registry is not None:
+        registry = ArtifactRegistry(registry, max_bytes=registry_max_mb * 1e6 if registry_max_mb else None)
+        inputs = dict(train_data=file_fingerprint(train_data), target_col=target_col,
+                      preprocessor=file_fingerprint(preprocessor_path),
+                      fold_plan=file_fingerprint(fold_plan) if fold_plan else None, pos_label=pos_label,
+                      beta=beta, seed=seed, search=search, nested_outer_splits=nested_outer_splits,
+                      nested_repeats=nested_repeats, approximate_kernels=approximate_kernels,
+                      code=code_fingerprint(__file__, os.path.join(os.path.dirname(__file__), '..', 'utils')))
+        key = registry.key("hyperparameter_tuning", **inputs)
+        if registry.restore(key, outputs):
+            print(f"Restored the final model and tuning results from the registry ({key[:12]})")
+            return
+
     # Reading the training data and loading the preprocessor
     train_df = pd.read_csv(train_data)
 
@@ -39,15 +90,31 @@ def main(train_data, target_col, preprocessor_path, pos_label, beta, seed, resul
     with open(preprocessor_path, "rb") as f:
         preprocessor = pickle.load(f)
 
-    # Running the hyperparameter tuning for all models
-    model_summary = dict()
-    for model_name, model_info in get_models(random_state=seed).items():
+    memory = TransformCache(transform_cache) if transform_cache else None
+    cv = fold_plan_splits(load_fold_plan(fold_plan, n_rows=len(train_df))) if fold_plan else 5
+    # every finished (model, candidate, fold) score is journaled so an interrupted run can --resume
+    if journal or resume:
+        journal = SearchJournal(os.path.join(results_to, "tuning_journal.jsonl"), resume=resume)
+        if journal.previous is not None:
+            print(f"Moved the existing tuning journal to {journal.previous}")
+    else:
+        journal = None
+
+    # Running the hyperparameter tuning for all models concurrently
+    tasks = dict()
+    for model_name, model_info in get_models(random_state=seed, approximate_kernels=approximate_kernels).items():
         if model_name == "Dummy Classifier":
             continue
-        model_summary[model_name] = [tune_hyperparameters(X_train, y_train, model_info, preprocessor, get_param_dist()[model_name], pos_label, beta, seed), 
-                                     tune_hyperparameters(X_train, y_train, model_info, preprocessor, get_param_dist()[model_name], pos_label, beta, seed).best_score_,
-                                     tune_hyperparameters(X_train, y_train, model_info, preprocessor, get_param_dist()[model_name], pos_label, beta, seed).best_params_
-                                    ]
+        tasks[model_name] = dict(X_train=X_train, y_train=y_train, model=model_info, preprocessor=preprocessor,
+                                 param_dist=get_param_dist()[model_name], pos_label=pos_label, beta=beta, seed=seed,
+                                 cache_dir=cache_dir, search=search,
+                                 resource=get_halving_resources().get(model_name, "n_samples"), memory=memory,
+                                 journal=journal, model_name=model_name, cv=cv)
+    searches = run_concurrently(tune_hyperparameters, tasks, n_jobs=n_jobs)
+
+    model_summary = dict()
+    for model_name, search_model in searches.items():
+        model_summary[model_name] = [search_model, search_model.best_score_, search_model.best_params_]
 
     # Finding the best model from the best scores and creating final_model
     results_dict = dict()
@@ -62,15 +129,50 @@ def main(train_data, target_col, preprocessor_path, pos_label, beta, seed, resul
         else:
             continue
     final_model = model_summary[best_model][0].best_estimator_
+    # the saved model should not depend on the local transform cache
+    final_model.set_params(memory=None)
     
     os.makedirs(results_to, exist_ok=True)
     with open(os.path.join(results_to, "final_model.pickle"), 'wb') as f:
         pickle.dump(final_model, f)
+    # memory-mappable copy of the fitted arrays for scoring workers, when the model type supports it
+    written = ["final_model.pickle", "hyperparameter_model_results.csv"]
+    try:
+        save_artifact(final_model, outputs["final_model" + ARTIFACT_SUFFIX])
+        written.append("final_model" + ARTIFACT_SUFFIX)
+    except ValueError as e:
+        print(f"Skipped the final model artifact: {e}")
 
     # Save models and results
     results_df = pd.DataFrame(results_dict).T
     results_df.columns = ['F2 Score', 'Best Model Parameters']
     results_df.to_csv(os.path.join(results_to, "hyperparameter_model_results.csv"), index=True)
 
+    # Unbiased estimate of each model's tuned F2, with all searches sharing one worker pool
+    if nested_outer_splits > 0:
+        pipelines = {name: make_pipeline(preprocessor, task["model"], memory=memory) for name, task in tasks.items()}
+        param_dists = {name: task["param_dist"] for name, task in tasks.items()}
+        nested_df = nested_cross_validate(X_train, y_train, pipelines, param_dists, pos_label, beta, seed,
+                                          outer_splits=nested_outer_splits, n_repeats=nested_repeats, n_jobs=n_jobs,
+                                          search=search,
+                                          resources={name: task["resource"] for name, task in tasks.items()})
+        nested_df.to_csv(os.path.join(results_to, "nested_cv_results.csv"), index=False)
+        nested_summary = summarize_nested_cv(nested_df)
+        nested_summary.to_csv(os.path.join(results_to, "nested_cv_summary.csv"), index=True)
+        written += ["nested_cv_results.csv", "nested_cv_summary.csv"]
+        for model_name, row in nested_summary.iterrows():
+            print(f"Nested CV F2 for {model_name} is {row['Nested F2 Mean']:.4f} (+/- {row['Nested F2 Std']:.4f})")
+
+    # e.g. an artifact of an earlier model must not be loaded next to this run's pickle
+    for path in remove_unwritten(outputs, written):
+        print(f"Removed {path} from an earlier run")
+
+    if memory is not None:
+        stats = memory.stats()
+        print(f"Transform cache: {stats['hits']} hits, {stats['misses']} misses")
+
+    if registry is not None:
+        registry.store(key, {name: outputs[name] for name in written}, kind="hyperparameter_tuning", inputs=inputs)
+
 if __name__ == '__main__':
     main()  
\ No newline at end of file
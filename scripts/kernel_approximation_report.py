@@ -0,0 +1,51 @@
+# kernel_approximation_report.py
+# date: 2026-10-18
+
+import click
+import os
+import pickle
+import sys
+import pandas as pd
+from sklearn import set_config
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.kernel_approximation import compare_kernel_approximations
+
+@click.command()
+@click.option('--model-path', default='results/final_model_results/final_model.pickle', show_default=True,
+              help='Path to the tuned exact SVM pipeline whose preprocessor, C and gamma are reused')
+@click.option('--train-data', default='data/processed/train_heart.csv', show_default=True, help='Path to train data CSV')
+@click.option('--test-data', default='data/processed/test_heart.csv', show_default=True, help='Path to test data CSV')
+@click.option('--target-col', default='target', show_default=True, help='Name of the target column')
+@click.option('--pos-label', default='Heart Disease', help='Positive class label for fbeta_score')
+@click.option('--beta', default=2.0, help='Beta parameter for fbeta_score')
+@click.option('--n-components', default='25,50,100,200,400', show_default=True,
+              help='Comma-separated numbers of kernel approximation components to try')
+@click.option('--seed', type=int, default=123, show_default=True, help='Random seed of the feature maps')
+@click.option('--results-to', default='results/final_model_results/kernel_approximation_report.csv', show_default=True,
+              help='CSV the comparison is written to')
+
+def main(model_path, train_data, test_data, target_col, pos_label, beta, n_components, seed, results_to):
+    '''
+    Compare the F2 score and predict latency of the exact RBF SVM with Nystroem and
+    random Fourier feature approximations of its kernel.
+    '''
+    set_config(transform_output="pandas")
+
+    with open(model_path, "rb") as f:
+        model = pickle.load(f)
+    train_df = pd.read_csv(train_data)
+    test_df = pd.read_csv(test_data)
+
+    report = compare_kernel_approximations(model, train_df.drop(columns=[target_col]), train_df[target_col],
+                                           test_df.drop(columns=[target_col]), test_df[target_col], pos_label,
+                                           beta=beta, n_components=[int(n) for n in n_components.split(',')],
+                                           random_state=seed)
+    output_dir = os.path.dirname(results_to)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    report.to_csv(results_to, index=False)
+    print(report.to_string(index=False, float_format=lambda x: f"{x:.4f}"))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# predict.py
+# date: 2026-10-18
+
+import click
+import os
+import sys
+from sklearn import set_config
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.artifact_store import load_model
+from utils.prediction_cache import CachedModel
+from utils.sharded_predict import predict_csv_sharded
+from utils.batch_predict import predict_csv
+
+@click.command()
+@click.option('--model-path', required=True, help='Path to the fitted model pickle or memory-mappable .artifact, e.g. results/final_model_results/final_model.pickle')
+@click.option('--input', 'input_path', required=True, help='CSV of patients to score; a target column, if present, is ignored by the model')
+@click.option('--output', required=True, help='CSV the predictions are written to')
+@click.option('--chunksize', type=int, default=10000, show_default=True, help='Rows read and scored at a time')
+@click.option('--id-col', default=None, help='Column copied to the output to identify rows')
+@click.option('--scores', is_flag=True, default=False, help='Also write the decision score for --pos-label')
+@click.option('--pos-label', default='Heart Disease', help='Positive class label for scores and thresholds')
+@click.option('--threshold', type=float, default=None, help='Decision threshold on the score, e.g. from optimal_threshold.json; defaults to the model\'s own rule')
+@click.option('--quiet', is_flag=True, default=False, help='Only report the final throughput')
+@click.option('--cache-size', type=int, default=0, show_default=True,
+              help='Entries of an LRU cache of predictions keyed on the feature values, for inputs with many repeated rows; 0 disables it')
+@click.option('--workers', type=int, default=1, show_default=True,
+              help='Worker processes scoring byte ranges of the input in parallel; 0 or -1 uses all CPUs')
+@click.option('--shards', type=int, default=None, help='Byte ranges the input is split into with --workers; defaults to one per worker')
+
+def main(model_path, input_path, output, chunksize, id_col, scores, pos_label, threshold, quiet, cache_size, workers, shards):
+    '''
+    Score a CSV of any size with the final model, chunk by chunk, and write the predictions.
+    '''
+    set_config(transform_output="pandas")
+    if workers < -1:
+        raise click.BadParameter("must be a positive number of workers, or 0 or -1 for all CPUs", param_hint="--workers")
+    if shards is not None and shards < 1:
+        raise click.BadParameter("must be at least 1", param_hint="--shards")
+
+    if workers != 1:
+        # each worker loads the model itself; an .artifact model is shared between them through the page cache
+        stats = predict_csv_sharded(model_path, input_path, output, n_workers=workers, n_shards=shards,
+                                    chunksize=chunksize, cache_size=cache_size, scores=scores, pos_label=pos_label,
+                                    threshold=threshold, id_col=id_col)
+        print(f"Wrote {stats['rows']} predictions to {output} from {stats['shards']} shards in "
+              f"{stats['seconds']:.2f} s ({stats['rows_per_s']:.0f} rows/s)")
+        return
+
+    model = load_model(model_path)
+    if cache_size > 0:
+        model = CachedModel(model, maxsize=cache_size, model_path=model_path)
+
+    def report(rows, seconds):
+        if not quiet:
+            print(f"Scored {rows} rows ({rows / max(seconds, 1e-9):.0f} rows/s)")
+
+    stats = predict_csv(model, input_path, output, chunksize=chunksize, on_chunk=report, scores=scores,
+                        pos_label=pos_label, threshold=threshold, id_col=id_col)
+    print(f"Wrote {stats['rows']} predictions to {output} in {stats['seconds']:.2f} s "
+          f"({stats['rows_per_s']:.0f} rows/s)")
+    if cache_size > 0:
+        cache = model.stats()
+        print(f"Prediction cache: {cache['hits']} hits, {cache['misses']} misses ({cache['hit_rate']:.1%} hit rate)")
+
+if __name__ == '__main__':
+    main()
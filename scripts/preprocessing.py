@@ -11,6 +11,11 @@ from sklearn.model_selection import train_test_split
 from sklearn import set_config
 from sklearn.preprocessing import StandardScaler, OneHotEncoder, OrdinalEncoder
 from sklearn.compose import make_column_transformer
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.fold_plan import make_fold_plan, save_fold_plan
+from utils.registry import ArtifactRegistry, code_fingerprint, file_fingerprint
 
 @click.command()
 @click.option('--raw-data', type=str, help="Path to raw data")
@@ -21,13 +26,35 @@ from sklearn.compose import make_column_transformer
               show_default=True,
               help="Proportion of the dataset to allocate to the test split.", 
               default=0.2)
-
-def main(raw_data, data_to, preprocessor_to, seed, split):
+@click.option('--n-folds', type=int,
+              show_default=True,
+              help="Number of stratified cross-validation folds in the saved fold plan.",
+              default=5)
+@click.option('--registry', type=str, default=None,
+              help="Artifact registry directory; outputs of an identical earlier run (same data, code and settings) are restored from it instead of recomputed")
+@click.option('--registry-max-mb', type=float, default=None,
+              help="Size cap of the registry in MB; least recently used entries are removed beyond it")
+
+def main(raw_data, data_to, preprocessor_to, seed, split, n_folds, registry, registry_max_mb):
     '''This script splits the raw data into train and test sets, 
     and then preprocesses the data to be used in exploratory data analysis.
-    It also saves the preprocessor to be used in the model training script.'''
+    It also saves the preprocessor to be used in the model training script,
+    and a fold plan so every cross-validation stage uses the same folds.'''
     set_config(transform_output="pandas")
 
+    outputs = {name: os.path.join(data_to, name) for name in
+               ["train_heart.csv", "test_heart.csv", "train_heart_folds.csv",
+                "heart_train_preprocessed.csv", "heart_test_preprocessed.csv"]}
+    outputs["heart_preprocessor.pickle"] = os.path.join(preprocessor_to, "heart_preprocessor.pickle")
+    if registry is not None:
+        registry = ArtifactRegistry(registry, max_bytes=registry_max_mb * 1e6 if registry_max_mb else None)
+        inputs = dict(raw_data=file_fingerprint(raw_data), seed=seed, split=split, n_folds=n_folds,
+                      code=code_fingerprint(__file__, os.path.join(os.path.dirname(__file__), '..', 'utils')))
+        key = registry.key("preprocessing", **inputs)
+        if registry.restore(key, outputs):
+            print(f"Restored the preprocessing outputs from the registry ({key[:12]})")
+            return
+
     heart = pd.read_csv(raw_data)
 
     # Change values of 1 and 0 to 'Heart Disease' and 'No Heart Disease' in target
@@ -49,6 +76,10 @@ def main(raw_data, data_to, preprocessor_to, seed, split):
     train_heart.to_csv(os.path.join(data_to, "train_heart.csv"), index=False)
     test_heart.to_csv(os.path.join(data_to, "test_heart.csv"), index=False)
 
+    # Save the fold plan shared by the cross-validation stages
+    save_fold_plan(make_fold_plan(train_heart['target'], n_splits=n_folds, seed=seed),
+                   os.path.join(data_to, "train_heart_folds.csv"))
+
     train_targets = train_heart['target']
     train_heart = train_heart.drop(columns = ['target'])
 
@@ -103,5 +134,8 @@ def main(raw_data, data_to, preprocessor_to, seed, split):
         os.path.join(data_to, "heart_test_preprocessed.csv"), index=False
     )
 
+    if registry is not None:
+        registry.store(key, outputs, kind="preprocessing", inputs=inputs)
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,51 @@
+# serve_model.py
+# date: 2026-10-18
+
+import click
+import os
+import sys
+from sklearn import set_config
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.artifact_store import load_model
+from utils.prediction_cache import CachedModel
+from utils.scoring_service import ScoringService, make_server
+
+@click.command()
+@click.option('--model-path', default='results/final_model_results/final_model.pickle', show_default=True,
+              help='Path to the fitted model (preprocessor + classifier pipeline) pickle or memory-mappable .artifact')
+@click.option('--host', default='127.0.0.1', show_default=True, help='Interface to listen on')
+@click.option('--port', type=int, default=8000, show_default=True, help='Port to listen on')
+@click.option('--max-batch-rows', type=int, default=256, show_default=True, help='Maximum number of rows scored together')
+@click.option('--max-wait-ms', type=float, default=2.0, show_default=True,
+              help='Longest time a request waits for concurrent requests to batch with')
+@click.option('--scores', is_flag=True, default=False, help='Also return the decision score for --pos-label')
+@click.option('--pos-label', default='Heart Disease', help='Positive class label for scores and thresholds')
+@click.option('--threshold', type=float, default=None, help='Decision threshold on the score; defaults to the model\'s own rule')
+@click.option('--cache-size', type=int, default=0, show_default=True,
+              help='Entries of an LRU cache of predictions keyed on the feature values; it is cleared when the model file changes. 0 disables it')
+
+def main(model_path, host, port, max_batch_rows, max_wait_ms, scores, pos_label, threshold, cache_size):
+    '''
+    Serve the final model over HTTP: POST /predict, GET /metrics (including cache statistics) and GET /health.
+    '''
+    set_config(transform_output="pandas")
+
+    model = load_model(model_path)
+    if cache_size > 0:
+        model = CachedModel(model, maxsize=cache_size, model_path=model_path)
+
+    service = ScoringService(model, scores=scores, pos_label=pos_label, threshold=threshold,
+                             max_batch_rows=max_batch_rows, max_wait_ms=max_wait_ms)
+    server = make_server(service, host=host, port=port)
+    print(f"Serving {model_path} on http://{host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# threshold_sweep.py
+# date: 2026-10-18
+
+import click
+import json
+import os
+import pickle
+import sys
+import pandas as pd
+from sklearn.metrics import fbeta_score, precision_score, recall_score
+from sklearn import set_config
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.fold_plan import load_fold_plan, fold_plan_splits
+from utils.threshold_sweep import out_of_fold_scores, positive_scores, threshold_curve, best_threshold, score_method
+
+@click.command()
+@click.option('--train-data', required=True, help='Path to train data CSV; thresholds are tuned on its out-of-fold scores')
+@click.option('--target-col', required=True, help='Name of the target column')
+@click.option('--final-model-path', required=True, help='Path to the final model')
+@click.option('--pos-label', default='Heart Disease', help='Positive class label for fbeta_score')
+@click.option('--beta', default=2.0, help='Beta parameter for fbeta_score')
+@click.option('--fold-plan', default=None, help='Path to the fold plan CSV written by preprocessing.py; defaults to 5 unshuffled stratified folds')
+@click.option('--test-data', default=None, help='Path to test data CSV to report the tuned threshold on (optional)')
+@click.option('--n-jobs', default=None, type=int, help='Number of workers fitting the cross-validation folds')
+
+def main(train_data, target_col, final_model_path, pos_label, beta, fold_plan, test_data, n_jobs):
+    '''
+    Sweep every decision threshold of the final model and save the curve and the
+    F-beta optimal threshold next to the final model.
+    '''
+    set_config(transform_output="pandas")
+
+    train_df = pd.read_csv(train_data)
+    X_train = train_df.drop(columns=[target_col])
+    y_train = train_df[target_col]
+
+    with open(final_model_path, "rb") as f:
+        final_model = pickle.load(f)
+
+    cv = fold_plan_splits(load_fold_plan(fold_plan, n_rows=len(train_df))) if fold_plan else 5
+    scores = out_of_fold_scores(final_model, X_train, y_train, pos_label, cv=cv, n_jobs=n_jobs)
+    curve = threshold_curve(y_train, scores, pos_label, beta=beta)
+    best = best_threshold(curve)
+
+    results_to = os.path.dirname(final_model_path)
+    curve.to_csv(os.path.join(results_to, "threshold_curve.csv"), index=False)
+
+    summary = {
+        "threshold": float(best["Threshold"]),
+        "score_method": score_method(final_model),
+        "pos_label": pos_label,
+        "beta": beta,
+        "cv_precision": float(best["Precision"]),
+        "cv_recall": float(best["Recall"]),
+        "cv_fbeta": float(best.iloc[-1]),
+    }
+    if test_data is not None:
+        test_df = pd.read_csv(test_data)
+        y_test = test_df[target_col]
+        predicted_pos = positive_scores(final_model, test_df.drop(columns=[target_col]), pos_label) >= summary["threshold"]
+        y_pred = predicted_pos.astype(int)
+        y_true = (y_test == pos_label).astype(int)
+        summary.update(test_precision=precision_score(y_true, y_pred, zero_division=0),
+                       test_recall=recall_score(y_true, y_pred, zero_division=0),
+                       test_fbeta=fbeta_score(y_true, y_pred, beta=beta, zero_division=0))
+
+    with open(os.path.join(results_to, "optimal_threshold.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+    print(f"Optimal threshold {summary['threshold']:.4f} with cross-validated F{beta:g} {summary['cv_fbeta']:.4f}")
+
+if __name__ == '__main__':
+    main()
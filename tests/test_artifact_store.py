@@ -0,0 +1,87 @@
+import sys
+import os
+import mmap
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.artifact_store import (ALIGNMENT, load_artifact, load_model, read_arrays, save_artifact,
+                                  write_arrays)
+from utils.numpy_scorer import NumpyScorer
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+@pytest.fixture(scope="module")
+def final_model():
+    with open(os.path.join(ROOT, "results/final_model_results/final_model.pickle"), "rb") as f:
+        return pickle.load(f)
+
+
+@pytest.fixture(scope="module")
+def test_X():
+    return pd.read_csv(os.path.join(ROOT, "data/processed/test_heart.csv")).drop(columns="target")
+
+
+def _is_mapped(array):
+    while array is not None:
+        if isinstance(array, (np.memmap, mmap.mmap)):
+            return True
+        array = getattr(array, "base", None)
+    return False
+
+
+def test_arrays_round_trip_as_aligned_read_only_maps(tmp_path):
+    """
+    Arrays come back equal, memory-mapped, read-only and aligned to ALIGNMENT bytes.
+    """
+    arrays = {"a": np.arange(5, dtype=np.int64), "b": np.ones((3, 7)), "c": np.array([True, False, True]),
+              "empty": np.empty(0), "f32": np.linspace(0, 1, 9, dtype=np.float32).reshape(3, 3)}
+    write_arrays(tmp_path / "x.artifact", arrays, {"note": "hello"})
+    loaded, meta = read_arrays(tmp_path / "x.artifact")
+
+    assert meta == {"note": "hello"}
+    for name, array in arrays.items():
+        np.testing.assert_array_equal(loaded[name], array)
+        assert loaded[name].dtype == array.dtype
+        assert _is_mapped(loaded[name])
+        assert not loaded[name].flags.writeable
+        if array.size:
+            assert loaded[name].ctypes.data % ALIGNMENT == 0
+
+
+def test_final_model_artifact_matches_pipeline(final_model, test_X, tmp_path):
+    """
+    The final model artifact predicts and scores exactly like the pickled pipeline, with or without mmap.
+    """
+    path = str(tmp_path / "final_model.artifact")
+    save_artifact(final_model, path)
+    for mmap in (True, False):
+        scorer = load_artifact(path, mmap=mmap)
+        np.testing.assert_array_equal(scorer.predict(test_X), final_model.predict(test_X))
+        np.testing.assert_allclose(scorer.decision_function(test_X), final_model.decision_function(test_X),
+                                   atol=1e-9)
+
+
+def test_load_model_dispatches_on_suffix(final_model, tmp_path):
+    """
+    load_model reads artifacts by suffix and falls back to pickle.
+    """
+    save_artifact(final_model, tmp_path / "m.artifact")
+    with open(tmp_path / "m.pickle", "wb") as f:
+        pickle.dump(final_model, f)
+    assert isinstance(load_model(str(tmp_path / "m.artifact")), NumpyScorer)
+    assert type(load_model(str(tmp_path / "m.pickle"))) is type(final_model)
+
+
+def test_rejects_other_files_and_object_arrays(tmp_path):
+    """
+    Files without the artifact header and non-numeric arrays are rejected.
+    """
+    (tmp_path / "bad.artifact").write_bytes(b"not an artifact at all")
+    with pytest.raises(ValueError, match="not a model artifact"):
+        read_arrays(tmp_path / "bad.artifact")
+    with pytest.raises(ValueError, match="only numeric"):
+        write_arrays(tmp_path / "obj.artifact", {"names": np.array(["a", "b"], dtype=object)}, {})
@@ -0,0 +1,70 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import make_column_transformer
+from sklearn.datasets import make_classification
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.batch_predict import predict_frame, predict_csv
+
+
+@pytest.fixture
+def model_and_data():
+    """
+    A fitted pipeline that ignores the id and target columns, and a scoring DataFrame.
+    """
+    X, y = make_classification(n_samples=90, n_features=3, n_informative=2, n_redundant=0, random_state=3)
+    df = pd.DataFrame(X, columns=["a", "b", "c"])
+    df.insert(0, "patient_id", np.arange(100, 190))
+    labels = np.where(y == 1, "Heart Disease", "No Heart Disease")
+    preprocessor = make_column_transformer((StandardScaler(), ["a", "b", "c"]))
+    model = make_pipeline(preprocessor, SVC()).fit(df, labels)
+    return model, df.assign(target=labels)
+
+
+def test_chunked_output_matches_predict(model_and_data, tmp_path):
+    """
+    Streaming in chunks writes the same predictions as one predict call, in input order.
+    """
+    model, df = model_and_data
+    input_path, output_path = tmp_path / "in.csv", tmp_path / "out" / "pred.csv"
+    df.to_csv(input_path, index=False)
+    progress = []
+    stats = predict_csv(model, str(input_path), str(output_path), chunksize=25,
+                        on_chunk=lambda rows, seconds: progress.append(rows), id_col="patient_id")
+
+    out = pd.read_csv(output_path)
+    assert list(out.columns) == ["patient_id", "prediction"]
+    assert out["patient_id"].tolist() == df["patient_id"].tolist()
+    np.testing.assert_array_equal(out["prediction"], model.predict(df))
+    assert progress == [25, 50, 75, 90]
+    assert stats["rows"] == 90 and stats["rows_per_s"] > 0
+
+
+def test_scores_and_threshold(model_and_data):
+    """
+    Scores point to pos_label and a threshold of 0 reproduces the SVM's own rule.
+    """
+    model, df = model_and_data
+    out = predict_frame(model, df, scores=True, pos_label="Heart Disease", threshold=0.0)
+    np.testing.assert_array_equal(out["prediction"], model.predict(df))
+    assert (out.loc[out["prediction"] == "Heart Disease", "score"] >= 0).all()
+
+    everyone = predict_frame(model, df, pos_label="Heart Disease", threshold=-np.inf)
+    assert (everyone["prediction"] == "Heart Disease").all()
+
+
+def test_invalid_arguments(model_and_data, tmp_path):
+    """
+    Scores need a pos_label and chunks need at least one row.
+    """
+    model, df = model_and_data
+    with pytest.raises(ValueError):
+        predict_frame(model, df, scores=True)
+    with pytest.raises(ValueError):
+        predict_csv(model, "unused.csv", str(tmp_path / "out.csv"), chunksize=0)
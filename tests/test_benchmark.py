@@ -0,0 +1,94 @@
+import os
+import sys
+import time
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.benchmark import make_synthetic_heart, run_measured
+
+
+@pytest.fixture
+def raw_df():
+    """Small raw-like heart dataset with an id column first."""
+    return pd.DataFrame({
+        "patientid": [101, 102, 103],
+        "age": [50, 60, 70],
+        "target": [0, 1, 1],
+    })
+
+
+def _ok(x):
+    return x * 2
+
+
+def _fail():
+    raise RuntimeError("boom")
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+
+
+def _allocate(n_bytes):
+    bytearray(n_bytes)
+
+
+def _allocate_in_worker(n_bytes):
+    from joblib import Parallel, delayed
+    Parallel(n_jobs=2)(delayed(_allocate)(n_bytes) for _ in range(2))
+
+
+def test_make_synthetic_heart_rows_and_ids(raw_df):
+    """The synthetic data has the requested rows, the same columns and unique ids."""
+    synthetic = make_synthetic_heart(raw_df, 50, seed=1)
+    assert len(synthetic) == 50
+    assert list(synthetic.columns) == list(raw_df.columns)
+    assert synthetic["patientid"].is_unique
+    assert set(synthetic["age"]) <= set(raw_df["age"])
+
+
+def test_make_synthetic_heart_is_reproducible(raw_df):
+    """The same seed gives the same dataset."""
+    pd.testing.assert_frame_equal(make_synthetic_heart(raw_df, 20, seed=5),
+                                  make_synthetic_heart(raw_df, 20, seed=5))
+
+
+def test_make_synthetic_heart_rejects_empty(raw_df):
+    """At least one row must be requested."""
+    with pytest.raises(ValueError):
+        make_synthetic_heart(raw_df, 0)
+
+
+def test_run_measured_ok():
+    """A successful run reports its wall time and peak memory."""
+    result = run_measured(_ok, 3)
+    assert result["status"] == "ok"
+    assert result["error"] is None
+    assert result["wall_time_s"] >= 0
+    assert result["peak_rss_mb"] > 0
+    assert result["peak_rss_children_mb"] == 0
+
+
+def test_run_measured_counts_worker_processes():
+    """Memory allocated in joblib workers shows in the children's peak, not in the process's own."""
+    result = run_measured(_allocate_in_worker, 200 * 2**20)
+    assert result["status"] == "ok"
+    assert result["peak_rss_children_mb"] > 200
+    assert result["peak_rss_mb"] < result["peak_rss_children_mb"]
+
+
+def test_run_measured_error():
+    """An exception in the child is reported rather than raised."""
+    result = run_measured(_fail)
+    assert result["status"] == "error"
+    assert "boom" in result["error"]
+
+
+def test_run_measured_timeout():
+    """A run exceeding the timeout is stopped."""
+    result = run_measured(_sleep, 30, timeout=2)
+    assert result["status"] == "timeout"
+    assert result["peak_rss_mb"] is None
+    assert result["peak_rss_children_mb"] is None
@@ -0,0 +1,83 @@
+import sys
+import os
+import numpy as np
+import pytest
+from sklearn.metrics import fbeta_score, recall_score, precision_score
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import utils.bootstrap
+from utils.bootstrap import bootstrap_confusion_counts, scores_from_counts, bootstrap_confidence_intervals
+
+
+@pytest.fixture
+def predictions():
+    """
+    Labels and imperfect predictions of a binary heart disease classifier.
+    """
+    rng = np.random.default_rng(0)
+    y_true = rng.choice(["Heart Disease", "No Heart Disease"], size=200)
+    flip = rng.random(200) < 0.2
+    y_pred = np.where(flip, np.where(y_true == "Heart Disease", "No Heart Disease", "Heart Disease"), y_true)
+    return y_true, y_pred
+
+
+def test_counts_match_explicit_resamples(predictions):
+    """
+    Each row of counts gives the same scores as sklearn on the resampled rows.
+    """
+    y_true, y_pred = predictions
+    counts = bootstrap_confusion_counts(y_true, y_pred, "Heart Disease", n_resamples=20, seed=7)
+    indices = np.random.default_rng(7).integers(0, len(y_true), size=(20, len(y_true)))
+    scores = scores_from_counts(counts, beta=2)
+
+    assert counts.sum(axis=1).tolist() == [len(y_true)] * 20
+    for row, idx in enumerate(indices):
+        t, p = y_true[idx], y_pred[idx]
+        assert scores["fbeta"][row] == pytest.approx(fbeta_score(t, p, beta=2, pos_label="Heart Disease"))
+        assert scores["recall"][row] == pytest.approx(recall_score(t, p, pos_label="Heart Disease"))
+        assert scores["precision"][row] == pytest.approx(precision_score(t, p, pos_label="Heart Disease"))
+
+
+def test_chunking_does_not_change_counts(predictions, monkeypatch):
+    """
+    Drawing the index matrix in small chunks gives the same resamples.
+    """
+    y_true, y_pred = predictions
+    full = bootstrap_confusion_counts(y_true, y_pred, "Heart Disease", n_resamples=50, seed=1)
+    monkeypatch.setattr(utils.bootstrap, "CHUNK_ELEMENTS", len(y_true) * 7)
+    chunked = bootstrap_confusion_counts(y_true, y_pred, "Heart Disease", n_resamples=50, seed=1)
+    np.testing.assert_array_equal(full, chunked)
+
+
+def test_zero_division_scores_zero():
+    """
+    No predicted positives gives a precision of 0, as fbeta_score does.
+    """
+    scores = scores_from_counts(np.array([[5, 0, 3, 0]]))
+    assert scores["precision"][0] == 0
+    assert scores["fbeta"][0] == 0
+
+
+def test_confidence_intervals_contain_estimate(predictions):
+    """
+    The intervals surround the point estimate, which matches sklearn.
+    """
+    y_true, y_pred = predictions
+    ci = bootstrap_confidence_intervals(y_true, y_pred, "Heart Disease", beta=2, n_resamples=2000)
+
+    assert ci["Metric"].tolist() == ["F2 Score", "Recall", "Precision"]
+    assert ci.loc[0, "Estimate"] == pytest.approx(fbeta_score(y_true, y_pred, beta=2, pos_label="Heart Disease"))
+    assert (ci["Lower"] <= ci["Estimate"]).all() and (ci["Estimate"] <= ci["Upper"]).all()
+
+
+def test_invalid_inputs(predictions):
+    """
+    Mismatched lengths, no resamples and a bad confidence level are rejected.
+    """
+    y_true, y_pred = predictions
+    with pytest.raises(ValueError):
+        bootstrap_confusion_counts(y_true, y_pred[:-1], "Heart Disease")
+    with pytest.raises(ValueError):
+        bootstrap_confusion_counts(y_true, y_pred, "Heart Disease", n_resamples=0)
+    with pytest.raises(ValueError):
+        bootstrap_confidence_intervals(y_true, y_pred, "Heart Disease", confidence=1.5)
@@ -0,0 +1,84 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from unittest import mock
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import confusion_matrix, fbeta_score, precision_score, recall_score, accuracy_score
+from sklearn.tree import DecisionTreeClassifier
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.evaluation import evaluate_models, confusion_counts, metrics_from_confusion
+
+
+@pytest.fixture
+def fitted():
+    """
+    Two fitted models and a labelled test DataFrame with heart disease style labels.
+    """
+    X, y = make_classification(n_samples=150, n_features=4, random_state=1)
+    X = pd.DataFrame(X, columns=[f'feature_{i}' for i in range(4)])
+    y = pd.Series(np.where(y == 1, "Heart Disease", "No Heart Disease"))
+    models = {
+        "LR": LogisticRegression().fit(X[:100], y[:100]),
+        "Tree": DecisionTreeClassifier(max_depth=2, random_state=0).fit(X[:100], y[:100]),
+    }
+    test_df = X[100:].assign(target=y[100:].to_numpy())
+    return models, test_df
+
+
+@pytest.mark.parametrize("chunksize", [None, 7])
+def test_metrics_match_sklearn(fitted, chunksize):
+    """
+    Every model's confusion matrix and metrics equal sklearn on its predictions, with or without chunking.
+    """
+    models, test_df = fitted
+    results = evaluate_models(models, test_df, "target", "Heart Disease", beta=2, chunksize=chunksize)
+    X, y = test_df.drop(columns=["target"]), test_df["target"]
+    for name, model in models.items():
+        y_pred = model.predict(X)
+        np.testing.assert_array_equal(results[name]["confusion"], confusion_matrix(y, y_pred, labels=model.classes_))
+        metrics = results[name]["metrics"]
+        assert metrics["fbeta"] == pytest.approx(fbeta_score(y, y_pred, beta=2, pos_label="Heart Disease"))
+        assert metrics["recall"] == pytest.approx(recall_score(y, y_pred, pos_label="Heart Disease"))
+        assert metrics["precision"] == pytest.approx(precision_score(y, y_pred, pos_label="Heart Disease"))
+        assert metrics["accuracy"] == pytest.approx(accuracy_score(y, y_pred))
+
+
+def test_predicts_each_chunk_once(fitted, tmp_path):
+    """
+    Reading from a CSV in chunks, each model predicts every row exactly once.
+    """
+    models, test_df = fitted
+    path = tmp_path / "test.csv"
+    test_df.to_csv(path, index=False)
+    with mock.patch.object(LogisticRegression, "predict", autospec=True,
+                           side_effect=lambda self, X: np.full(len(X), "Heart Disease")) as predict:
+        results = evaluate_models({"LR": models["LR"]}, str(path), "target", "Heart Disease", chunksize=20)
+    assert sum(len(call.args[1]) for call in predict.call_args_list) == len(test_df)
+    assert results["LR"]["confusion"].sum() == len(test_df)
+
+
+def test_return_predictions(fitted):
+    """
+    Predictions are returned on request, aligned with the true labels.
+    """
+    models, test_df = fitted
+    results = evaluate_models(models, test_df, "target", "Heart Disease", chunksize=30, return_predictions=True)
+    np.testing.assert_array_equal(results["LR"]["y_true"], test_df["target"].to_numpy())
+    assert len(results["Tree"]["y_pred"]) == len(test_df)
+
+
+def test_unknown_labels_and_pos_label():
+    """
+    Labels outside the model classes and an unknown pos_label are rejected.
+    """
+    labels = np.array(["a", "b"])
+    with pytest.raises(ValueError):
+        confusion_counts(["a", "c"], ["a", "b"], labels)
+    with pytest.raises(ValueError):
+        metrics_from_confusion(np.eye(2, dtype=int), labels, "c")
+    with pytest.raises(ValueError):
+        evaluate_models({}, pd.DataFrame({"target": []}), "target", "a")
@@ -0,0 +1,93 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+from sklearn.pipeline import make_pipeline
+from sklearn.model_selection import cross_validate
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.fold_plan import make_fold_plan, save_fold_plan, load_fold_plan, fold_plan_splits, hash_splits
+from utils.optimal_hyperparameters import tune_hyperparameters
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a small synthetic binary classification dataset.
+    """
+    X, y = make_classification(n_samples=100, n_features=5, n_classes=2, weights=[0.7], random_state=42)
+    return pd.DataFrame(X, columns=[f'feature_{i}' for i in range(5)]), pd.Series(y)
+
+
+def test_make_fold_plan_is_stratified(sample_data):
+    """
+    Every row gets one fold and each fold keeps the class balance.
+    """
+    _, y = sample_data
+    folds = make_fold_plan(y, n_splits=5, seed=0)
+    assert sorted(np.unique(folds)) == [0, 1, 2, 3, 4]
+    positives = [y[folds == fold].mean() for fold in range(5)]
+    assert max(positives) - min(positives) <= 0.1
+
+
+def test_make_fold_plan_is_reproducible(sample_data):
+    """
+    The same seed gives the same plan; a different seed gives a different one.
+    """
+    _, y = sample_data
+    np.testing.assert_array_equal(make_fold_plan(y, seed=1), make_fold_plan(y, seed=1))
+    assert not np.array_equal(make_fold_plan(y, seed=1), make_fold_plan(y, seed=2))
+
+
+def test_fold_plan_roundtrip(sample_data, tmp_path):
+    """
+    A saved plan loads back unchanged; a plan of the wrong length is rejected.
+    """
+    _, y = sample_data
+    folds = make_fold_plan(y)
+    path = str(tmp_path / "folds.csv")
+    save_fold_plan(folds, path)
+    np.testing.assert_array_equal(load_fold_plan(path, n_rows=len(y)), folds)
+    with pytest.raises(ValueError):
+        load_fold_plan(path, n_rows=len(y) + 1)
+
+
+def test_fold_plan_splits_partition_rows(sample_data):
+    """
+    The splits cover every row once as test data, and train and test never overlap.
+    """
+    _, y = sample_data
+    splits = fold_plan_splits(make_fold_plan(y))
+    assert len(splits) == 5
+    np.testing.assert_array_equal(np.sort(np.concatenate([test for _, test in splits])), np.arange(len(y)))
+    for train, test in splits:
+        assert len(np.intersect1d(train, test)) == 0
+        assert len(train) + len(test) == len(y)
+
+
+def test_stages_share_folds(sample_data):
+    """
+    cross_validate and tune_hyperparameters score the same folds when given the same plan.
+    """
+    X, y = sample_data
+    splits = fold_plan_splits(make_fold_plan(y, seed=3))
+    pipe = make_pipeline(StandardScaler(), LogisticRegression(C=1.0))
+    cv_scores = cross_validate(pipe, X, y, cv=splits, scoring="f1")["test_score"]
+    search = tune_hyperparameters(X, y, LogisticRegression(), StandardScaler(), {'logisticregression__C': [1.0]},
+                                  pos_label=1, beta=1, seed=0, cv=splits)
+    np.testing.assert_allclose([search.cv_results_[f"split{k}_test_score"][0] for k in range(5)], cv_scores)
+
+
+def test_hash_splits(sample_data):
+    """
+    Fold counts pass through; explicit splits hash to a value that depends on the plan.
+    """
+    _, y = sample_data
+    assert hash_splits(5) == 5
+    first = hash_splits(fold_plan_splits(make_fold_plan(y, seed=1)))
+    assert first == hash_splits(fold_plan_splits(make_fold_plan(y, seed=1)))
+    assert first != hash_splits(fold_plan_splits(make_fold_plan(y, seed=2)))
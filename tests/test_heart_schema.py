@@ -0,0 +1,92 @@
+import sys
+import os
+import warnings
+import numpy as np
+import pandas as pd
+import pandera.pandas as pa
+import pytest
+from pandera.errors import SchemaErrors, SchemaWarning
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.heart_schema import has_duplicate_rows, schema
+from utils.schema_timing import FRAME, time_schema_checks
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+@pytest.fixture
+def raw():
+    """
+    The raw dataset with the schema's column names.
+    """
+    path = os.path.join(ROOT, "data/raw/Cardiovascular_Disease_Dataset/Cardiovascular_Disease_Dataset.csv")
+    return pd.read_csv(path, names=list(schema.columns), header=0)
+
+
+def _element_wise_schema():
+    """
+    The schema as it was with per-cell Python checks, as a reference.
+    """
+    columns = dict(schema.columns)
+    columns["serum_cholesterol"] = pa.Column(int, checks=[pa.Check(
+        lambda s: s >= 126 and s <= 564, element_wise=True, raise_warning=True,
+        error="There are outliers in the data values")], nullable=True)
+    columns["slope"] = pa.Column(int, checks=[pa.Check(
+        lambda s: s >= 1 and s <= 3, element_wise=True, raise_warning=True,
+        error="Certain slope values are out of range")], nullable=True)
+    return pa.DataFrameSchema(columns, checks=[
+        pa.Check(lambda df: ~df.duplicated().any(), error="Duplicate rows found."),
+        pa.Check(lambda df: ~(df.isna().all(axis=1)).any(), error="Empty rows found.")
+    ])
+
+
+def _outcome(schema_, df):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", SchemaWarning)
+        try:
+            schema_.validate(df, lazy=True)
+            failures = None
+        except SchemaErrors as e:
+            failures = e.failure_cases.drop(columns="index").astype(str).to_dict(orient="records")
+    return [str(w.message) for w in caught], failures
+
+
+@pytest.mark.parametrize("corrupt", ["none", "duplicates", "out_of_range"])
+def test_same_warnings_and_errors_as_element_wise(raw, corrupt):
+    """
+    The vectorized checks give the same warnings and error report as the element-wise ones.
+    """
+    df = raw.copy()
+    if corrupt == "duplicates":
+        df = pd.concat([df, df.iloc[[3, 7]]], ignore_index=True)
+    elif corrupt == "out_of_range":
+        df.loc[[0, 5], "age"] = 120
+        df.loc[[1], "slope"] = 9
+    assert _outcome(schema, df) == _outcome(_element_wise_schema(), df)
+
+
+def test_has_duplicate_rows():
+    """
+    Only rows equal in every column count as duplicates.
+    """
+    df = pd.DataFrame({"id": [1, 1, 2, 3], "x": [0, 1, 0, 0]})
+    assert not has_duplicate_rows(df)
+    assert has_duplicate_rows(pd.concat([df, df.iloc[[2]]]))
+    assert has_duplicate_rows(pd.DataFrame({"id": [np.nan, np.nan], "x": [1, 1]}))
+    assert not has_duplicate_rows(df.head(0))
+
+
+def test_timing_report(raw):
+    """
+    The report times every dtype, column check and dataframe check, slowest first.
+    """
+    report = time_schema_checks(schema, raw)
+
+    n_rules = sum(1 + len(c.checks) for c in schema.columns.values()) + len(schema.checks)
+    assert len(report) == n_rules
+    assert list(report.columns) == ["Column", "Check", "Status", "Seconds", "Share"]
+    assert report["Seconds"].is_monotonic_decreasing
+    assert report["Share"].sum() == pytest.approx(1.0)
+    statuses = report.set_index(["Column", "Check"])["Status"]
+    assert statuses[("serum_cholesterol", "<lambda>: There are outliers in the data values")] == "warning"
+    assert statuses[(FRAME, "<lambda>: Duplicate rows found.")] == "passed"
@@ -0,0 +1,94 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import make_column_transformer
+from sklearn.datasets import make_classification
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.kernel_approximation import compare_kernel_approximations, predict_latency
+from utils.models import get_models, get_param_dist
+from utils.optimal_hyperparameters import tune_hyperparameters
+from utils.svm_kernel_search import resolve_gamma
+
+
+@pytest.fixture
+def data():
+    """
+    Train and test splits of a small labelled classification problem.
+    """
+    X, y = make_classification(n_samples=200, n_features=4, n_informative=3, n_redundant=0, random_state=5)
+    X = pd.DataFrame(X, columns=["a", "b", "c", "d"])
+    y = pd.Series(np.where(y == 1, "Heart Disease", "No Heart Disease"))
+    return X.iloc[:150], y.iloc[:150], X.iloc[150:], y.iloc[150:]
+
+
+@pytest.fixture
+def preprocessor():
+    return make_column_transformer((StandardScaler(), ["a", "b", "c", "d"]))
+
+
+def test_report_rows(data, preprocessor):
+    """
+    The report has the exact SVM and one row per approximation and number of components.
+    """
+    X_train, y_train, X_test, y_test = data
+    exact = make_pipeline(preprocessor, SVC(C=1.0, gamma="scale"))
+    report = compare_kernel_approximations(exact, X_train, y_train, X_test, y_test, "Heart Disease",
+                                           n_components=(10, 40), repeats=1)
+
+    assert list(report.columns) == ["Model", "Components", "Test F2 Score", "Fit Time (s)",
+                                    "Batch Latency (us/row)", "Single-Row Latency (ms)"]
+    assert report["Model"].tolist() == ["SVM RBF"] + ["SVM Nystroem"] * 2 + ["SVM RFF"] * 2
+    assert report["Components"].tolist()[1:] == [10, 40, 10, 40]
+    assert report["Test F2 Score"].between(0, 1).all()
+    assert (report["Batch Latency (us/row)"] > 0).all()
+    # the exact SVM's parameter object is not fitted in place
+    assert not hasattr(exact[-1], "support_")
+
+
+def test_predict_latency(data, preprocessor):
+    """
+    Latencies are positive and measured per row and per single-row call.
+    """
+    X_train, y_train, X_test, _ = data
+    model = make_pipeline(preprocessor, SVC()).fit(X_train, y_train)
+    latency = predict_latency(model, X_test, repeats=2)
+    assert set(latency) == {"batch_us_per_row", "single_row_ms"}
+    assert latency["batch_us_per_row"] > 0 and latency["single_row_ms"] > 0
+
+
+@pytest.mark.parametrize("name", ["SVM Nystroem", "SVM RFF"])
+def test_approximate_models_can_be_tuned(data, preprocessor, name):
+    """
+    The approximate models work with the randomized search over their parameter distributions.
+    """
+    X_train, y_train, _, _ = data
+    model = get_models(approximate_kernels=True)[name]
+    search = tune_hyperparameters(X_train, y_train, model, preprocessor, get_param_dist()[name],
+                                  "Heart Disease", 2.0, 123, n_jobs=1)
+    assert 0 <= search.best_score_ <= 1
+    assert set(search.best_params_) == set(get_param_dist()[name])
+
+
+@pytest.mark.parametrize("gamma", ["scale", "auto", 0.3])
+def test_gamma_resolved_like_svc(data, preprocessor, gamma):
+    """
+    The gamma handed to the feature maps is the one SVC resolves on the preprocessed training data.
+    """
+    X_train, y_train, _, _ = data
+    Xt = np.asarray(preprocessor.fit_transform(X_train), dtype=float)
+    assert resolve_gamma(gamma, Xt) == pytest.approx(SVC(gamma=gamma).fit(Xt, y_train)._gamma)
+
+
+def test_approximate_models_use_hinge_loss():
+    """
+    The linear SVMs minimise the same hinge loss as SVC, so C values carry over.
+    """
+    models = get_models(approximate_kernels=True)
+    assert models["SVM Nystroem"][-1].loss == "hinge"
+    assert models["SVM RFF"][-1].loss == "hinge"
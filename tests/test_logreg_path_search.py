@@ -0,0 +1,101 @@
+import sys
+import os
+import warnings
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.logreg_path_search import tune_logreg_path
+from utils.optimal_hyperparameters import tune_hyperparameters
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a small synthetic binary classification dataset.
+    """
+    X, y = make_classification(n_samples=150, n_features=5, n_classes=2, random_state=42)
+    return pd.DataFrame(X, columns=[f'feature_{i}' for i in range(5)]), pd.Series(y)
+
+
+@pytest.fixture
+def logreg_param_dist():
+    """
+    The C x max_iter grid used for logistic regression in utils.models.get_param_dist.
+    """
+    return {"logisticregression__C": 10.0 ** np.arange(-3, 2, 1),
+            "logisticregression__max_iter": [80, 100, 500, 1000, 1500, 2000]}
+
+
+def test_logreg_path_matches_randomized_search(sample_data, logreg_param_dist):
+    """
+    When the solver converges, the path gives the same candidates and validation scores as RandomizedSearchCV.
+    """
+    X, y = sample_data
+    expected = tune_hyperparameters(X, y, LogisticRegression(random_state=0), StandardScaler(), logreg_param_dist,
+                                    pos_label=1, beta=2, seed=123)
+    result = tune_logreg_path(X, y, LogisticRegression(random_state=0), StandardScaler(), logreg_param_dist,
+                              pos_label=1, beta=2, seed=123)
+    assert result.cv_results_['params'] == expected.cv_results_['params']
+    np.testing.assert_allclose(result.cv_results_['mean_test_score'], expected.cv_results_['mean_test_score'])
+    assert result.best_params_ == expected.best_params_
+
+
+def test_logreg_path_checkpoints_continue_one_solve(sample_data):
+    """
+    The checkpoints of one C continue a single solve, yet the first checkpoint
+    (max_iter=1, a cold start) and the converged last one (max_iter=200) score
+    the same as independent fits with those max_iter values.
+    """
+    X, y = sample_data
+    param_dist = {"logisticregression__C": [100.0], "logisticregression__max_iter": [1, 2, 200]}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)
+        result = tune_logreg_path(X, y, LogisticRegression(), StandardScaler(), param_dist, pos_label=1, beta=2, seed=0)
+        cold = tune_hyperparameters(X, y, LogisticRegression(), StandardScaler(), param_dist, pos_label=1, beta=2, seed=0)
+    by_iter = dict(zip(result.cv_results_['param_logisticregression__max_iter'], result.cv_results_['mean_test_score']))
+    cold_by_iter = dict(zip(cold.cv_results_['param_logisticregression__max_iter'], cold.cv_results_['mean_test_score']))
+    assert by_iter[200] == pytest.approx(cold_by_iter[200])
+    assert by_iter[1] == pytest.approx(cold_by_iter[1])
+
+
+def test_path_search_dispatches_to_logreg_path(sample_data, logreg_param_dist):
+    """
+    search="path" uses the regularisation path for logistic regression.
+    """
+    X, y = sample_data
+    result = tune_hyperparameters(X, y, LogisticRegression(), StandardScaler(), logreg_param_dist,
+                                  pos_label=1, beta=2, seed=1, search="path")
+    assert not result.best_estimator_.named_steps['logisticregression'].warm_start
+    assert len(result.cv_results_['params']) == 10
+
+
+def test_logreg_path_rejects_invalid_setups(sample_data, logreg_param_dist):
+    """
+    liblinear (no warm start) and parameters outside C and max_iter raise a ValueError.
+    """
+    X, y = sample_data
+    with pytest.raises(ValueError):
+        tune_logreg_path(X, y, LogisticRegression(solver='liblinear'), StandardScaler(), logreg_param_dist,
+                         pos_label=1, beta=2, seed=0)
+    with pytest.raises(ValueError):
+        tune_logreg_path(X, y, LogisticRegression(), StandardScaler(), {"logisticregression__tol": [1e-3]},
+                         pos_label=1, beta=2, seed=0)
+
+
+def test_logreg_path_parallel_folds_match_serial(sample_data, logreg_param_dist):
+    """
+    Scoring the folds with several workers gives the same results as one worker.
+    """
+    X, y = sample_data
+    serial = tune_logreg_path(X, y, LogisticRegression(), StandardScaler(), logreg_param_dist,
+                              pos_label=1, beta=2, seed=3)
+    parallel = tune_logreg_path(X, y, LogisticRegression(), StandardScaler(), logreg_param_dist,
+                                pos_label=1, beta=2, seed=3, n_jobs=2)
+    np.testing.assert_array_equal(parallel.cv_results_['mean_test_score'], serial.cv_results_['mean_test_score'])
+    np.testing.assert_array_equal(parallel.cv_results_['split4_train_score'], serial.cv_results_['split4_train_score'])
@@ -11,7 +11,7 @@ from sklearn.pipeline import make_pipeline
 from sklearn.metrics import make_scorer, fbeta_score
 from sklearn.utils._param_validation import InvalidParameterError
 
-from utils.mean_std_cv_scores import mean_std_cross_val_scores
+from utils.mean_std_cv_scores import mean_std_cross_val_scores, summarize_cv_scores, format_mean_std
 
 def test_mean_std_cv_scores():
     """
@@ -109,4 +109,69 @@ def test_mean_std_cv_scores_mismatched_lengths():
     model = LogisticRegression()
 
     with pytest.raises(ValueError):
-        mean_std_cross_val_scores(model, X, y, scoring)
\ No newline at end of file
+        mean_std_cross_val_scores(model, X, y, scoring)
+
+def test_mean_std_cv_scores_numeric():
+    """
+    Test that numeric output holds float mean, std and per-fold scores consistent with the text output.
+    """
+    X = pd.DataFrame({
+        "age": [20, 30, 40, 50, 60, 70],
+        "chol": [180, 200, 190, 210, 220, 230]
+    })
+    y = pd.Series(["No Heart Disease", "Heart Disease"] * 3)
+
+    scoring = make_scorer(fbeta_score, beta=2, pos_label="Heart Disease")
+    model = make_pipeline(StandardScaler(), LogisticRegression())
+
+    numeric = mean_std_cross_val_scores(model, X, y, scoring=scoring, cv=3,
+                                        return_train_score=True, output="numeric")
+    text = mean_std_cross_val_scores(model, X, y, scoring=scoring, cv=3, return_train_score=True)
+
+    assert numeric.dtype == float
+    assert numeric.index.names == ["metric", "statistic"]
+    folds = numeric["test_score"][["fold_0", "fold_1", "fold_2"]]
+    assert numeric["test_score", "mean"] == pytest.approx(folds.mean())
+    assert numeric["test_score", "std"] == pytest.approx(folds.std())
+    assert text["test_score"] == "%0.3f (+/- %0.3f)" % (numeric["test_score", "mean"], numeric["test_score", "std"])
+
+
+def test_summarize_and_format_many_runs():
+    """
+    Test that summaries of several runs stack into a sortable table and render as strings.
+    """
+    runs = {
+        "a": summarize_cv_scores({"test_score": [0.5, 0.7], "fit_time": [1.0, 1.0]}),
+        "b": summarize_cv_scores({"test_score": [0.9, 0.9], "fit_time": [2.0, 4.0]}),
+    }
+    table = pd.DataFrame(runs).T
+
+    assert table.sort_values(("test_score", "mean"), ascending=False).index[0] == "b"
+    text = format_mean_std(table)
+    assert text.loc["a", "test_score"] == "0.600 (+/- 0.141)"
+    assert text.loc["b", "fit_time"] == "3.000 (+/- 1.414)"
+
+
+def test_mean_std_cv_scores_invalid_output():
+    """
+    Test mean_std_cross_val_scores with an unknown output mode.
+    """
+    X = pd.DataFrame({"age":[20,30,40,50]})
+    y = pd.Series(["No Heart Disease", "Heart Disease"] * 2)
+
+    with pytest.raises(ValueError):
+        mean_std_cross_val_scores(LogisticRegression(), X, y, cv=2, output="json")
+
+
+def test_summarize_cv_scores_skips_failed_folds():
+    """
+    Test that a NaN fold score (a failed fit) is skipped, as pandas mean and std do.
+    """
+    scores = {"test_score": [0.5, float("nan"), 0.7], "fit_time": [1.0, 2.0, 3.0]}
+    summary = summarize_cv_scores(scores)
+    expected = pd.DataFrame(scores)
+
+    assert summary[("test_score", "mean")] == pytest.approx(expected["test_score"].mean())
+    assert summary[("test_score", "std")] == pytest.approx(expected["test_score"].std())
+    assert format_mean_std(summary)["test_score"] == "0.600 (+/- 0.141)"
+    assert pd.isna(summarize_cv_scores({"test_score": [float("nan"), 0.5]})[("test_score", "std")])
@@ -1,5 +1,4 @@
 # VSCode Copilot and ChatGPT was used to assit in writing this test file.
-import pytest
 import sys
 import os
 
@@ -8,8 +7,11 @@ from sklearn.dummy import DummyClassifier
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.svm import SVC
+from sklearn.kernel_approximation import Nystroem, RBFSampler
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
 
-from utils.models import get_models
+from utils.models import get_models, get_param_dist
 
 def test_get_models():
     """
@@ -67,3 +69,29 @@ def test_get_models_return_type():
     """
     models = get_models(random_state=0)
     assert isinstance(models, dict)
+
+
+def test_get_models_approximate_kernels():
+    """
+    Test that approximate_kernels adds the Nystroem and random Fourier feature SVMs.
+    """
+    models = get_models(random_state=7, approximate_kernels=True)
+
+    assert set(models.keys()) == {"Dummy Classifier", "Decision Tree", "Logistic Regression", "SVM RBF",
+                                  "SVM Nystroem", "SVM RFF"}
+    assert isinstance(models["SVM Nystroem"][0], Nystroem)
+    assert isinstance(models["SVM RFF"][0], RBFSampler)
+    assert models["SVM Nystroem"][0].random_state == 7
+    assert models["SVM RFF"][-1].random_state == 7
+
+
+def test_param_dist_matches_approximate_models():
+    """
+    Test that every parameter of the approximate models' distributions can be set on their pipelines.
+    """
+    models = get_models(approximate_kernels=True)
+    param_dist = get_param_dist()
+
+    for name in ("SVM Nystroem", "SVM RFF"):
+        pipeline = make_pipeline(StandardScaler(), models[name])
+        pipeline.set_params(**{key: values[0] for key, values in param_dist[name].items()})
@@ -0,0 +1,109 @@
+import sys
+import os
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import fbeta_score, make_scorer
+from sklearn.model_selection import RandomizedSearchCV, RepeatedStratifiedKFold
+from sklearn.preprocessing import StandardScaler
+from sklearn.pipeline import make_pipeline
+from sklearn.tree import DecisionTreeClassifier
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.nested_cv import nested_cross_validate, summarize_nested_cv
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a small synthetic binary classification dataset.
+    """
+    X, y = make_classification(n_samples=120, n_features=5, n_classes=2, random_state=42)
+    return pd.DataFrame(X, columns=[f'feature_{i}' for i in range(5)]), pd.Series(y)
+
+
+PIPELINES = {
+    "LR": make_pipeline(StandardScaler(), LogisticRegression()),
+    "Tree": make_pipeline(StandardScaler(), DecisionTreeClassifier(random_state=0)),
+}
+PARAM_DISTS = {
+    "LR": {'logisticregression__C': [0.01, 0.1, 1.0, 10.0]},
+    "Tree": {'decisiontreeclassifier__max_depth': [1, 2, 3, 4, 5]},
+}
+
+
+def test_outer_folds_match_randomized_search(sample_data):
+    """
+    Each outer fold selects what RandomizedSearchCV selects on that fold's training data.
+    """
+    X, y = sample_data
+    results = nested_cross_validate(X, y, PIPELINES, PARAM_DISTS, pos_label=1, beta=2, seed=0,
+                                    outer_splits=3, inner_cv=3, n_iter=4, n_jobs=1)
+    outer = list(RepeatedStratifiedKFold(n_splits=3, n_repeats=1, random_state=0).split(X, y))
+    scorer = make_scorer(fbeta_score, pos_label=1, beta=2)
+    for _, row in results[results["Model"] == "LR"].iterrows():
+        train_idx, test_idx = outer[row["Outer Fold"]]
+        search = RandomizedSearchCV(PIPELINES["LR"], PARAM_DISTS["LR"], n_iter=4, random_state=0, cv=3,
+                                    scoring=scorer).fit(X.iloc[train_idx], y.iloc[train_idx])
+        assert json.loads(row["Best Model Parameters"]) == search.best_params_
+        assert row["Inner F2 Score"] == pytest.approx(search.best_score_)
+        assert row["Outer F2 Score"] == pytest.approx(
+            fbeta_score(y.iloc[test_idx], search.predict(X.iloc[test_idx]), pos_label=1, beta=2))
+
+
+def test_repeats_and_summary(sample_data):
+    """
+    Repeats add outer folds and the summary has one row per model.
+    """
+    X, y = sample_data
+    results = nested_cross_validate(X, y, PIPELINES, PARAM_DISTS, pos_label=1, beta=2, seed=0,
+                                    outer_splits=2, n_repeats=2, inner_cv=2, n_iter=2, n_jobs=2)
+    assert len(results) == 2 * 2 * 2
+    assert sorted(results["Repeat"].unique()) == [0, 1]
+    summary = summarize_nested_cv(results)
+    assert list(summary.index) == ["LR", "Tree"]
+    assert summary.loc["LR", "Optimism"] == pytest.approx(
+        summary.loc["LR", "Inner F2 Mean"] - summary.loc["LR", "Nested F2 Mean"])
+
+
+def test_path_search_matches_randomized_search(sample_data):
+    """
+    search="path" evaluates the same candidates and folds, so it selects what the randomized search selects.
+    """
+    X, y = sample_data
+    pipelines = {"LR": PIPELINES["LR"]}
+    param_dists = {"LR": {'logisticregression__C': [0.01, 0.1, 1.0, 10.0],
+                          'logisticregression__max_iter': [100, 200]}}
+    random = nested_cross_validate(X, y, pipelines, param_dists, pos_label=1, beta=2, seed=0,
+                                   outer_splits=3, inner_cv=3, n_jobs=1)
+    path = nested_cross_validate(X, y, pipelines, param_dists, pos_label=1, beta=2, seed=0,
+                                 outer_splits=3, inner_cv=3, n_jobs=1, search="path")
+    assert list(path["Best Model Parameters"]) == list(random["Best Model Parameters"])
+    np.testing.assert_allclose(path["Outer F2 Score"], random["Outer F2 Score"])
+
+
+def test_halving_search_runs_per_outer_fold(sample_data):
+    """
+    search="halving" tunes each outer training set with a successive-halving search.
+    """
+    X, y = sample_data
+    results = nested_cross_validate(X, y, {"LR": PIPELINES["LR"]}, {"LR": PARAM_DISTS["LR"]}, pos_label=1, beta=2,
+                                    seed=0, outer_splits=2, inner_cv=2, n_jobs=1, search="halving")
+    assert len(results) == 2
+    assert results["Outer F2 Score"].notna().all()
+
+
+def test_invalid_splits(sample_data):
+    """
+    Fewer than two outer folds, no repeats or an unknown search mode are rejected.
+    """
+    X, y = sample_data
+    with pytest.raises(ValueError):
+        nested_cross_validate(X, y, PIPELINES, PARAM_DISTS, pos_label=1, beta=2, seed=0, outer_splits=1)
+    with pytest.raises(ValueError):
+        nested_cross_validate(X, y, PIPELINES, PARAM_DISTS, pos_label=1, beta=2, seed=0, n_repeats=0)
+    with pytest.raises(ValueError):
+        nested_cross_validate(X, y, PIPELINES, PARAM_DISTS, pos_label=1, beta=2, seed=0, search="grid")
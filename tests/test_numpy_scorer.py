@@ -0,0 +1,84 @@
+import sys
+import os
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.base import clone
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.numpy_scorer import NumpyScorer, export_numpy_scorer
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+@pytest.fixture(scope="module")
+def heart_data():
+    """
+    The processed train and test splits and the fitted project preprocessor.
+    """
+    train = pd.read_csv(os.path.join(ROOT, "data/processed/train_heart.csv"))
+    test = pd.read_csv(os.path.join(ROOT, "data/processed/test_heart.csv"))
+    with open(os.path.join(ROOT, "results/preprocessor/heart_preprocessor.pickle"), "rb") as f:
+        preprocessor = pickle.load(f)
+    return train, test, preprocessor
+
+
+@pytest.mark.parametrize("classifier", [SVC(C=10, gamma=0.1), SVC(kernel="linear"),
+                                        LogisticRegression(max_iter=1000),
+                                        DecisionTreeClassifier(max_depth=6, random_state=123)])
+def test_matches_sklearn_pipeline(heart_data, classifier):
+    """
+    The exported scorer reproduces the pipeline's features, decisions and predictions on the test set.
+    """
+    train, test, preprocessor = heart_data
+    X_train, X_test = train.drop(columns="target"), test.drop(columns="target")
+    model = make_pipeline(clone(preprocessor), classifier).fit(X_train, train["target"])
+    scorer = export_numpy_scorer(model)
+
+    np.testing.assert_allclose(scorer.transform(X_test), np.asarray(model[0].transform(X_test)), atol=1e-12)
+    np.testing.assert_array_equal(scorer.predict(X_test), model.predict(X_test))
+    if not isinstance(classifier, DecisionTreeClassifier):
+        np.testing.assert_allclose(scorer.decision_function(X_test), model.decision_function(X_test), atol=1e-9)
+
+
+def test_final_model_round_trip(heart_data, tmp_path):
+    """
+    The saved final model scorer loads without pickle and accepts plain arrays.
+    """
+    _, test, _ = heart_data
+    with open(os.path.join(ROOT, "results/final_model_results/final_model.pickle"), "rb") as f:
+        model = pickle.load(f)
+    scorer = export_numpy_scorer(model)
+    scorer.save(tmp_path / "scorer.npz")
+    loaded = NumpyScorer.load(tmp_path / "scorer.npz")
+
+    X = test[loaded.input_columns].to_numpy()
+    np.testing.assert_array_equal(loaded.predict(X), model.predict(test.drop(columns="target")))
+
+
+def test_unknown_category_raises(heart_data):
+    """
+    Categories unseen in training are rejected, as with handle_unknown="error".
+    """
+    train, test, preprocessor = heart_data
+    model = make_pipeline(clone(preprocessor), LogisticRegression(max_iter=1000))
+    model.fit(train.drop(columns="target"), train["target"])
+    X = test.drop(columns="target").head(3).assign(chest_pain=9)
+    with pytest.raises(ValueError, match="unknown categories"):
+        export_numpy_scorer(model).predict(X)
+
+
+def test_unsupported_model_raises(heart_data):
+    """
+    Classifiers without a NumPy implementation are rejected at export.
+    """
+    train, _, preprocessor = heart_data
+    model = make_pipeline(clone(preprocessor), SVC(kernel="poly"))
+    model.fit(train.drop(columns="target"), train["target"])
+    with pytest.raises(ValueError, match="not supported"):
+        export_numpy_scorer(model)
@@ -3,15 +3,17 @@ import sys
 import os
 import pandas as pd
 import numpy as np
+from unittest import mock
 from sklearn.datasets import make_classification
 from sklearn.linear_model import LogisticRegression
 from sklearn.preprocessing import StandardScaler
 from sklearn.pipeline import make_pipeline
-from sklearn.model_selection import RandomizedSearchCV
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import RandomizedSearchCV, HalvingRandomSearchCV
 from sklearn.metrics import fbeta_score, make_scorer
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.optimal_hyperparameters import tune_hyperparameters
+from utils.optimal_hyperparameters import tune_hyperparameters, PATH_TUNERS
 
 # Test cases and the corresponding docstrings are created using Copilot/ChatGPT
 
@@ -167,4 +169,85 @@ def test_tune_hyperparameters_invalid_beta(sample_data, sample_preprocessor, sam
     """
     X_train, y_train = sample_data
     with pytest.raises(ValueError):
-        tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist, pos_label=1, beta=-1, seed=42)
\ No newline at end of file
+        tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist, pos_label=1, beta=-1, seed=42)
+
+# Successive-halving search mode
+def test_tune_hyperparameters_halving_rows(sample_data, sample_preprocessor, sample_model, sample_param_dist):
+    """
+    Test that search="halving" returns a fitted HalvingRandomSearchCV
+    that halves over the number of training rows.
+    """
+    X_train, y_train = sample_data
+    result = tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist,
+                                  pos_label=1, beta=2, seed=42, search="halving")
+    assert isinstance(result, HalvingRandomSearchCV)
+    assert result.resource == "n_samples"
+    assert 'logisticregression__C' in result.best_params_
+
+def test_tune_hyperparameters_halving_last_round_uses_all_rows(sample_preprocessor, sample_model):
+    """
+    Test that the last halving round trains on every training row, on the same
+    10 candidates as the randomized search, so best_score_ is comparable.
+    """
+    X, y = make_classification(n_samples=180, n_features=5, n_classes=2, random_state=0)
+    X_train, y_train = pd.DataFrame(X, columns=[f'feature_{i}' for i in range(5)]), pd.Series(y)
+    param_dist = {'logisticregression__C': 10.0 ** np.arange(-5, 5)}
+    result = tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, param_dist,
+                                  pos_label=1, beta=2, seed=42, search="halving")
+    random = tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, param_dist,
+                                  pos_label=1, beta=2, seed=42)
+    assert result.n_resources_[-1] == len(X_train)
+    assert result.n_candidates_[0] == 10
+    first_round = [p for p, i in zip(result.cv_results_['params'], result.cv_results_['iter']) if i == 0]
+    assert first_round == random.cv_results_['params']
+
+def test_tune_hyperparameters_halving_max_iter(sample_data, sample_preprocessor, sample_model):
+    """
+    Test that a parameter from param_dist can be used as the halving budget,
+    ranging from its smallest to its largest listed value.
+    """
+    X_train, y_train = sample_data
+    param_dist = {'logisticregression__C': [0.1, 1.0, 10.0], 'logisticregression__max_iter': [10, 30, 90]}
+    result = tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, param_dist,
+                                  pos_label=1, beta=2, seed=42, search="halving",
+                                  resource='logisticregression__max_iter')
+    assert result.min_resources_ == 10
+    assert result.max_resources_ == 90
+    assert set(result.cv_results_['n_resources']) <= {10, 30, 90}
+
+def test_tune_hyperparameters_invalid_search(sample_data, sample_preprocessor, sample_model, sample_param_dist):
+    """
+    Confirm that an unknown search mode raises a ValueError.
+    """
+    X_train, y_train = sample_data
+    with pytest.raises(ValueError):
+        tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist,
+                             pos_label=1, beta=2, seed=42, search="grid")
+
+def test_tune_hyperparameters_halving_unknown_resource(sample_data, sample_preprocessor, sample_model, sample_param_dist):
+    """
+    Confirm that a halving resource missing from param_dist raises a ValueError.
+    """
+    X_train, y_train = sample_data
+    with pytest.raises(ValueError):
+        tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist,
+                             pos_label=1, beta=2, seed=42, search="halving",
+                             resource='logisticregression__max_iter')
+
+
+def test_tune_hyperparameters_path_passes_worker_share(sample_data, sample_preprocessor, sample_model, sample_param_dist):
+    """
+    search="path" hands the search's n_jobs to the specialised tuner.
+    """
+    X, y = sample_data
+    seen = {}
+
+    def tuner(*args, **kwargs):
+        seen.update(kwargs)
+        return "result"
+
+    with mock.patch.dict(PATH_TUNERS, {type(sample_model): tuner}):
+        result = tune_hyperparameters(X, y, sample_model, sample_preprocessor, sample_param_dist, pos_label=1,
+                                      beta=2, seed=0, search="path", n_jobs=3)
+    assert result == "result"
+    assert seen["n_jobs"] == 3
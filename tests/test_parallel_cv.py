@@ -0,0 +1,82 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import make_scorer, fbeta_score
+from sklearn.model_selection import cross_validate
+from sklearn.preprocessing import StandardScaler
+from sklearn.pipeline import make_pipeline
+from sklearn.tree import DecisionTreeClassifier
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.parallel_cv import cross_validate_models
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a small synthetic binary classification dataset.
+    """
+    X, y = make_classification(n_samples=100, n_features=5, n_classes=2, random_state=42)
+    return pd.DataFrame(X, columns=[f'feature_{i}' for i in range(5)]), pd.Series(y)
+
+
+@pytest.fixture
+def pipelines():
+    """
+    Two small pipelines to evaluate together.
+    """
+    return {
+        "LR": make_pipeline(StandardScaler(), LogisticRegression()),
+        "Tree": make_pipeline(StandardScaler(), DecisionTreeClassifier(random_state=0)),
+    }
+
+
+SCORER = make_scorer(fbeta_score, pos_label=1, beta=2)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_matches_cross_validate(sample_data, pipelines, n_jobs):
+    """
+    Scores match cross_validate run separately for each model.
+    """
+    X, y = sample_data
+    scores = cross_validate_models(pipelines, X, y, SCORER, cv=5, n_jobs=n_jobs)
+    for name, pipe in pipelines.items():
+        expected = cross_validate(pipe, X, y, scoring=SCORER, cv=5, return_train_score=True)
+        np.testing.assert_allclose(scores[name]["test_score"], expected["test_score"])
+        np.testing.assert_allclose(scores[name]["train_score"], expected["train_score"])
+        assert list(scores[name]) == ["fit_time", "score_time", "test_score", "train_score"]
+
+
+def test_on_result_sees_every_model_and_fold(sample_data, pipelines):
+    """
+    The callback receives one record per (model, fold) pair.
+    """
+    X, y = sample_data
+    seen = []
+    cross_validate_models(pipelines, X, y, SCORER, cv=3, n_jobs=1, on_result=seen.append)
+    assert sorted((r["model"], r["fold"]) for r in seen) == [(m, k) for m in ("LR", "Tree") for k in range(3)]
+
+
+def test_without_train_score(sample_data, pipelines):
+    """
+    Train scores are left out when not requested.
+    """
+    X, y = sample_data
+    scores = cross_validate_models(pipelines, X, y, SCORER, cv=3, n_jobs=1, return_train_score=False)
+    assert "train_score" not in scores["LR"]
+
+
+def test_failed_fit_scores_nan(sample_data):
+    """
+    A model that fails to fit gets NaN scores and a warning instead of stopping the others.
+    """
+    X, y = sample_data
+    pipes = {"bad": make_pipeline(StandardScaler(), LogisticRegression(C=-1.0))}
+    with pytest.warns(UserWarning):
+        scores = cross_validate_models(pipes, X, y, SCORER, cv=3, n_jobs=1)
+    assert np.isnan(scores["bad"]["test_score"]).all()
@@ -0,0 +1,127 @@
+import sys
+import os
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import make_column_transformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.batch_predict import predict_frame
+from utils.numpy_scorer import export_numpy_scorer
+from utils.prediction_cache import CachedModel, model_feature_columns
+from utils.scoring_service import ScoringService
+
+
+@pytest.fixture
+def data():
+    """
+    Rows with small-domain integer features, many exact repeats and a unique id per row.
+    """
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({"patient_id": np.arange(500), "a": rng.integers(0, 4, 500), "b": rng.integers(0, 3, 500),
+                      "c": rng.integers(0, 2, 500)})
+    y = np.where(X["a"] + X["b"] + rng.normal(0, 1, 500) > 3, "Heart Disease", "No Heart Disease")
+    return X, y
+
+
+def _pipeline(classifier):
+    return make_pipeline(make_column_transformer((StandardScaler(), ["a", "b", "c"]), ("drop", ["patient_id"])),
+                         classifier)
+
+
+@pytest.fixture
+def model(data):
+    return _pipeline(LogisticRegression()).fit(*data)
+
+
+def test_feature_columns_skip_dropped_columns(model):
+    """
+    Columns the preprocessor drops are not part of the key, for pipelines and exported scorers.
+    """
+    assert model_feature_columns(model) == ["a", "b", "c"]
+    assert model_feature_columns(export_numpy_scorer(model)) == ["a", "b", "c"]
+
+
+def test_matches_model_and_counts_hits(model, data):
+    """
+    Cached predictions and scores equal the model's; repeated rows are answered from the cache.
+    """
+    X, _ = data
+    cached = CachedModel(model, maxsize=100)
+    out = predict_frame(cached, X, scores=True, pos_label="Heart Disease")
+    pd.testing.assert_frame_equal(out, predict_frame(model, X, scores=True, pos_label="Heart Disease"))
+
+    n_distinct = len(X[["a", "b", "c"]].drop_duplicates())
+    stats = cached.stats()
+    # predict and decision_function are cached separately, each scoring every distinct row once
+    assert stats["misses"] == 2 * n_distinct
+    assert stats["hits"] == 2 * (len(X) - n_distinct)
+
+    predict_frame(cached, X.iloc[:50], scores=True, pos_label="Heart Disease")
+    assert cached.stats()["misses"] == 2 * n_distinct
+
+
+def test_lru_eviction(model, data):
+    """
+    The cache never holds more than maxsize entries and evicts the least recently used.
+    """
+    X, _ = data
+    rows = X.drop_duplicates(subset=["a", "b", "c"]).reset_index(drop=True)
+    cached = CachedModel(model, maxsize=3)
+    cached.predict(rows.iloc[:3])
+    cached.predict(rows.iloc[[0]])
+    cached.predict(rows.iloc[[3]])
+
+    stats = cached.stats()
+    assert stats["size"] == 3 and stats["evictions"] == 1
+    cached.predict(rows.iloc[[0]])
+    assert cached.stats()["hits"] == 2
+    cached.predict(rows.iloc[[1]])
+    assert cached.stats()["misses"] == 5
+
+
+def test_methods_follow_the_model(data):
+    """
+    Only the prediction methods of the wrapped model are offered.
+    """
+    X, y = data
+    cached = CachedModel(_pipeline(DecisionTreeClassifier(random_state=0)).fit(X, y))
+    assert not hasattr(cached, "decision_function")
+    np.testing.assert_allclose(cached.predict_proba(X), cached.model.predict_proba(X))
+    assert list(cached.classes_) == ["Heart Disease", "No Heart Disease"]
+
+
+def test_invalidated_when_model_file_changes(model, data, tmp_path):
+    """
+    Replacing the model file reloads the model and clears the cache.
+    """
+    X, y = data
+    path = tmp_path / "model.pickle"
+    with open(path, "wb") as f:
+        pickle.dump(model, f)
+    cached = CachedModel(model_path=str(path), check_interval=0)
+    cached.predict(X)
+
+    flipped = _pipeline(LogisticRegression()).fit(X, np.where(y == "Heart Disease", "No Heart Disease", "Heart Disease"))
+    with open(path, "wb") as f:
+        pickle.dump(flipped, f)
+    os.utime(path, ns=(0, 1))
+
+    np.testing.assert_array_equal(cached.predict(X), flipped.predict(X))
+    assert cached.stats()["invalidations"] == 1
+
+
+def test_service_reports_cache_stats(model):
+    """
+    The scoring service includes the cache statistics in its metrics.
+    """
+    service = ScoringService(CachedModel(model, maxsize=10))
+    try:
+        assert service.metrics()["cache"]["maxsize"] == 10
+    finally:
+        service.close()
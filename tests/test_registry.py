@@ -0,0 +1,122 @@
+import sys
+import os
+import time
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.registry import ArtifactRegistry, code_fingerprint, file_fingerprint, remove_unwritten
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return ArtifactRegistry(str(tmp_path / "registry"))
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_key_depends_on_every_input():
+    """
+    Keys are stable for equal inputs and change with any input or the stage name.
+    """
+    key = ArtifactRegistry.key("tuning", data="abc", seed=123, params={"C": [1, 10]})
+    assert key == ArtifactRegistry.key("tuning", params={"C": [1, 10]}, seed=123, data="abc")
+    assert key != ArtifactRegistry.key("tuning", data="abc", seed=124, params={"C": [1, 10]})
+    assert key != ArtifactRegistry.key("evaluation", data="abc", seed=123, params={"C": [1, 10]})
+
+
+def test_lookup_before_compute(registry, tmp_path):
+    """
+    A miss returns False; after storing, restore copies the files to the requested paths.
+    """
+    key = registry.key("stage", seed=1)
+    outputs = {"model.pickle": str(tmp_path / "out" / "model.pickle"), "scores.csv": str(tmp_path / "out" / "scores.csv")}
+    assert not registry.restore(key, outputs)
+
+    _write(tmp_path / "out" / "model.pickle", b"model")
+    _write(tmp_path / "out" / "scores.csv", b"a,b\n1,2\n")
+    manifest = registry.store(key, outputs, kind="stage", inputs={"seed": 1})
+    assert manifest["files"]["scores.csv"]["sha256"] == file_fingerprint(outputs["scores.csv"])
+
+    restored = {name: str(tmp_path / "restored" / name) for name in outputs}
+    assert registry.restore(key, restored)
+    assert open(restored["model.pickle"], "rb").read() == b"model"
+    assert open(restored["scores.csv"], "rb").read() == b"a,b\n1,2\n"
+
+
+def test_restore_removes_outputs_the_entry_lacks(registry, tmp_path):
+    """
+    An output the stored run did not write (e.g. a skipped model artifact) is deleted on restore, not left stale.
+    """
+    key = registry.key("stage", seed=1)
+    registry.store(key, {"model.pickle": _write(tmp_path / "run" / "model.pickle", b"model")}, kind="stage", inputs={})
+
+    restored = {"model.pickle": str(tmp_path / "out" / "model.pickle"),
+                "model.artifact": _write(tmp_path / "out" / "model.artifact", b"earlier model")}
+    assert registry.restore(key, restored)
+    assert open(restored["model.pickle"], "rb").read() == b"model"
+    assert not os.path.exists(restored["model.artifact"])
+
+
+def test_remove_unwritten(tmp_path):
+    """
+    Only existing outputs missing from the written names are deleted.
+    """
+    outputs = {"model.pickle": _write(tmp_path / "model.pickle", b"model"),
+               "model.artifact": _write(tmp_path / "model.artifact", b"earlier model"),
+               "nested.csv": str(tmp_path / "nested.csv")}
+    assert remove_unwritten(outputs, ["model.pickle"]) == [outputs["model.artifact"]]
+    assert os.path.exists(outputs["model.pickle"])
+    assert not os.path.exists(outputs["model.artifact"])
+
+
+def test_entries_are_kept_side_by_side(registry, tmp_path):
+    """
+    Outputs of different inputs are separate entries, and a stored key is never overwritten.
+    """
+    path = tmp_path / "model.pickle"
+    for seed in (1, 2):
+        _write(path, f"model {seed}".encode())
+        registry.store(registry.key("stage", seed=seed), {"model.pickle": str(path)}, kind="stage")
+    _write(path, b"changed")
+    registry.store(registry.key("stage", seed=1), {"model.pickle": str(path)}, kind="stage")
+
+    assert len(registry.entries()) == 2
+    for seed in (1, 2):
+        with open(registry.path(registry.key("stage", seed=seed), "model.pickle"), "rb") as f:
+            assert f.read() == f"model {seed}".encode()
+
+
+def test_gc_removes_least_recently_used(tmp_path):
+    """
+    With a size cap the least recently used entries are removed after a store.
+    """
+    registry = ArtifactRegistry(str(tmp_path / "registry"), max_bytes=250)
+    keys = [registry.key("stage", seed=seed) for seed in range(3)]
+    path = _write(tmp_path / "blob", b"x" * 100)
+    registry.store(keys[0], {"blob": path})
+    time.sleep(0.01)
+    registry.store(keys[1], {"blob": path})
+    time.sleep(0.01)
+    assert registry.lookup(keys[0]) is not None
+    time.sleep(0.01)
+    registry.store(keys[2], {"blob": path})
+
+    # keys[1] was used least recently once keys[0] was looked up again
+    assert registry.lookup(keys[1]) is None
+    assert registry.lookup(keys[0]) is not None and registry.lookup(keys[2]) is not None
+    assert registry.entries()["bytes"].sum() <= 250
+
+
+def test_code_fingerprint_tracks_source(tmp_path):
+    """
+    Changing any source file changes the code fingerprint.
+    """
+    _write(tmp_path / "pkg" / "a.py", b"x = 1\n")
+    _write(tmp_path / "script.py", b"print(1)\n")
+    before = code_fingerprint(str(tmp_path / "script.py"), str(tmp_path / "pkg"))
+    _write(tmp_path / "pkg" / "a.py", b"x = 2\n")
+    assert code_fingerprint(str(tmp_path / "script.py"), str(tmp_path / "pkg")) != before
@@ -0,0 +1,60 @@
+import sys
+import os
+import pytest
+from joblib import cpu_count
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.scheduler import allocate_n_jobs, run_concurrently
+
+
+def _square(x, n_jobs):
+    return x * x, n_jobs
+
+
+def test_allocate_n_jobs_splits_budget():
+    """
+    The budget is divided across tasks, with any remainder going to the first tasks.
+    """
+    assert allocate_n_jobs(8, 3) == [3, 3, 2]
+    assert allocate_n_jobs(6, 3) == [2, 2, 2]
+
+
+def test_allocate_n_jobs_more_tasks_than_workers():
+    """
+    With fewer workers than tasks, only as many tasks as workers run at once, each with one worker.
+    """
+    assert allocate_n_jobs(2, 3) == [1, 1]
+    assert allocate_n_jobs(1, 3) == [1]
+
+
+def test_allocate_n_jobs_all_cpus():
+    """
+    n_jobs=-1 uses every CPU.
+    """
+    assert sum(allocate_n_jobs(-1, 3)) == cpu_count()
+
+
+def test_allocate_n_jobs_no_tasks():
+    """
+    Allocating a budget over zero tasks raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        allocate_n_jobs(4, 0)
+
+
+def test_run_concurrently_sequential():
+    """
+    With a budget of one worker, tasks run in-process and results keep task order.
+    """
+    results = run_concurrently(_square, {"a": {"x": 2}, "b": {"x": 3}}, n_jobs=1)
+    assert list(results) == ["a", "b"]
+    assert results == {"a": (4, 1), "b": (9, 1)}
+
+
+def test_run_concurrently_parallel():
+    """
+    With a larger budget, each task receives its share of the workers.
+    """
+    results = run_concurrently(_square, {"a": {"x": 2}, "b": {"x": 3}, "c": {"x": 4}}, n_jobs=4)
+    assert [value for value, _ in results.values()] == [4, 9, 16]
+    assert [share for _, share in results.values()] == [2, 1, 1]
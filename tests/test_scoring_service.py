@@ -0,0 +1,146 @@
+import sys
+import os
+import json
+import threading
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import make_column_transformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.scoring_service import MicroBatcher, ScoringService, LatencyStats, make_server
+from utils.heart_schema import record_schema
+
+
+def _record(i):
+    return {"patient_id": i + 1, "age": 40 + i % 40, "gender": i % 2, "chest_pain": i % 4, "resting_bp": 120,
+            "serum_cholesterol": 200 + i, "fasting_blood_sugar": 0, "resting_electro": i % 3,
+            "max_heart_rate": 150, "exercise_angina": i % 2, "old_peak": 1.5, "slope": 1 + i % 3,
+            "num_major_vessels": i % 4}
+
+
+@pytest.fixture
+def model():
+    """
+    A small pipeline fitted on records that satisfy the heart disease schema.
+    """
+    X = pd.DataFrame([_record(i) for i in range(60)])
+    y = np.where(X["age"] > 60, "Heart Disease", "No Heart Disease")
+    preprocessor = make_column_transformer((StandardScaler(), ["age", "serum_cholesterol", "chest_pain"]))
+    return make_pipeline(preprocessor, LogisticRegression()).fit(X, y)
+
+
+@pytest.fixture
+def server(model):
+    """
+    A scoring server on a free local port, shut down after the test.
+    """
+    service = ScoringService(model, scores=True, pos_label="Heart Disease", max_wait_ms=20)
+    httpd = make_server(service, port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield service, f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+    service.close()
+
+
+def _post(url, body):
+    request = urllib.request.Request(url + "/predict", data=json.dumps(body).encode(),
+                                     headers={"Content-Type": "application/json"})
+    return json.loads(urllib.request.urlopen(request, timeout=10).read())
+
+
+def test_record_schema_drops_target_and_frame_checks():
+    """
+    Scoring records are validated without the target or dataset-level checks.
+    """
+    schema = record_schema()
+    assert "target" not in schema.columns
+    assert schema.checks == []
+    schema.validate(pd.DataFrame([_record(0), _record(0)]))
+
+
+def test_concurrent_requests_match_predict(server, model):
+    """
+    Concurrent single-record requests get the predictions of the model and are batched together.
+    """
+    service, url = server
+    records = [_record(i) for i in range(40)]
+    with ThreadPoolExecutor(8) as pool:
+        responses = list(pool.map(lambda r: _post(url, {"records": [r]})["predictions"][0], records))
+
+    expected = model.predict(pd.DataFrame(records))
+    assert [r["prediction"] for r in responses] == list(expected)
+    metrics = json.loads(urllib.request.urlopen(url + "/metrics", timeout=10).read())
+    assert metrics["requests"] == 40 and metrics["rows"] == 40
+    assert metrics["batches"] < 40
+    assert metrics["p50_ms"] <= metrics["p99_ms"]
+
+
+def test_invalid_record_fails_only_its_request(server):
+    """
+    A record breaking the schema gets a 400 while the rest of its batch is scored.
+    """
+    service, url = server
+    bad = dict(_record(1), age=200)
+
+    def send(body):
+        try:
+            return 200, _post(url, body)
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(send, [[bad], [_record(2)], [_record(3)], {"records": []}]))
+    assert [status for status, _ in results] == [400, 200, 200, 400]
+    assert "error" in results[0][1]
+
+
+def test_health_and_unknown_path(server):
+    """
+    The health endpoint answers and unknown paths return 404.
+    """
+    _, url = server
+    assert json.loads(urllib.request.urlopen(url + "/health", timeout=10).read()) == {"status": "ok"}
+    with pytest.raises(urllib.error.HTTPError) as e:
+        urllib.request.urlopen(url + "/nope", timeout=10)
+    assert e.value.code == 404
+
+
+def test_micro_batcher_coalesces_waiting_requests():
+    """
+    Requests queued while a batch waits are scored in one call, up to the row limit.
+    """
+    calls = []
+
+    def score(frame):
+        calls.append(len(frame))
+        return frame.assign(doubled=frame["x"] * 2)
+
+    batcher = MicroBatcher(score, max_batch_rows=5, max_wait_ms=200)
+    futures = [batcher.submit(pd.DataFrame({"x": [i, i]})) for i in range(4)]
+    results = [f.result(timeout=5) for f in futures]
+    batcher.close()
+
+    assert results[3]["doubled"].tolist() == [6, 6]
+    assert calls[0] == 6 and sum(calls) == 8
+
+
+def test_latency_stats_percentiles():
+    """
+    Percentiles are reported in milliseconds.
+    """
+    stats = LatencyStats()
+    assert stats.snapshot()["p50_ms"] is None
+    for seconds in np.linspace(0.001, 0.1, 100):
+        stats.record_request(seconds, rows=1)
+    snapshot = stats.snapshot()
+    assert snapshot["p50_ms"] == pytest.approx(50.5, rel=0.01)
+    assert snapshot["requests"] == 100
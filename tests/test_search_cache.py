@@ -0,0 +1,84 @@
+import sys
+import os
+import pandas as pd
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.search_cache import hash_frame, search_fingerprint, load_search, save_search
+from utils.optimal_hyperparameters import tune_hyperparameters
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a small synthetic binary classification dataset.
+    """
+    X, y = make_classification(n_samples=100, n_features=5, n_classes=2, random_state=42)
+    return pd.DataFrame(X, columns=[f'feature_{i}' for i in range(5)]), pd.Series(y)
+
+
+def _fingerprint(X, y, **overrides):
+    args = dict(model=LogisticRegression(random_state=42), preprocessor=StandardScaler(),
+                param_dist={'logisticregression__C': np.array([0.1, 1.0])}, pos_label=1, beta=2, seed=42)
+    args.update(overrides)
+    return search_fingerprint(X, y, **args)
+
+
+def test_hash_frame_detects_changes(sample_data):
+    """
+    The data hash is stable for identical data and changes when a value changes.
+    """
+    X, _ = sample_data
+    changed = X.copy()
+    changed.iloc[0, 0] += 1
+    assert hash_frame(X) == hash_frame(X.copy())
+    assert hash_frame(X) != hash_frame(changed)
+
+
+def test_fingerprint_depends_on_inputs(sample_data):
+    """
+    The fingerprint changes with the seed, scorer settings and parameter distribution.
+    """
+    X, y = sample_data
+    base = _fingerprint(X, y)
+    assert base == _fingerprint(X, y)
+    assert base != _fingerprint(X, y, seed=1)
+    assert base != _fingerprint(X, y, beta=1)
+    assert base != _fingerprint(X, y, param_dist={'logisticregression__C': [0.1, 10.0]})
+    assert base != _fingerprint(X, y, model=LogisticRegression(random_state=1))
+
+
+def test_load_missing_entry_returns_none(tmp_path):
+    """
+    Looking up a key that was never stored returns None.
+    """
+    assert load_search(tmp_path, "missing") is None
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    """
+    A stored object is returned unchanged.
+    """
+    save_search(tmp_path, "abc", {"best_score_": 0.5})
+    assert load_search(tmp_path, "abc") == {"best_score_": 0.5}
+
+
+def test_tune_hyperparameters_reuses_cache(sample_data, tmp_path):
+    """
+    A second call with unchanged inputs returns the cached search without refitting.
+    """
+    X, y = sample_data
+    param_dist = {'logisticregression__C': [0.1, 1.0]}
+    first = tune_hyperparameters(X, y, LogisticRegression(random_state=42), StandardScaler(), param_dist,
+                                 pos_label=1, beta=2, seed=42, cache_dir=tmp_path)
+    assert len(os.listdir(tmp_path)) == 1
+
+    second = tune_hyperparameters(X, y, LogisticRegression(random_state=42), StandardScaler(), param_dist,
+                                  pos_label=1, beta=2, seed=42, cache_dir=tmp_path)
+    assert second.best_score_ == first.best_score_
+    assert second.refit_time_ == first.refit_time_
+    np.testing.assert_array_equal(second.cv_results_['mean_test_score'], first.cv_results_['mean_test_score'])
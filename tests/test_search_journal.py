@@ -0,0 +1,120 @@
+import sys
+import os
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from unittest import mock
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+from sklearn.pipeline import make_pipeline
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import utils.search_journal
+from utils.search_journal import SearchJournal, journaled_search
+from utils.optimal_hyperparameters import tune_hyperparameters
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a small synthetic binary classification dataset.
+    """
+    X, y = make_classification(n_samples=100, n_features=5, n_classes=2, random_state=42)
+    return pd.DataFrame(X, columns=[f'feature_{i}' for i in range(5)]), pd.Series(y)
+
+
+PARAM_DIST = {'logisticregression__C': [0.01, 0.1, 1.0, 10.0]}
+
+
+def _search(X, y, journal, n_jobs=1):
+    return journaled_search(X, y, make_pipeline(StandardScaler(), LogisticRegression()), PARAM_DIST,
+                            pos_label=1, beta=2, seed=0, journal=journal, search_key="key", model_name="LR",
+                            n_jobs=n_jobs)
+
+
+def test_journal_records_every_candidate_and_fold(sample_data, tmp_path):
+    """
+    Each (candidate, fold) evaluation is written as one JSON line.
+    """
+    X, y = sample_data
+    journal = SearchJournal(str(tmp_path / "journal.jsonl"))
+    _search(X, y, journal)
+    with open(journal.path) as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == 4 * 5
+    assert {(r["candidate"], r["fold"]) for r in records} == {(i, k) for i in range(4) for k in range(5)}
+    assert all(r["model"] == "LR" and r["search"] == "key" for r in records)
+
+
+def test_journaled_search_matches_randomized_search(sample_data, tmp_path):
+    """
+    The journaled search gives the same candidates and scores as RandomizedSearchCV.
+    """
+    X, y = sample_data
+    expected = tune_hyperparameters(X, y, LogisticRegression(), StandardScaler(), PARAM_DIST, pos_label=1, beta=2, seed=0)
+    result = _search(X, y, SearchJournal(str(tmp_path / "journal.jsonl")), n_jobs=2)
+    assert result.cv_results_['params'] == expected.cv_results_['params']
+    np.testing.assert_allclose(result.cv_results_['mean_test_score'], expected.cv_results_['mean_test_score'])
+
+
+def test_resume_skips_finished_evaluations(sample_data, tmp_path):
+    """
+    After an interruption, a resumed search only fits the evaluations missing from the journal.
+    """
+    X, y = sample_data
+    path = str(tmp_path / "journal.jsonl")
+    original = utils.search_journal.fit_and_score
+    calls = []
+
+    def interrupted(*args):
+        if len(calls) == 7:
+            raise KeyboardInterrupt
+        calls.append(args)
+        return original(*args)
+
+    with mock.patch("utils.search_journal.fit_and_score", side_effect=interrupted):
+        with pytest.raises(KeyboardInterrupt):
+            _search(X, y, SearchJournal(path))
+    assert len(SearchJournal(path, resume=True).completed("key")) == 7
+
+    with mock.patch("utils.search_journal.fit_and_score", side_effect=original) as resumed:
+        result = _search(X, y, SearchJournal(path, resume=True))
+    assert resumed.call_count == 20 - 7
+    assert len(SearchJournal(path, resume=True).completed("key")) == 20
+    assert not np.isnan(result.cv_results_['mean_test_score']).any()
+
+
+def test_new_journal_moves_old_entries_aside(sample_data, tmp_path):
+    """
+    Without resume, an existing journal is renamed rather than deleted and a new one is started.
+    """
+    path = str(tmp_path / "journal.jsonl")
+    SearchJournal(path).append({"search": "key", "candidate": 0, "fold": 0})
+    assert len(SearchJournal(path, resume=True).completed("key")) == 1
+    journal = SearchJournal(path)
+    assert journal.completed("key") == {}
+    assert len(SearchJournal(journal.previous, resume=True).completed("key")) == 1
+    assert SearchJournal(path).previous != journal.previous
+
+
+def test_truncated_line_is_ignored(tmp_path):
+    """
+    A partially written last line (from a crash mid-write) is skipped.
+    """
+    path = tmp_path / "journal.jsonl"
+    path.write_text(json.dumps({"search": "key", "candidate": 0, "fold": 1}) + "\n" + '{"search": "ke')
+    assert list(SearchJournal(str(path), resume=True).completed("key")) == [(0, 1)]
+
+
+def test_append_after_truncated_line_starts_new_line(tmp_path):
+    """
+    A record appended after a crash mid-write is not glued onto the partial line and survives a resume.
+    """
+    path = tmp_path / "journal.jsonl"
+    path.write_text(json.dumps({"search": "key", "candidate": 0, "fold": 1}) + "\n" + '{"search": "ke')
+    journal = SearchJournal(str(path), resume=True)
+    journal.append({"search": "key", "candidate": 0, "fold": 2})
+    journal.append({"search": "key", "candidate": 0, "fold": 3})
+    assert sorted(SearchJournal(str(path), resume=True).completed("key")) == [(0, 1), (0, 2), (0, 3)]
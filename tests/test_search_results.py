@@ -0,0 +1,53 @@
+import sys
+import os
+import numpy as np
+import pytest
+import pandas as pd
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+from sklearn.pipeline import make_pipeline
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.search_results import build_search_result, SearchResult
+
+
+def _build(test_scores):
+    X, y = make_classification(n_samples=60, n_features=4, random_state=0)
+    candidates = [{'logisticregression__C': c} for c in (0.1, 1.0, 10.0)]
+    train_scores = np.ones((3, 2))
+    times = np.full((3, 2), 0.01)
+    return build_search_result(candidates, test_scores, train_scores, times, times,
+                               make_pipeline(StandardScaler(), LogisticRegression()), pd.DataFrame(X), pd.Series(y))
+
+
+def test_build_search_result_table():
+    """
+    The cv_results_ table has the per-split, mean, std and rank columns of a scikit-learn search.
+    """
+    result = _build([[0.5, 0.7], [0.9, 0.8], [0.9, 0.8]])
+    assert isinstance(result, SearchResult)
+    np.testing.assert_allclose(result.cv_results_['mean_test_score'], [0.6, 0.85, 0.85])
+    np.testing.assert_allclose(result.cv_results_['split1_test_score'], [0.7, 0.8, 0.8])
+    assert list(result.cv_results_['rank_test_score']) == [3, 1, 1]
+    assert list(result.cv_results_['param_logisticregression__C']) == [0.1, 1.0, 10.0]
+
+
+def test_build_search_result_best_candidate():
+    """
+    Ties go to the first candidate and the best estimator is refitted with its parameters.
+    """
+    result = _build([[0.5, 0.7], [0.9, 0.8], [0.9, 0.8]])
+    assert result.best_index_ == 1
+    assert result.best_score_ == pytest.approx(0.85)
+    assert result.best_params_ == {'logisticregression__C': 1.0}
+    assert result.best_estimator_.named_steps['logisticregression'].C == 1.0
+
+
+def test_build_search_result_nan_ranks_last():
+    """
+    Candidates whose scores failed (nan) are ranked last.
+    """
+    result = _build([[np.nan, 0.7], [0.1, 0.2], [0.3, 0.2]])
+    assert result.cv_results_['rank_test_score'][0] == 3
+    assert result.best_index_ == 2
@@ -0,0 +1,109 @@
+import sys
+import os
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import make_column_transformer
+from sklearn.datasets import make_classification
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.batch_predict import predict_csv
+from utils.sharded_predict import byte_range_shards, predict_csv_sharded
+
+
+@pytest.fixture
+def model_and_csv(tmp_path):
+    """
+    A pickled pipeline and a CSV of rows to score, with an id column.
+    """
+    X, y = make_classification(n_samples=300, n_features=3, n_informative=2, n_redundant=0, random_state=1)
+    df = pd.DataFrame(X, columns=["a", "b", "c"])
+    df.insert(0, "patient_id", np.arange(300))
+    labels = np.where(y == 1, "Heart Disease", "No Heart Disease")
+    model = make_pipeline(make_column_transformer((StandardScaler(), ["a", "b", "c"])), SVC()).fit(df, labels)
+    model_path, input_path = tmp_path / "model.pickle", tmp_path / "in.csv"
+    with open(model_path, "wb") as f:
+        pickle.dump(model, f)
+    df.to_csv(input_path, index=False)
+    return str(model_path), str(input_path)
+
+
+@pytest.mark.parametrize("n_shards", [1, 3, 7, 1000])
+def test_shards_split_on_line_boundaries(model_and_csv, n_shards):
+    """
+    The ranges are contiguous, start on line starts and together hold every data line once.
+    """
+    _, input_path = model_and_csv
+    header, shards = byte_range_shards(input_path, n_shards)
+    with open(input_path, "rb") as f:
+        content = f.read()
+
+    assert content.startswith(header) and len(shards) == n_shards
+    assert shards[0][0] == len(header) and shards[-1][1] == len(content)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(shards, shards[1:]))
+    assert all(start == len(header) or content[start - 1:start] == b"\n" for start, _ in shards)
+    assert b"".join(content[start:end] for start, end in shards) == content[len(header):]
+
+
+def test_sharded_output_matches_single_process(model_and_csv, tmp_path):
+    """
+    Sharded scoring writes the same rows, in input order, as the single-process chunked path.
+    """
+    model_path, input_path = model_and_csv
+    with open(model_path, "rb") as f:
+        model = pickle.load(f)
+    predict_csv(model, input_path, str(tmp_path / "single.csv"), chunksize=40, id_col="patient_id", scores=True,
+                pos_label="Heart Disease")
+    stats = predict_csv_sharded(model_path, input_path, str(tmp_path / "sharded.csv"), n_workers=2, n_shards=5,
+                                chunksize=40, id_col="patient_id", scores=True, pos_label="Heart Disease")
+
+    assert stats["rows"] == 300 and stats["shards"] == 5
+    assert (tmp_path / "single.csv").read_bytes() == (tmp_path / "sharded.csv").read_bytes()
+    assert not [p for p in os.listdir(tmp_path) if ".part" in p]
+
+
+def test_more_shards_than_rows(model_and_csv, tmp_path):
+    """
+    Empty shards are skipped and the header is written once.
+    """
+    model_path, input_path = model_and_csv
+    small_path = tmp_path / "small.csv"
+    pd.read_csv(input_path).head(3).to_csv(small_path, index=False)
+    predict_csv_sharded(model_path, str(small_path), str(tmp_path / "out.csv"), n_workers=2, n_shards=10)
+
+    out = pd.read_csv(tmp_path / "out.csv")
+    assert list(out.columns) == ["prediction"] and len(out) == 3
+
+
+def test_header_only_input_writes_header(model_and_csv, tmp_path):
+    """
+    An input without data rows gives a header-only output, the same as the single-process path.
+    """
+    model_path, input_path = model_and_csv
+    empty_path = tmp_path / "empty.csv"
+    pd.read_csv(input_path).head(0).to_csv(empty_path, index=False)
+    with open(model_path, "rb") as f:
+        model = pickle.load(f)
+    predict_csv(model, str(empty_path), str(tmp_path / "single.csv"), id_col="patient_id", scores=True,
+                pos_label="Heart Disease")
+    stats = predict_csv_sharded(model_path, str(empty_path), str(tmp_path / "sharded.csv"), n_workers=2, n_shards=3,
+                                id_col="patient_id", scores=True, pos_label="Heart Disease")
+
+    assert stats["rows"] == 0
+    assert (tmp_path / "sharded.csv").read_text() == "patient_id,prediction,score\n"
+    assert (tmp_path / "single.csv").read_bytes() == (tmp_path / "sharded.csv").read_bytes()
+
+
+def test_invalid_worker_count(model_and_csv, tmp_path):
+    """
+    -1 uses all CPUs like the other scripts; other negative worker counts are rejected.
+    """
+    model_path, input_path = model_and_csv
+    stats = predict_csv_sharded(model_path, input_path, str(tmp_path / "all.csv"), n_workers=-1, n_shards=2)
+    assert stats["rows"] == 300
+    with pytest.raises(ValueError):
+        predict_csv_sharded(model_path, input_path, str(tmp_path / "bad.csv"), n_workers=-2)
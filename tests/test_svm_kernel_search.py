@@ -0,0 +1,101 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.svm_kernel_search import tune_svm_kernel_reuse
+from utils.optimal_hyperparameters import tune_hyperparameters
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a small synthetic binary classification dataset.
+    """
+    X, y = make_classification(n_samples=120, n_features=5, n_classes=2, random_state=42)
+    return pd.DataFrame(X, columns=[f'feature_{i}' for i in range(5)]), pd.Series(y)
+
+
+@pytest.fixture
+def svm_param_dist():
+    """
+    The C x gamma grid used for the SVM in utils.models.get_param_dist.
+    """
+    return {"svc__C": 10.0 ** np.arange(-3, 2, 1), "svc__gamma": 10.0 ** np.arange(-3, 2, 1)}
+
+
+def test_kernel_reuse_matches_randomized_search(sample_data, svm_param_dist):
+    """
+    Kernel reuse evaluates the same candidates as RandomizedSearchCV and gives the same scores.
+    """
+    X, y = sample_data
+    expected = tune_hyperparameters(X, y, SVC(random_state=0), StandardScaler(), svm_param_dist,
+                                    pos_label=1, beta=2, seed=123)
+    result = tune_svm_kernel_reuse(X, y, SVC(random_state=0), StandardScaler(), svm_param_dist,
+                                   pos_label=1, beta=2, seed=123)
+    assert result.cv_results_['params'] == expected.cv_results_['params']
+    np.testing.assert_allclose(result.cv_results_['mean_test_score'], expected.cv_results_['mean_test_score'])
+    np.testing.assert_allclose(result.cv_results_['mean_train_score'], expected.cv_results_['mean_train_score'])
+    assert result.best_params_ == expected.best_params_
+
+
+def test_kernel_reuse_refits_rbf_pipeline(sample_data, svm_param_dist):
+    """
+    The best estimator is a regular rbf pipeline, not a precomputed-kernel SVC.
+    """
+    X, y = sample_data
+    result = tune_svm_kernel_reuse(X, y, SVC(), StandardScaler(), svm_param_dist, pos_label=1, beta=2, seed=1)
+    svc = result.best_estimator_.named_steps['svc']
+    assert svc.kernel == 'rbf'
+    assert svc.gamma == result.best_params_['svc__gamma']
+    assert result.best_estimator_.predict(X).shape == y.shape
+
+
+def test_kernel_reuse_scale_gamma(sample_data):
+    """
+    gamma="scale" is resolved per fold as in SVC.
+    """
+    X, y = sample_data
+    param_dist = {"svc__C": [0.1, 1.0], "svc__gamma": ["scale"]}
+    expected = tune_hyperparameters(X, y, SVC(), StandardScaler(), param_dist, pos_label=1, beta=2, seed=0)
+    result = tune_svm_kernel_reuse(X, y, SVC(), StandardScaler(), param_dist, pos_label=1, beta=2, seed=0)
+    np.testing.assert_allclose(result.cv_results_['mean_test_score'], expected.cv_results_['mean_test_score'])
+
+
+def test_path_search_dispatches_to_kernel_reuse(sample_data, svm_param_dist):
+    """
+    search="path" uses kernel reuse for SVC models.
+    """
+    X, y = sample_data
+    result = tune_hyperparameters(X, y, SVC(), StandardScaler(), svm_param_dist, pos_label=1, beta=2, seed=1,
+                                  search="path")
+    assert result.best_estimator_.named_steps['svc'].kernel == 'rbf'
+    assert len(result.cv_results_['params']) == 10
+
+
+def test_kernel_reuse_rejects_other_kernels(sample_data, svm_param_dist):
+    """
+    Non-rbf SVCs and parameters other than C and gamma raise a ValueError.
+    """
+    X, y = sample_data
+    with pytest.raises(ValueError):
+        tune_svm_kernel_reuse(X, y, SVC(kernel='linear'), StandardScaler(), svm_param_dist, pos_label=1, beta=2, seed=0)
+    with pytest.raises(ValueError):
+        tune_svm_kernel_reuse(X, y, SVC(), StandardScaler(), {"svc__degree": [2, 3]}, pos_label=1, beta=2, seed=0)
+
+
+def test_kernel_reuse_parallel_folds_match_serial(sample_data, svm_param_dist):
+    """
+    Scoring the folds with several workers gives the same results as one worker.
+    """
+    X, y = sample_data
+    serial = tune_svm_kernel_reuse(X, y, SVC(), StandardScaler(), svm_param_dist, pos_label=1, beta=2, seed=3)
+    parallel = tune_svm_kernel_reuse(X, y, SVC(), StandardScaler(), svm_param_dist, pos_label=1, beta=2, seed=3,
+                                     n_jobs=2)
+    np.testing.assert_array_equal(parallel.cv_results_['mean_test_score'], serial.cv_results_['mean_test_score'])
+    np.testing.assert_array_equal(parallel.cv_results_['split4_train_score'], serial.cv_results_['split4_train_score'])
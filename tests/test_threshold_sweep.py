@@ -0,0 +1,82 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import fbeta_score, precision_score, recall_score
+from sklearn.svm import SVC
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.threshold_sweep import positive_scores, out_of_fold_scores, threshold_curve, best_threshold
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a small labelled binary dataset with heart disease style string labels.
+    """
+    X, y = make_classification(n_samples=120, n_features=5, random_state=0)
+    labels = np.where(y == 1, "No Heart Disease", "Heart Disease")
+    return pd.DataFrame(X, columns=[f'feature_{i}' for i in range(5)]), pd.Series(labels)
+
+
+def test_curve_matches_sklearn_at_every_threshold():
+    """
+    Each row of the curve equals the sklearn metrics of thresholding at that value, including tied scores.
+    """
+    rng = np.random.default_rng(0)
+    y = rng.choice(["Heart Disease", "No Heart Disease"], size=80)
+    scores = np.round(rng.normal(size=80), 1)
+    curve = threshold_curve(y, scores, "Heart Disease", beta=2)
+
+    assert curve["Threshold"].is_monotonic_decreasing
+    assert len(curve) == len(np.unique(scores))
+    for _, row in curve.iterrows():
+        y_pred = np.where(scores >= row["Threshold"], "Heart Disease", "No Heart Disease")
+        assert row["F2 Score"] == pytest.approx(fbeta_score(y, y_pred, beta=2, pos_label="Heart Disease"))
+        assert row["Recall"] == pytest.approx(recall_score(y, y_pred, pos_label="Heart Disease"))
+        assert row["Precision"] == pytest.approx(precision_score(y, y_pred, pos_label="Heart Disease"))
+
+
+def test_best_threshold_prefers_highest_on_ties():
+    """
+    The best row has the maximal F-beta and, among ties, the highest threshold.
+    """
+    curve = threshold_curve([1, 1, 0, 0], [0.9, 0.8, 0.3, 0.1], pos_label=1, beta=1)
+    best = best_threshold(curve)
+    assert best["F1 Score"] == 1.0
+    assert best["Threshold"] == 0.8
+
+
+@pytest.mark.parametrize("model", [SVC(), LogisticRegression()])
+def test_positive_scores_point_to_pos_label(sample_data, model):
+    """
+    Scores are oriented so that larger means pos_label, whichever class sorts first.
+    """
+    X, y = sample_data
+    model.fit(X, y)
+    scores = positive_scores(model, X, "Heart Disease")
+    predicted = model.predict(X) == "Heart Disease"
+    assert scores[predicted].mean() > scores[~predicted].mean()
+
+
+def test_out_of_fold_scores_shape(sample_data):
+    """
+    Out-of-fold scores cover every training row.
+    """
+    X, y = sample_data
+    scores = out_of_fold_scores(SVC(), X, y, "Heart Disease", cv=3)
+    assert scores.shape == (len(y),)
+
+
+def test_invalid_inputs():
+    """
+    Mismatched lengths and unknown labels are rejected.
+    """
+    with pytest.raises(ValueError):
+        threshold_curve([1, 0], [0.5], pos_label=1)
+    model = LogisticRegression().fit([[0], [1]], ["a", "b"])
+    with pytest.raises(ValueError):
+        positive_scores(model, [[0.5]], "c")
@@ -0,0 +1,90 @@
+import sys
+import os
+import pandas as pd
+import numpy as np
+from sklearn import config_context
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.preprocessing import StandardScaler
+from sklearn.pipeline import make_pipeline
+from sklearn.model_selection import cross_validate
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.transform_cache import TransformCache, transform_fold
+from utils.optimal_hyperparameters import tune_hyperparameters
+
+
+def _data():
+    X, y = make_classification(n_samples=100, n_features=5, n_classes=2, random_state=42)
+    return pd.DataFrame(X, columns=[f'feature_{i}' for i in range(5)]), pd.Series(y)
+
+
+def test_transform_cache_counts_hits_and_misses(tmp_path):
+    """
+    Fitting two models on the same folds fits the preprocessor once per fold.
+    """
+    X, y = _data()
+    cache = TransformCache(str(tmp_path))
+    for model in [LogisticRegression(), DecisionTreeClassifier(random_state=0)]:
+        cross_validate(make_pipeline(StandardScaler(), model, memory=cache), X, y, cv=3)
+    assert cache.stats() == {"hits": 3, "misses": 3}
+
+
+def test_transform_cache_stats_are_per_instance(tmp_path):
+    """
+    A new cache object on the same directory reuses the transforms but starts its counters at zero.
+    """
+    X, y = _data()
+    cross_validate(make_pipeline(StandardScaler(), LogisticRegression(), memory=TransformCache(str(tmp_path))), X, y, cv=3)
+    cache = TransformCache(str(tmp_path))
+    assert cache.stats() == {"hits": 0, "misses": 0}
+    cross_validate(make_pipeline(StandardScaler(), LogisticRegression(), memory=cache), X, y, cv=3)
+    assert cache.stats() == {"hits": 3, "misses": 0}
+
+
+def test_transform_cache_does_not_change_scores(tmp_path):
+    """
+    Cached and uncached searches give identical cross-validation scores.
+    """
+    X, y = _data()
+    param_dist = {'logisticregression__C': [0.1, 1.0, 10.0]}
+    plain = tune_hyperparameters(X, y, LogisticRegression(random_state=42), StandardScaler(), param_dist,
+                                 pos_label=1, beta=2, seed=42)
+    cache = TransformCache(str(tmp_path))
+    cached = tune_hyperparameters(X, y, LogisticRegression(random_state=42), StandardScaler(), param_dist,
+                                  pos_label=1, beta=2, seed=42, memory=cache)
+    np.testing.assert_allclose(cached.cv_results_['mean_test_score'], plain.cv_results_['mean_test_score'])
+    assert cache.stats()["hits"] > 0
+
+
+def test_transform_fold_shares_entries_with_pipelines(tmp_path):
+    """
+    A fold transformed for a specialised tuner is a cache hit for a pipeline trained on the same fold.
+    """
+    X, y = _data()
+    cache = TransformCache(str(tmp_path))
+    Xt_train, _ = transform_fold(StandardScaler(), X.iloc[:70], X.iloc[70:], y.iloc[:70], cache)
+    make_pipeline(StandardScaler(), LogisticRegression(), memory=cache).fit(X.iloc[:70], y.iloc[:70])
+    assert cache.stats() == {"hits": 1, "misses": 1}
+    np.testing.assert_allclose(Xt_train, StandardScaler().fit_transform(X.iloc[:70]))
+
+
+def test_transform_cache_keys_on_transform_output(tmp_path):
+    """
+    Transforms cached with numpy output are not served to a run with pandas output, and vice versa.
+    """
+    X, y = _data()
+    cache = TransformCache(str(tmp_path))
+    pipeline = make_pipeline(StandardScaler(), LogisticRegression(), memory=cache)
+    with config_context(transform_output="default"):
+        pipeline.fit(X, y)
+    with config_context(transform_output="pandas"):
+        pipeline.fit(X, y)
+        # the model was trained on a DataFrame, not on the cached ndarray
+        assert list(pipeline[-1].feature_names_in_) == list(X.columns)
+        transform_fold(StandardScaler(), X, X, y, cache)
+    with config_context(transform_output="default"):
+        pipeline.fit(X, y)
+        assert not hasattr(pipeline[-1], "feature_names_in_")
+    assert cache.stats() == {"hits": 2, "misses": 2}
@@ -0,0 +1,108 @@
+import sys
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.tree_depth_search import predict_by_depth, tune_tree_depth
+from utils.optimal_hyperparameters import tune_hyperparameters
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a small synthetic binary classification dataset.
+    """
+    X, y = make_classification(n_samples=200, n_features=5, n_classes=2, random_state=42)
+    return pd.DataFrame(X, columns=[f'feature_{i}' for i in range(5)]), pd.Series(y)
+
+
+def test_predict_by_depth_full_depth_matches_predict(sample_data):
+    """
+    At (or beyond) the grown depth, truncated predictions equal the tree's own predictions.
+    """
+    X, y = sample_data
+    tree = DecisionTreeClassifier(max_depth=6, random_state=0).fit(X.values, y)
+    predictions = predict_by_depth(tree, X.values, [6, 20])
+    np.testing.assert_array_equal(predictions[6], tree.predict(X.values))
+    np.testing.assert_array_equal(predictions[20], tree.predict(X.values))
+
+
+def test_predict_by_depth_stump_matches_depth_one_tree(sample_data):
+    """
+    Truncating at depth one gives the same predictions as a tree grown with max_depth=1.
+    """
+    X, y = sample_data
+    tree = DecisionTreeClassifier(max_depth=8, random_state=0).fit(X.values, y)
+    stump = DecisionTreeClassifier(max_depth=1, random_state=0).fit(X.values, y)
+    np.testing.assert_array_equal(predict_by_depth(tree, X.values, [1])[1], stump.predict(X.values))
+
+
+def test_predict_by_depth_root_is_majority_class():
+    """
+    Depth zero predicts the majority class for every sample.
+    """
+    X = np.arange(10).reshape(-1, 1)
+    y = np.array(["a"] * 7 + ["b"] * 3)
+    tree = DecisionTreeClassifier(random_state=0).fit(X, y)
+    assert set(predict_by_depth(tree, X, [0])[0]) == {"a"}
+
+
+def test_tree_depth_close_to_randomized_search(sample_data):
+    """
+    The depth sweep evaluates the same candidates as RandomizedSearchCV with near-identical scores.
+    """
+    X, y = sample_data
+    param_dist = {'decisiontreeclassifier__max_depth': np.arange(1, 11)}
+    expected = tune_hyperparameters(X, y, DecisionTreeClassifier(random_state=0), StandardScaler(), param_dist,
+                                    pos_label=1, beta=2, seed=123)
+    result = tune_tree_depth(X, y, DecisionTreeClassifier(random_state=0), StandardScaler(), param_dist,
+                             pos_label=1, beta=2, seed=123)
+    assert result.cv_results_['params'] == expected.cv_results_['params']
+    np.testing.assert_allclose(result.cv_results_['mean_test_score'], expected.cv_results_['mean_test_score'], atol=0.01)
+    depth_one = [i for i, p in enumerate(result.cv_results_['params']) if p['decisiontreeclassifier__max_depth'] == 1]
+    np.testing.assert_allclose(result.cv_results_['mean_test_score'][depth_one],
+                               expected.cv_results_['mean_test_score'][depth_one])
+
+
+def test_path_search_dispatches_to_tree_depth(sample_data):
+    """
+    search="path" uses the depth sweep for decision trees and refits a normal tree.
+    """
+    X, y = sample_data
+    result = tune_hyperparameters(X, y, DecisionTreeClassifier(random_state=0), StandardScaler(),
+                                  {'decisiontreeclassifier__max_depth': [2, 4]}, pos_label=1, beta=2, seed=0,
+                                  search="path")
+    tree = result.best_estimator_.named_steps['decisiontreeclassifier']
+    assert tree.max_depth == result.best_params_['decisiontreeclassifier__max_depth']
+
+
+def test_tree_depth_rejects_other_params(sample_data):
+    """
+    Parameters other than max_depth, or unlimited depth, raise a ValueError.
+    """
+    X, y = sample_data
+    with pytest.raises(ValueError):
+        tune_tree_depth(X, y, DecisionTreeClassifier(), StandardScaler(),
+                        {'decisiontreeclassifier__min_samples_leaf': [1, 2]}, pos_label=1, beta=2, seed=0)
+    with pytest.raises(ValueError):
+        tune_tree_depth(X, y, DecisionTreeClassifier(), StandardScaler(),
+                        {'decisiontreeclassifier__max_depth': [None, 3]}, pos_label=1, beta=2, seed=0)
+
+
+def test_tree_depth_parallel_folds_match_serial(sample_data):
+    """
+    Scoring the folds with several workers gives the same results as one worker.
+    """
+    X, y = sample_data
+    param_dist = {'decisiontreeclassifier__max_depth': np.arange(1, 11)}
+    serial = tune_tree_depth(X, y, DecisionTreeClassifier(random_state=0), StandardScaler(), param_dist,
+                             pos_label=1, beta=2, seed=3)
+    parallel = tune_tree_depth(X, y, DecisionTreeClassifier(random_state=0), StandardScaler(), param_dist,
+                               pos_label=1, beta=2, seed=3, n_jobs=2)
+    np.testing.assert_array_equal(parallel.cv_results_['mean_test_score'], serial.cv_results_['mean_test_score'])
+    np.testing.assert_array_equal(parallel.cv_results_['split4_train_score'], serial.cv_results_['split4_train_score'])
@@ -0,0 +1,149 @@
+import json
+import os
+import pickle
+import struct
+
+import numpy as np
+
+from utils.numpy_scorer import NumpyScorer, export_numpy_scorer
+
+ARTIFACT_SUFFIX = ".artifact"
+MAGIC = b"HDARTIF1"
+FORMAT_VERSION = 1
+# array blocks start on cache-line (and SIMD) aligned offsets
+ALIGNMENT = 64
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write_arrays(path, arrays, meta):
+    """
+    Write named arrays as aligned raw blocks behind a small JSON header.
+
+    The file is ``MAGIC``, the header length as a little-endian uint64, the
+    UTF-8 JSON header (format version, ``meta`` and the dtype, shape and byte
+    offset of every array) and then the array blocks, each starting on a
+    64-byte boundary. The blocks hold the raw C-ordered array bytes, so they
+    can be memory-mapped without parsing or copying.
+
+    Parameters
+    ----------
+    path : str
+        File to write; it is replaced atomically.
+    arrays : dict
+        Mapping of name to numpy array (numeric or boolean dtypes only).
+    meta : dict
+        JSON-serialisable metadata stored in the header.
+    """
+    layout = {}
+    blocks = []
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        if array.dtype.hasobject or array.dtype.kind in "USV":
+            raise ValueError(f"Array {name!r} has dtype {array.dtype}, only numeric arrays can be stored")
+        offset = _aligned(offset)
+        layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        blocks.append((offset, array))
+        offset += array.nbytes
+
+    header = json.dumps({"format_version": FORMAT_VERSION, "meta": meta, "arrays": layout}).encode()
+    data_start = _aligned(len(MAGIC) + 8 + len(header))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC + struct.pack("<Q", len(header)) + header)
+        for block_offset, array in blocks:
+            f.seek(data_start + block_offset)
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+def read_arrays(path, mmap=True):
+    """
+    Read a file written by ``write_arrays``.
+
+    Parameters
+    ----------
+    path : str
+        File to read.
+    mmap : bool, optional
+        Map the file read-only and return views into it, by default True. The
+        pages are shared by every process mapping the same file and are only
+        read from disk when touched. With False the arrays are read into
+        private memory.
+
+    Returns
+    -------
+    tuple of (dict, dict)
+        The arrays by name and the stored metadata.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a model artifact")
+        (header_len,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_len))
+    if header["format_version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported artifact format version {header['format_version']}")
+
+    data_start = _aligned(len(MAGIC) + 8 + header_len)
+    if mmap:
+        buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    else:
+        buffer = np.fromfile(path, dtype=np.uint8)
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        start = data_start + spec["offset"]
+        nbytes = dtype.itemsize * int(np.prod(spec["shape"], dtype=np.int64))
+        arrays[name] = buffer[start:start + nbytes].view(dtype).reshape(spec["shape"])
+    return arrays, header["meta"]
+
+
+def save_artifact(model, path):
+    """
+    Save a fitted pipeline (or NumpyScorer) as a memory-mappable artifact.
+
+    Parameters
+    ----------
+    model : sklearn.pipeline.Pipeline or NumpyScorer
+        Fitted pipeline supported by ``export_numpy_scorer``, or an exported scorer.
+    path : str
+        File to write, conventionally ending in ``ARTIFACT_SUFFIX``.
+    """
+    scorer = model if isinstance(model, NumpyScorer) else export_numpy_scorer(model)
+    arrays, meta = scorer.to_arrays()
+    write_arrays(path, arrays, meta)
+
+
+def load_artifact(path, mmap=True):
+    """
+    Load a NumpyScorer from an artifact written by ``save_artifact``.
+
+    Parameters
+    ----------
+    path : str
+        Artifact file.
+    mmap : bool, optional
+        Share the fitted arrays between processes through a read-only memory
+        map, by default True.
+
+    Returns
+    -------
+    NumpyScorer
+        Scorer with ``predict`` and ``decision_function``.
+    """
+    arrays, meta = read_arrays(path, mmap=mmap)
+    return NumpyScorer.from_arrays(arrays, meta)
+
+
+def load_model(path):
+    """
+    Load a model for scoring: an artifact if ``path`` ends in ``ARTIFACT_SUFFIX``, otherwise a pickle.
+    """
+    if str(path).endswith(ARTIFACT_SUFFIX):
+        return load_artifact(path)
+    with open(path, "rb") as f:
+        return pickle.load(f)
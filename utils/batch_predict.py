@@ -0,0 +1,107 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.threshold_sweep import positive_scores
+
+
+def output_columns(scores=False, id_col=None, **kwargs):
+    """
+    Columns ``predict_frame`` returns for the given options (other ``predict_frame`` options are ignored).
+    """
+    return ([id_col] if id_col is not None else []) + ["prediction"] + (["score"] if scores else [])
+
+
+def predict_frame(model, X, scores=False, pos_label=None, threshold=None, id_col=None):
+    """
+    Predict one chunk of rows and return the output columns.
+
+    Parameters
+    ----------
+    model :
+        Fitted classifier or pipeline.
+    X : pandas.DataFrame
+        Rows to score, with the columns the model was trained on; extra
+        columns the preprocessor does not select (e.g. the target) are ignored.
+    scores : bool, optional
+        Also return the continuous score for ``pos_label``, by default False.
+    pos_label : str or int, optional
+        Positive class label, needed for ``scores`` and ``threshold``.
+    threshold : float, optional
+        Predict ``pos_label`` when its score is at least this value instead of
+        using the model's default decision rule, by default None.
+    id_col : str, optional
+        Column copied to the output to identify rows, by default None.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Output rows with an optional id column, "prediction" and optionally "score".
+    """
+    if len(X) == 0:
+        # an input with only a header still gives an output with a header
+        return pd.DataFrame(columns=output_columns(scores, id_col))
+    out = pd.DataFrame(index=X.index)
+    if id_col is not None:
+        out[id_col] = X[id_col]
+    if scores or threshold is not None:
+        if pos_label is None:
+            raise ValueError("pos_label is needed for scores and thresholds")
+        score = positive_scores(model, X, pos_label)
+    if threshold is None:
+        out["prediction"] = model.predict(X)
+    else:
+        # the other class of a binary model is predicted below the threshold
+        negative = [c for c in model.classes_ if c != pos_label][0]
+        out["prediction"] = np.where(score >= threshold, pos_label, negative)
+    if scores:
+        out["score"] = score
+    return out
+
+
+def predict_csv(model, input_path, output_path, chunksize=10000, on_chunk=None, **kwargs):
+    """
+    Stream a CSV through a fitted model in fixed-size chunks.
+
+    Only one chunk is held in memory at a time; each chunk's predictions are
+    appended to the output CSV before the next chunk is read.
+
+    Parameters
+    ----------
+    model :
+        Fitted classifier or pipeline.
+    input_path : str
+        CSV with the feature columns.
+    output_path : str
+        CSV to write the predictions to.
+    chunksize : int, optional
+        Rows per chunk, by default 10000.
+    on_chunk : callable, optional
+        Called after each chunk with the number of rows written so far and
+        the seconds elapsed, by default None.
+    **kwargs
+        Passed to ``predict_frame`` (scores, pos_label, threshold, id_col).
+
+    Returns
+    -------
+    dict
+        Dictionary with "rows", "seconds" and "rows_per_s".
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    rows = 0
+    with open(output_path, "w", newline="") as f:
+        for chunk in pd.read_csv(input_path, chunksize=chunksize):
+            predict_frame(model, chunk, **kwargs).to_csv(f, header=rows == 0, index=False)
+            rows += len(chunk)
+            if on_chunk is not None:
+                on_chunk(rows, time.perf_counter() - start)
+    seconds = time.perf_counter() - start
+    return {"rows": rows, "seconds": seconds, "rows_per_s": rows / seconds if seconds > 0 else float("nan")}
@@ -0,0 +1,108 @@
+import multiprocessing
+import queue
+import sys
+import time
+import traceback
+import resource
+
+import numpy as np
+
+
+def make_synthetic_heart(df, n_rows, seed=123):
+    """
+    Scale the heart disease dataset up (or down) to a given number of rows.
+
+    Rows are resampled with replacement from ``df`` and given new, unique
+    patient ids, so the result passes the same validation schema and has the
+    same feature distributions as the original data.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Raw heart disease data; its first column is the patient id.
+    n_rows : int
+        Number of rows to generate.
+    seed : int, optional
+        Random seed for the resampling, by default 123.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Synthetic dataset with the columns of ``df``.
+    """
+    if n_rows < 1:
+        raise ValueError("n_rows must be at least 1")
+    rng = np.random.default_rng(seed)
+    sample = df.iloc[rng.integers(0, len(df), size=n_rows)].reset_index(drop=True)
+    sample[df.columns[0]] = np.arange(1, n_rows + 1)
+    return sample
+
+
+def _peak_rss_mb(who=resource.RUSAGE_SELF):
+    """
+    Peak resident set size in megabytes of the current process, or with
+    ``resource.RUSAGE_CHILDREN`` of the largest of its exited and reaped children.
+    """
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _measured_child(results, func, args, kwargs):
+    start = time.perf_counter()
+    try:
+        func(*args, **kwargs)
+        error = None
+    except BaseException:
+        error = traceback.format_exc(limit=3)
+    wall_time = time.perf_counter() - start
+    # joblib keeps its worker processes alive for reuse; stop them so they are reaped and counted
+    from joblib.externals.loky import get_reusable_executor
+    get_reusable_executor().shutdown(wait=True)
+    results.put({"wall_time_s": wall_time, "peak_rss_mb": _peak_rss_mb(),
+                 "peak_rss_children_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN), "error": error})
+
+
+def run_measured(func, *args, timeout=None, **kwargs):
+    """
+    Run a function in a fresh process and measure its wall time and peak memory.
+
+    A separate process keeps each measurement's peak RSS independent of
+    whatever ran before it. The peak of the process running ``func`` and the
+    largest peak among its own child processes (e.g. joblib workers) are
+    reported separately, as peak RSS cannot be summed over processes.
+
+    Parameters
+    ----------
+    func : callable
+        Module-level function to run (it is pickled into the child process).
+    *args
+        Positional arguments for ``func``.
+    timeout : float, optional
+        Seconds after which the run is stopped, by default no limit.
+    **kwargs
+        Keyword arguments for ``func``.
+
+    Returns
+    -------
+    dict
+        Dictionary with "status" ("ok", "error" or "timeout"), "wall_time_s",
+        "peak_rss_mb" (the process running ``func``), "peak_rss_children_mb"
+        (its largest child process, 0 if it started none) and "error"
+        (traceback text or None).
+    """
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_measured_child, args=(results, func, args, kwargs))
+    start = time.perf_counter()
+    process.start()
+    try:
+        measurement = results.get(timeout=timeout)
+    except queue.Empty:
+        process.terminate()
+        process.join()
+        return {"status": "timeout", "wall_time_s": time.perf_counter() - start, "peak_rss_mb": None,
+                "peak_rss_children_mb": None, "error": f"stopped after {timeout} seconds"}
+    process.join()
+    measurement["status"] = "ok" if measurement["error"] is None else "error"
+    return measurement
@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+
+# number of resampled indices drawn at once, which bounds the memory of the index matrix
+CHUNK_ELEMENTS = 2**22
+
+
+def _confusion_codes(y_true, y_pred, pos_label):
+    """
+    Encode each row as 2 * actual + predicted (0 = TN, 1 = FP, 2 = FN, 3 = TP).
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    if len(y_true) != len(y_pred):
+        raise ValueError("y_true and y_pred must have the same length")
+    if len(y_true) == 0:
+        raise ValueError("Cannot bootstrap an empty prediction vector")
+    return 2 * (y_true == pos_label).astype(np.int64) + (y_pred == pos_label).astype(np.int64)
+
+
+def bootstrap_confusion_counts(y_true, y_pred, pos_label, n_resamples=10000, seed=123):
+    """
+    Confusion counts of many bootstrap resamples of one prediction vector.
+
+    Each row is encoded as ``2 * actual + predicted`` (0 = TN, 1 = FP, 2 = FN,
+    3 = TP). A matrix of resampled row indices then gives the counts of every
+    resample with a single ``bincount``, without calling a metric per resample.
+
+    Parameters
+    ----------
+    y_true : array-like
+        True labels.
+    y_pred : array-like
+        Predicted labels, aligned with ``y_true``.
+    pos_label : str or int
+        Label of the positive class.
+    n_resamples : int, optional
+        Number of bootstrap resamples, by default 10000.
+    seed : int, optional
+        Random seed for the resampling, by default 123.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (n_resamples, 4) with the TN, FP, FN and TP count of each resample.
+    """
+    if n_resamples < 1:
+        raise ValueError("n_resamples must be at least 1")
+    codes = _confusion_codes(y_true, y_pred, pos_label)
+    n = len(codes)
+    rng = np.random.default_rng(seed)
+    counts = np.empty((n_resamples, 4), dtype=np.int64)
+    chunk = max(1, CHUNK_ELEMENTS // n)
+    for start in range(0, n_resamples, chunk):
+        stop = min(start + chunk, n_resamples)
+        resampled = codes[rng.integers(0, n, size=(stop - start, n))]
+        # offset each resample's codes so one bincount counts all of them separately
+        resampled += 4 * np.arange(stop - start)[:, None]
+        counts[start:stop] = np.bincount(resampled.ravel(), minlength=4 * (stop - start)).reshape(-1, 4)
+    return counts
+
+
+def scores_from_counts(counts, beta=2.0):
+    """
+    Precision, recall and F-beta from confusion counts, vectorized over rows.
+
+    Undefined ratios (no predicted or no actual positives) are scored as 0,
+    as ``fbeta_score`` does by default.
+
+    Parameters
+    ----------
+    counts : numpy.ndarray
+        Array of shape (n, 4) with TN, FP, FN and TP counts.
+    beta : float, optional
+        Beta parameter of the F-beta score, by default 2.0.
+
+    Returns
+    -------
+    dict
+        Dictionary with "fbeta", "recall" and "precision" arrays of length n.
+    """
+    counts = np.asarray(counts, dtype=float)
+    fp, fn, tp = counts[:, 1], counts[:, 2], counts[:, 3]
+    b2 = beta ** 2
+
+    def ratio(num, den):
+        return np.divide(num, den, out=np.zeros_like(num), where=den > 0)
+
+    return {
+        "fbeta": ratio((1 + b2) * tp, (1 + b2) * tp + b2 * fn + fp),
+        "recall": ratio(tp, tp + fn),
+        "precision": ratio(tp, tp + fp),
+    }
+
+
+def bootstrap_confidence_intervals(y_true, y_pred, pos_label, beta=2.0, n_resamples=10000, confidence=0.95, seed=123):
+    """
+    Percentile bootstrap confidence intervals for F-beta, recall and precision.
+
+    Parameters
+    ----------
+    y_true : array-like
+        True labels.
+    y_pred : array-like
+        Predicted labels, aligned with ``y_true``.
+    pos_label : str or int
+        Label of the positive class.
+    beta : float, optional
+        Beta parameter of the F-beta score, by default 2.0.
+    n_resamples : int, optional
+        Number of bootstrap resamples, by default 10000.
+    confidence : float, optional
+        Confidence level of the intervals, by default 0.95.
+    seed : int, optional
+        Random seed for the resampling, by default 123.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per metric with the point estimate and the lower and upper bounds.
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    observed_counts = np.bincount(_confusion_codes(y_true, y_pred, pos_label), minlength=4)
+    observed = scores_from_counts(observed_counts[None, :], beta)
+    resampled = scores_from_counts(bootstrap_confusion_counts(y_true, y_pred, pos_label, n_resamples, seed), beta)
+    tail = (1 - confidence) / 2
+    names = {"fbeta": f"F{beta:g} Score", "recall": "Recall", "precision": "Precision"}
+    return pd.DataFrame({
+        "Metric": list(names.values()),
+        "Estimate": [observed[m][0] for m in names],
+        "Lower": [np.quantile(resampled[m], tail) for m in names],
+        "Upper": [np.quantile(resampled[m], 1 - tail) for m in names],
+        "Resamples": n_resamples,
+    })
@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+
+from utils.bootstrap import scores_from_counts
+
+
+def iter_test_chunks(test_data, target_col, chunksize=None):
+    """
+    Read a test CSV (or use a DataFrame) as (features, target) chunks.
+
+    Parameters
+    ----------
+    test_data : str or pandas.DataFrame
+        Path to the test CSV, or the test data itself.
+    target_col : str
+        Name of the target column.
+    chunksize : int, optional
+        Rows per chunk, by default the whole file at once.
+
+    Yields
+    ------
+    tuple of (pandas.DataFrame, pandas.Series)
+        Features and target of one chunk.
+    """
+    if isinstance(test_data, pd.DataFrame):
+        frames = [test_data] if chunksize is None else (
+            test_data.iloc[start:start + chunksize] for start in range(0, len(test_data), chunksize))
+    else:
+        frames = [pd.read_csv(test_data)] if chunksize is None else pd.read_csv(test_data, chunksize=chunksize)
+    for frame in frames:
+        yield frame.drop(columns=[target_col]), frame[target_col]
+
+
+def confusion_counts(y_true, y_pred, labels):
+    """
+    Confusion matrix of one chunk, computed with a single bincount.
+
+    Parameters
+    ----------
+    y_true : array-like
+        True labels.
+    y_pred : array-like
+        Predicted labels.
+    labels : numpy.ndarray
+        Sorted class labels indexing the rows (actual) and columns (predicted).
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (len(labels), len(labels)) with the counts.
+    """
+    k = len(labels)
+    codes = []
+    for values in (np.asarray(y_true), np.asarray(y_pred)):
+        index = np.searchsorted(labels, values).clip(max=k - 1)
+        unknown = labels[index] != values
+        if unknown.any():
+            raise ValueError(f"Labels {sorted(set(values[unknown]))} are not among the model classes {list(labels)}")
+        codes.append(index)
+    return np.bincount(codes[0] * k + codes[1], minlength=k * k).reshape(k, k)
+
+
+def metrics_from_confusion(confusion, labels, pos_label, beta=2.0):
+    """
+    Accuracy, precision, recall and F-beta from a confusion matrix.
+
+    Parameters
+    ----------
+    confusion : numpy.ndarray
+        Confusion matrix with actual labels as rows and predicted labels as columns.
+    labels : numpy.ndarray
+        Class labels in the order of the confusion matrix.
+    pos_label : str or int
+        Positive class label.
+    beta : float, optional
+        Beta parameter of the F-beta score, by default 2.0.
+
+    Returns
+    -------
+    dict
+        Dictionary with "accuracy", "precision", "recall" and "fbeta".
+    """
+    if pos_label not in list(labels):
+        raise ValueError(f"pos_label {pos_label!r} is not one of the classes {list(labels)}")
+    p = list(labels).index(pos_label)
+    tp = confusion[p, p]
+    fp = confusion[:, p].sum() - tp
+    fn = confusion[p, :].sum() - tp
+    tn = confusion.sum() - tp - fp - fn
+    scores = scores_from_counts(np.array([[tn, fp, fn, tp]]), beta=beta)
+    return {
+        "accuracy": np.trace(confusion) / confusion.sum(),
+        "precision": scores["precision"][0],
+        "recall": scores["recall"][0],
+        "fbeta": scores["fbeta"][0],
+    }
+
+
+def evaluate_models(models, test_data, target_col, pos_label, beta=2.0, chunksize=None, return_predictions=False):
+    """
+    Evaluate one or more fitted models with a single pass over the test data.
+
+    Each chunk of the test data is read once and every model predicts it
+    once. Confusion matrices are accumulated chunk by chunk and all metrics
+    are derived from them, so the predictions never need to be held in memory
+    unless they are asked for.
+
+    Parameters
+    ----------
+    models : dict
+        Dictionary with model names as keys and fitted classifiers as values.
+    test_data : str or pandas.DataFrame
+        Path to the test CSV, or the test data itself.
+    target_col : str
+        Name of the target column.
+    pos_label : str or int
+        Positive class label.
+    beta : float, optional
+        Beta parameter of the F-beta score, by default 2.0.
+    chunksize : int, optional
+        Rows predicted at a time, by default the whole test set at once.
+    return_predictions : bool, optional
+        Also return the true labels and each model's predictions, by default False.
+
+    Returns
+    -------
+    dict
+        Dictionary with model names as keys and dictionaries with "labels",
+        "confusion" and "metrics" (plus "y_true" and "y_pred" if requested) as values.
+    """
+    if not models:
+        raise ValueError("At least one model is needed")
+    labels = {name: np.sort(np.asarray(model.classes_)) for name, model in models.items()}
+    confusion = {name: np.zeros((len(labels[name]),) * 2, dtype=np.int64) for name in models}
+    y_true_chunks = []
+    y_pred_chunks = {name: [] for name in models}
+
+    for X, y in iter_test_chunks(test_data, target_col, chunksize):
+        y = y.to_numpy()
+        if return_predictions:
+            y_true_chunks.append(y)
+        for name, model in models.items():
+            y_pred = np.asarray(model.predict(X))
+            confusion[name] += confusion_counts(y, y_pred, labels[name])
+            if return_predictions:
+                y_pred_chunks[name].append(y_pred)
+
+    results = {}
+    for name in models:
+        results[name] = {
+            "labels": labels[name],
+            "confusion": confusion[name],
+            "metrics": metrics_from_confusion(confusion[name], labels[name], pos_label, beta),
+        }
+        if return_predictions:
+            results[name]["y_true"] = np.concatenate(y_true_chunks)
+            results[name]["y_pred"] = np.concatenate(y_pred_chunks[name])
+    return results
@@ -0,0 +1,109 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import StratifiedKFold
+
+
+def make_fold_plan(y, n_splits=5, seed=123):
+    """
+    Assign every training row to a stratified cross-validation fold.
+
+    Parameters
+    ----------
+    y : array-like
+        Training target, in the row order of the training CSV.
+    n_splits : int, optional
+        Number of folds, by default 5.
+    seed : int, optional
+        Random seed for the shuffled stratified split, by default 123.
+
+    Returns
+    -------
+    numpy.ndarray
+        Fold number (0 to n_splits - 1) of each row.
+    """
+    folds = np.empty(len(y), dtype=np.int64)
+    splitter = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=seed)
+    for fold, (_, test_idx) in enumerate(splitter.split(np.zeros(len(y)), y)):
+        folds[test_idx] = fold
+    return folds
+
+
+def save_fold_plan(folds, path):
+    """
+    Write a fold plan as a one-column CSV aligned with the training CSV rows.
+
+    Parameters
+    ----------
+    folds : numpy.ndarray
+        Fold number of each row.
+    path : str
+        Output CSV path.
+    """
+    pd.DataFrame({"fold": folds}).to_csv(path, index=False)
+
+
+def load_fold_plan(path, n_rows=None):
+    """
+    Read a fold plan written by ``save_fold_plan``.
+
+    Parameters
+    ----------
+    path : str
+        Path to the fold plan CSV.
+    n_rows : int, optional
+        Number of rows of the training data it must match, by default not checked.
+
+    Returns
+    -------
+    numpy.ndarray
+        Fold number of each row.
+    """
+    folds = pd.read_csv(path)["fold"].to_numpy(dtype=np.int64)
+    if n_rows is not None and len(folds) != n_rows:
+        raise ValueError(f"The fold plan has {len(folds)} rows but the training data has {n_rows}.")
+    return folds
+
+
+def fold_plan_splits(folds):
+    """
+    Turn a fold plan into (train, test) index arrays usable as ``cv`` in scikit-learn.
+
+    Parameters
+    ----------
+    folds : numpy.ndarray
+        Fold number of each row.
+
+    Returns
+    -------
+    list of tuple of numpy.ndarray
+        One (train indices, test indices) pair per fold, in fold order.
+    """
+    rows = np.arange(len(folds))
+    return [(rows[folds != fold], rows[folds == fold]) for fold in np.unique(folds)]
+
+
+def hash_splits(cv):
+    """
+    Identify a cross-validation setting for cache and journal fingerprints.
+
+    Parameters
+    ----------
+    cv : int or list of tuple of numpy.ndarray
+        Number of folds, or explicit (train, test) index arrays.
+
+    Returns
+    -------
+    int or str
+        The number of folds unchanged, or a digest of the index arrays.
+    """
+    if cv is None or isinstance(cv, (int, np.integer)):
+        return cv
+    digest = hashlib.sha256()
+    for train_idx, test_idx in cv:
+        digest.update(np.asarray(train_idx, dtype=np.int64).tobytes())
+        digest.update(b"|")
+        digest.update(np.asarray(test_idx, dtype=np.int64).tobytes())
+        digest.update(b"||")
+    return digest.hexdigest()
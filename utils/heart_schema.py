@@ -0,0 +1,87 @@
+import pandera.pandas as pa
+
+
+def has_duplicate_rows(df):
+    """
+    Whether any two rows of ``df`` are identical, as ``df.duplicated().any()``.
+
+    Identical rows must share their first column (``patient_id`` here), so
+    only rows whose first value repeats are compared in full. When the first
+    column is unique this hashes one column instead of every full row.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Data to check.
+
+    Returns
+    -------
+    bool
+        True if there are duplicate rows.
+    """
+    if df.shape[1] == 0:
+        return bool(df.duplicated().any())
+    candidates = df.iloc[:, 0].duplicated(keep=False).to_numpy()
+    return bool(candidates.any()) and bool(df[candidates].duplicated().any())
+
+
+# validate data
+schema = pa.DataFrameSchema(
+    {
+        'patient_id': pa.Column(int, pa.Check.greater_than(0)),
+        'age': pa.Column(int, pa.Check.between(0, 90), nullable=True),
+        'gender': pa.Column(int, pa.Check.between(0, 1), nullable=True),
+        'chest_pain': pa.Column(int, pa.Check.between(0, 3), nullable=True),
+        'resting_bp': pa.Column(int, pa.Check.between(94, 200), nullable=True),
+        'serum_cholesterol': pa.Column(
+            int, 
+            checks=[
+                pa.Check(lambda s: (s >= 126) & (s <= 564),
+                        # Attributed to pandera documentation:
+                        # https://pandera.readthedocs.io/en/stable/checks.html#raise-warning-instead-of-error-on-check-failure
+                        raise_warning=True,
+                        error="There are outliers in the data values"),
+            ], 
+            nullable=True),
+        'fasting_blood_sugar': pa.Column(int, pa.Check.between(0, 1), nullable=True),
+        'resting_electro': pa.Column(int, pa.Check.between(0, 2), nullable=True),
+        'max_heart_rate': pa.Column(int, pa.Check.between(71, 202), nullable=True),
+        'exercise_angina': pa.Column(int, pa.Check.between(0, 1), nullable=True),
+        'old_peak': pa.Column(float, pa.Check.between(0.0, 6.2), nullable=True),
+        'slope': pa.Column(
+            int, 
+            checks=[
+                pa.Check(lambda s: (s >= 1) & (s <= 3),
+                        raise_warning=True,
+                        error="Certain slope values are out of range"),
+            ], 
+            nullable=True),
+        'num_major_vessels': pa.Column(int, pa.Check.between(0, 3), nullable=True),
+        'target': pa.Column(int, pa.Check.isin([0, 1]))
+    },
+    checks=[
+        pa.Check(lambda df: not has_duplicate_rows(df), error="Duplicate rows found."),
+        pa.Check(lambda df: ~(df.isna().all(axis=1)).any(), error="Empty rows found.")
+    ]
+)
+
+
+def record_schema(schema=schema, target_col="target"):
+    """
+    Schema for records sent for scoring: the training schema without the
+    target column and without the dataset-level checks (duplicate or empty
+    rows), which do not apply to independent records scored together.
+
+    Parameters
+    ----------
+    schema : pandera.DataFrameSchema, optional
+        Schema of the raw dataset, by default the heart disease schema.
+    target_col : str, optional
+        Name of the target column, by default "target".
+
+    Returns
+    -------
+    pandera.DataFrameSchema
+        Column-only schema of the features.
+    """
+    return pa.DataFrameSchema({name: column for name, column in schema.columns.items() if name != target_col})
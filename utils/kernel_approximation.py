@@ -0,0 +1,108 @@
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.metrics import fbeta_score
+from sklearn.pipeline import make_pipeline
+
+from utils.models import get_models
+from utils.svm_kernel_search import resolve_gamma
+
+# approximate kernel models and the name of their feature map step
+APPROXIMATIONS = {"SVM Nystroem": "nystroem", "SVM RFF": "rbfsampler"}
+
+
+def predict_latency(model, X, repeats=5):
+    """
+    Best-of-``repeats`` predict latency of a fitted model.
+
+    Parameters
+    ----------
+    model :
+        Fitted classifier or pipeline.
+    X : pandas.DataFrame
+        Rows to predict.
+    repeats : int, optional
+        Number of timed calls, by default 5.
+
+    Returns
+    -------
+    dict
+        Dictionary with "batch_us_per_row" (one call on all of ``X``) and
+        "single_row_ms" (one call on a single row).
+    """
+    def best(rows):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            model.predict(rows)
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    return {"batch_us_per_row": best(X) / len(X) * 1e6, "single_row_ms": best(X.iloc[:1]) * 1e3}
+
+
+def compare_kernel_approximations(exact, X_train, y_train, X_test, y_test, pos_label, beta=2.0,
+                                  n_components=(25, 50, 100, 200, 400), random_state=123, repeats=5):
+    """
+    Compare the exact RBF SVM with Nystroem and random Fourier feature approximations.
+
+    Every approximate model reuses the preprocessor, ``C`` and ``gamma`` of the
+    exact SVM (a "scale" or "auto" gamma is resolved on the preprocessed
+    training data, as SVC does), and its linear SVM uses the same hinge loss.
+    Apart from the kernel approximation and its number of components, the one
+    difference left is that LinearSVC also regularises the intercept, which
+    SVC does not. All models are refitted on the training data and scored on
+    the test data.
+
+    Parameters
+    ----------
+    exact : sklearn.pipeline.Pipeline
+        Preprocessor + SVC pipeline, e.g. the tuned final model.
+    X_train, y_train : pandas.DataFrame, pandas.Series
+        Training data.
+    X_test, y_test : pandas.DataFrame, pandas.Series
+        Data the F-beta score and latencies are measured on.
+    pos_label : str or int
+        Positive class label for fbeta_score.
+    beta : float, optional
+        Beta parameter for fbeta_score, by default 2.0.
+    n_components : sequence of int, optional
+        Numbers of components tried for each approximation.
+    random_state : int, optional
+        Random state of the feature maps and linear SVMs, by default 123.
+    repeats : int, optional
+        Number of timed predict calls per model, by default 5.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per model with columns Model, Components (support vectors for the
+        exact SVM), Test F2 Score (or F{beta}), Fit Time (s), Batch Latency (us/row)
+        and Single-Row Latency (ms).
+    """
+    score_col = f"Test F{beta:g} Score"
+
+    def evaluate(name, model, components):
+        start = time.perf_counter()
+        model.fit(X_train, y_train)
+        fit_time = time.perf_counter() - start
+        latency = predict_latency(model, X_test, repeats=repeats)
+        return {"Model": name, "Components": components if components is not None else len(model[-1].support_),
+                score_col: fbeta_score(y_test, model.predict(X_test), pos_label=pos_label, beta=beta),
+                "Fit Time (s)": fit_time, "Batch Latency (us/row)": latency["batch_us_per_row"],
+                "Single-Row Latency (ms)": latency["single_row_ms"]}
+
+    exact = clone(exact)
+    rows = [evaluate("SVM RBF", exact, None)]
+    svc = exact[-1]
+    gamma = resolve_gamma(svc.gamma, np.asarray(exact[0].transform(X_train), dtype=float))
+    approximate = get_models(random_state=random_state, approximate_kernels=True)
+    for name, step in APPROXIMATIONS.items():
+        for n in n_components:
+            model = make_pipeline(clone(exact[0]), clone(approximate[name]))
+            model.set_params(**{f"pipeline__{step}__gamma": gamma, f"pipeline__{step}__n_components": n,
+                                "pipeline__linearsvc__C": svc.C})
+            rows.append(evaluate(name, model, n))
+    return pd.DataFrame(rows)
@@ -0,0 +1,128 @@
+import time
+from collections import defaultdict
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import fbeta_score
+from sklearn.model_selection import ParameterSampler, check_cv
+from sklearn.pipeline import make_pipeline
+from sklearn.utils.parallel import Parallel, delayed
+
+from utils.search_results import build_search_result
+from utils.transform_cache import transform_fold
+
+LOGREG_PARAMS = ("logisticregression__C", "logisticregression__max_iter")
+
+
+def _score_fold(X_train, y_train, train_idx, test_idx, model, preprocessor, checkpoints, n_candidates, pos_label, beta,
+                memory):
+    """
+    Score every candidate on one fold along the warm-started C path.
+
+    Returns the fold's test scores, train scores, fit times and score times, one entry per candidate.
+    """
+    Xt_train, Xt_test = transform_fold(preprocessor, X_train.iloc[train_idx], X_train.iloc[test_idx],
+                                       y_train.iloc[train_idx], memory)
+    y = np.asarray(y_train)
+    y_fold_train, y_fold_test = y[train_idx], y[test_idx]
+    test_scores, train_scores = np.empty(n_candidates), np.empty(n_candidates)
+    fit_times, score_times = np.empty(n_candidates), np.empty(n_candidates)
+    path_model = clone(model).set_params(warm_start=True)
+
+    for C in sorted(checkpoints):
+        iterations_done, elapsed, converged = 0, 0.0, False
+        for max_iter in sorted(checkpoints[C]):
+            if not converged:
+                step = max_iter - iterations_done
+                start = time.time()
+                path_model.set_params(C=C, max_iter=step).fit(Xt_train, y_fold_train)
+                elapsed += time.time() - start
+                converged = path_model.n_iter_.max() < step
+                iterations_done = max_iter
+
+                start = time.time()
+                test_score = fbeta_score(y_fold_test, path_model.predict(Xt_test), pos_label=pos_label, beta=beta)
+                score_time = time.time() - start
+                train_score = fbeta_score(y_fold_train, path_model.predict(Xt_train), pos_label=pos_label, beta=beta)
+
+            for i in checkpoints[C][max_iter]:
+                test_scores[i], train_scores[i] = test_score, train_score
+                fit_times[i], score_times[i] = elapsed, score_time
+    return test_scores, train_scores, fit_times, score_times
+
+
+def tune_logreg_path(X_train, y_train, model, preprocessor, param_dist, pos_label, beta, seed,
+                     n_iter=10, cv=5, memory=None, n_jobs=None):
+    """
+    Tune C and max_iter of a logistic regression along a warm-started regularisation path.
+
+    The candidates and folds are the ones ``RandomizedSearchCV`` would use with the
+    same seed. In each fold the sampled C values are solved from the strongest to
+    the weakest regularisation, each solve starting from the previous coefficients.
+    The max_iter values of a C are checkpoints of one continued solve: the solver
+    runs up to the smallest checkpoint, is scored, then continues to the next one.
+    Once it converges the remaining checkpoints reuse the converged model. Folds
+    are scored in parallel.
+
+    When the solver converges before the first checkpoint (as it does on the heart
+    data) the scores equal those of independent fits; otherwise a checkpoint
+    reflects the warm-started iterate rather than a cold start.
+
+    Parameters
+    ----------
+    X_train : pandas.DataFrame
+        Training features.
+    y_train : pandas.Series
+        Training target.
+    model : sklearn.linear_model.LogisticRegression
+        Unfitted logistic regression; its other settings are kept.
+    preprocessor :
+        scikit-learn transformer applied before the model.
+    param_dist : dict
+        Distribution over "logisticregression__C" and "logisticregression__max_iter".
+    pos_label : str or int
+        Positive class label for fbeta_score.
+    beta : float
+        Beta parameter for fbeta_score.
+    seed : int
+        Random seed for candidate sampling.
+    n_iter : int, optional
+        Number of candidates to sample, by default 10.
+    cv : int or iterable, optional
+        Cross-validation splitting strategy, by default 5 stratified folds.
+    memory : TransformCache, optional
+        Cache for the per-fold preprocessor transforms, by default None.
+    n_jobs : int, optional
+        Number of workers scoring folds, by default None (one; -1 uses all CPUs).
+
+    Returns
+    -------
+    SearchResult
+        Search result with a ``cv_results_`` table and the best pipeline refitted on all data.
+    """
+    if not isinstance(model, LogisticRegression) or model.solver == "liblinear":
+        raise ValueError("the regularisation path requires a LogisticRegression with a warm-startable solver")
+    unknown = set(param_dist) - set(LOGREG_PARAMS)
+    if unknown:
+        raise ValueError(f"the regularisation path only tunes {LOGREG_PARAMS}, got {sorted(unknown)}")
+
+    candidates = list(ParameterSampler(param_dist, n_iter=n_iter, random_state=seed))
+    checkpoints = defaultdict(lambda: defaultdict(list))
+    for i, params in enumerate(candidates):
+        C = params.get("logisticregression__C", model.C)
+        max_iter = params.get("logisticregression__max_iter", model.max_iter)
+        checkpoints[C][max_iter].append(i)
+
+    splits = list(check_cv(cv, y_train, classifier=True).split(X_train, y_train))
+    # plain dicts pickle for the workers; the defaultdicts hold a lambda
+    checkpoints = {C: dict(by_max_iter) for C, by_max_iter in checkpoints.items()}
+    folds = Parallel(n_jobs=n_jobs)(
+        delayed(_score_fold)(X_train, y_train, train_idx, test_idx, model, preprocessor, checkpoints, len(candidates),
+                             pos_label, beta, memory)
+        for train_idx, test_idx in splits
+    )
+    test_scores, train_scores, fit_times, score_times = (np.column_stack(columns) for columns in zip(*folds))
+
+    return build_search_result(candidates, test_scores, train_scores, fit_times, score_times,
+                               make_pipeline(preprocessor, model, memory=memory), X_train, y_train)
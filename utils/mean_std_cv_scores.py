@@ -1,9 +1,71 @@
 # Adapted from UBC MDS DSCI 571 utils/mean_std_cv_scores.py
 
+import warnings
+
+import numpy as np
 import pandas as pd
 from sklearn.model_selection import cross_validate
 
-def mean_std_cross_val_scores(model, X_train, y_train, scoring=None, **kwargs):
+OUTPUT_MODES = ("text", "numeric")
+
+
+def summarize_cv_scores(scores):
+    """
+    Summarize the output of ``cross_validate`` as numeric columns.
+
+    Every metric (fit_time, score_time, test_score, ...) is stacked into one
+    array, so the means and standard deviations are computed in a single
+    vectorized pass. As with pandas, NaN scores (e.g. from a failed fold) are
+    skipped.
+
+    Parameters
+    ----------
+    scores : dict
+        Dictionary of per-fold arrays, as returned by ``cross_validate``.
+
+    Returns
+    ----------
+        pandas Series of floats indexed by (metric, statistic), where statistic
+        is "mean", "std" (sample standard deviation) or "fold_<k>" for the raw
+        score of fold k
+    """
+    metrics = list(scores)
+    values = np.vstack([np.asarray(scores[metric], dtype=float) for metric in metrics])
+    n_folds = values.shape[1]
+    with warnings.catch_warnings():
+        # all-NaN metrics or a single valid fold give NaN, as in pandas, without a warning
+        warnings.simplefilter("ignore", RuntimeWarning)
+        table = np.column_stack([np.nanmean(values, axis=1), np.nanstd(values, axis=1, ddof=1), values])
+    statistics = ["mean", "std"] + [f"fold_{k}" for k in range(n_folds)]
+    index = pd.MultiIndex.from_product([metrics, statistics], names=["metric", "statistic"])
+    return pd.Series(table.ravel(), index=index)
+
+
+def format_mean_std(summary):
+    """
+    Render numeric summaries as "mean (+/- std)" strings.
+
+    Parameters
+    ----------
+    summary : pandas Series or DataFrame
+        Output of ``summarize_cv_scores``, or a DataFrame with one such
+        summary per row (e.g. many models or CV runs).
+
+    Returns
+    ----------
+        pandas Series (or DataFrame) of strings indexed by metric
+    """
+    axis = 1 if isinstance(summary, pd.DataFrame) else 0
+    means = summary.xs("mean", level="statistic", axis=axis)
+    stds = summary.xs("std", level="statistic", axis=axis)
+    text = np.char.add(np.char.mod("%0.3f (+/- ", means.to_numpy(dtype=float)),
+                       np.char.mod("%0.3f)", stds.to_numpy(dtype=float)))
+    if axis:
+        return pd.DataFrame(text, index=means.index, columns=list(means.columns))
+    return pd.Series(text, index=list(means.index))
+
+
+def mean_std_cross_val_scores(model, X_train, y_train, scoring=None, output="text", **kwargs):
     """
     Returns mean and std of cross validation
 
@@ -15,16 +77,19 @@ def mean_std_cross_val_scores(model, X_train, y_train, scoring=None, **kwargs):
         X in the training data
     y_train :
         y in the training data
+    output : str, optional
+        "text" for "mean (+/- std)" strings, or "numeric" for the float
+        summary of ``summarize_cv_scores`` (mean, std and per-fold scores),
+        by default "text"
 
     Returns
     ----------
         pandas Series with mean scores from cross_validation
     """
+    if output not in OUTPUT_MODES:
+        raise ValueError(f"output must be one of {OUTPUT_MODES}, got {output!r}")
     scores = cross_validate(model, X_train, y_train, scoring=scoring, **kwargs)
-    mean_scores = pd.DataFrame(scores).mean()
-    std_scores = pd.DataFrame(scores).std()
-    out_col = []
-    for i in range(len(mean_scores)):
-        out_col.append((f"%0.3f (+/- %0.3f)" % (mean_scores.iloc[i], std_scores.iloc[i])))
-        
-    return pd.Series(data=out_col, index=mean_scores.index)
\ No newline at end of file
+    summary = summarize_cv_scores(scores)
+    if output == "numeric":
+        return summary
+    return format_mean_std(summary)
@@ -1,32 +1,69 @@
 from sklearn.dummy import DummyClassifier
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.linear_model import LogisticRegression
-from sklearn.svm import SVC
+from sklearn.svm import SVC, LinearSVC
+from sklearn.kernel_approximation import Nystroem, RBFSampler
+from sklearn.pipeline import make_pipeline
 import numpy as np
 
-def get_models(random_state=123):
+def get_models(random_state=123, approximate_kernels=False):
     """
     Returns a dictionary of classification models with specified random_state where applicable.
+
+    With ``approximate_kernels`` two approximate RBF kernel SVMs are added: a
+    Nystroem or random Fourier feature map (``RBFSampler``) followed by a linear
+    SVM. Their predict cost depends on the number of components instead of the
+    number of support vectors of the exact "SVM RBF". The linear SVM uses the
+    hinge loss of ``SVC`` (not LinearSVC's default squared hinge), with more
+    iterations as that loss converges more slowly.
     
     Parameters
     ----------
     random_state : int, optional
         Random state for reproducibility, by default 123
+    approximate_kernels : bool, optional
+        Also return "SVM Nystroem" and "SVM RFF", by default False
     Returns
     ----------
     dict
         Dictionary with model names as keys and model instances as values
     """
-    return {
+    models = {
         "Dummy Classifier": DummyClassifier(strategy='most_frequent'),
         "Decision Tree": DecisionTreeClassifier(random_state=random_state),
         "Logistic Regression": LogisticRegression(random_state=random_state),
         "SVM RBF": SVC(random_state=random_state)
     }
+    if approximate_kernels:
+        models["SVM Nystroem"] = make_pipeline(Nystroem(n_components=100, random_state=random_state),
+                                               LinearSVC(loss="hinge", max_iter=10000, random_state=random_state))
+        models["SVM RFF"] = make_pipeline(RBFSampler(n_components=100, random_state=random_state),
+                                          LinearSVC(loss="hinge", max_iter=10000, random_state=random_state))
+    return models
+
 def get_param_dist():
 
     return {
     "Decision Tree": {'decisiontreeclassifier__max_depth': np.arange(1, 11)},
     "Logistic Regression": {"logisticregression__C" : 10.0 ** np.arange(-3, 2, 1), "logisticregression__max_iter" : [80, 100, 500, 1000, 1500, 2000]},
-    "SVM RBF": {"svc__C": 10.0 ** np.arange(-3, 2, 1), "svc__gamma": 10.0 ** np.arange(-3, 2, 1)}
-    }
\ No newline at end of file
+    "SVM RBF": {"svc__C": 10.0 ** np.arange(-3, 2, 1), "svc__gamma": 10.0 ** np.arange(-3, 2, 1)},
+    "SVM Nystroem": {"pipeline__linearsvc__C": 10.0 ** np.arange(-3, 2, 1), "pipeline__nystroem__gamma": 10.0 ** np.arange(-3, 2, 1),
+                     "pipeline__nystroem__n_components": [25, 50, 100, 200, 400]},
+    "SVM RFF": {"pipeline__linearsvc__C": 10.0 ** np.arange(-3, 2, 1), "pipeline__rbfsampler__gamma": 10.0 ** np.arange(-3, 2, 1),
+                "pipeline__rbfsampler__n_components": [25, 50, 100, 200, 400]}
+    }
+
+def get_halving_resources():
+    """
+    Returns the budget used by successive-halving search for each model.
+
+    Models that are not listed are halved over the number of training rows.
+
+    Returns
+    ----------
+    dict
+        Dictionary with model names as keys and the pipeline parameter used as resource as values
+    """
+    return {
+        "Logistic Regression": "logisticregression__max_iter"
+    }
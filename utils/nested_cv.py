@@ -0,0 +1,168 @@
+import json
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import ParameterSampler, RepeatedStratifiedKFold, check_cv
+from sklearn.utils.parallel import Parallel, delayed
+
+from utils.optimal_hyperparameters import SEARCH_MODES, tune_hyperparameters
+from utils.search_cache import to_jsonable
+from utils.search_results import fit_and_score
+
+
+def nested_cross_validate(X, y, pipelines, param_dists, pos_label, beta, seed, outer_splits=5, n_repeats=1,
+                          inner_cv=5, n_iter=10, n_jobs=-1, search="random", resources=None):
+    """
+    Nested (and optionally repeated) cross-validation of several models' hyperparameter searches.
+
+    Each outer training set runs the same search as ``tune_hyperparameters``
+    with the given ``search`` mode (same candidates and inner stratified
+    folds); the winning candidate is refitted on the outer training set and
+    scored on the outer test set, which the search never saw. This gives an
+    estimate of the F-beta the whole tuning procedure generalises to, unlike
+    the optimistic best inner score.
+
+    For the randomized search every (model, outer fold, candidate, inner fold)
+    fit goes to one worker pool in a single batch, so the workers stay busy
+    rather than waiting at the end of each small search. Halving and path
+    searches run through ``tune_hyperparameters`` one outer fold at a time,
+    each with all ``n_jobs`` workers. The outer refits then share one pool.
+    Pipelines built with a shared ``memory`` (e.g. a TransformCache) fit the
+    preprocessor once per training subset.
+
+    Parameters
+    ----------
+    X : pandas.DataFrame
+        Training features.
+    y : pandas.Series
+        Training target.
+    pipelines : dict
+        Dictionary with model names as keys and unfitted preprocessor + model pipelines as values.
+    param_dists : dict
+        Dictionary with model names as keys and hyperparameter distributions as values.
+    pos_label : str or int
+        Positive class label for fbeta_score.
+    beta : float
+        Beta parameter for fbeta_score.
+    seed : int
+        Random seed for candidate sampling and the outer splits.
+    outer_splits : int, optional
+        Number of outer folds, by default 5.
+    n_repeats : int, optional
+        Number of times the outer split is repeated with a different shuffle, by default 1.
+    inner_cv : int, optional
+        Number of inner stratified folds, by default 5.
+    n_iter : int, optional
+        Number of candidates sampled per randomized search, by default 10 (the
+        halving and path searches sample as ``tune_hyperparameters`` does).
+    n_jobs : int, optional
+        Number of workers, by default -1 (all CPUs).
+    search : str, optional
+        Search mode the models were tuned with, one of ``SEARCH_MODES``, by default "random".
+    resources : dict, optional
+        Halving budget resource per model name, by default "n_samples" for every model.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per (model, repeat, outer fold) with the selected parameters,
+        their inner score and their outer test score.
+    """
+    if outer_splits < 2 or n_repeats < 1:
+        raise ValueError("outer_splits must be at least 2 and n_repeats at least 1")
+    if search not in SEARCH_MODES:
+        raise ValueError(f"search must be one of {SEARCH_MODES}, got {search!r}")
+    outer = RepeatedStratifiedKFold(n_splits=outer_splits, n_repeats=n_repeats, random_state=seed)
+    outer_folds = list(outer.split(X, y))
+    # inner folds as positions within each outer training set
+    inner_folds = [list(check_cv(inner_cv, y.iloc[train_idx], classifier=True).split(X.iloc[train_idx],
+                                                                                      y.iloc[train_idx]))
+                   for train_idx, _ in outer_folds]
+
+    if search == "random":
+        selected = _select_randomized(X, y, pipelines, param_dists, pos_label, beta, seed, outer_folds,
+                                      inner_folds, n_iter, n_jobs)
+    else:
+        selected = {}
+        for name, pipeline in pipelines.items():
+            for o, (train_idx, _) in enumerate(outer_folds):
+                result = tune_hyperparameters(X.iloc[train_idx], y.iloc[train_idx], pipeline[-1], pipeline[0],
+                                              param_dists[name], pos_label, beta, seed, search=search,
+                                              resource=(resources or {}).get(name, "n_samples"),
+                                              memory=pipeline.memory, n_jobs=n_jobs, cv=inner_folds[o])
+                selected[(name, o)] = (result.best_params_, result.best_score_)
+
+    outer_jobs = list(selected)
+    outer_records = Parallel(n_jobs=n_jobs)(
+        delayed(fit_and_score)(pipelines[name], selected[(name, o)][0], X, y, *outer_folds[o], pos_label, beta)
+        for name, o in outer_jobs
+    )
+
+    rows = []
+    for (name, o), record in zip(outer_jobs, outer_records):
+        params, inner_score = selected[(name, o)]
+        rows.append({
+            "Model": name,
+            "Repeat": o // outer_splits,
+            "Outer Fold": o % outer_splits,
+            "Inner F2 Score": inner_score,
+            "Outer F2 Score": record["test_score"],
+            "Best Model Parameters": json.dumps(to_jsonable(params)),
+        })
+    return pd.DataFrame(rows)
+
+
+def _select_randomized(X, y, pipelines, param_dists, pos_label, beta, seed, outer_folds, inner_folds, n_iter,
+                       n_jobs):
+    """
+    Run every model's randomized search on every outer training set as one batch of inner fits.
+
+    Returns a dictionary with (model name, outer fold) keys and (best parameters, mean inner score) values.
+    """
+    candidates = {name: list(ParameterSampler(param_dists[name], n_iter=n_iter, random_state=seed))
+                  for name in pipelines}
+    # inner folds mapped back to rows of X
+    inner_jobs = [(name, o, c, outer_folds[o][0][inner_train], outer_folds[o][0][inner_test])
+                  for name in pipelines
+                  for o in range(len(outer_folds))
+                  for c in range(len(candidates[name]))
+                  for inner_train, inner_test in inner_folds[o]]
+    inner_records = Parallel(n_jobs=n_jobs)(
+        delayed(fit_and_score)(pipelines[name], candidates[name][c], X, y, train_idx, test_idx, pos_label, beta)
+        for name, o, c, train_idx, test_idx in inner_jobs
+    )
+
+    inner_scores = {}
+    for (name, o, c, _, _), record in zip(inner_jobs, inner_records):
+        inner_scores.setdefault((name, o), [[] for _ in candidates[name]])[c].append(record["test_score"])
+    selected = {}
+    for (name, o), scores in inner_scores.items():
+        means = np.array([np.mean(s) for s in scores])
+        best = int(np.argmax(np.where(np.isnan(means), -np.inf, means)))
+        selected[(name, o)] = (candidates[name][best], means[best])
+    return selected
+
+
+def summarize_nested_cv(results):
+    """
+    Average nested cross-validation results per model.
+
+    Parameters
+    ----------
+    results : pandas.DataFrame
+        Output of ``nested_cross_validate``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per model with the mean and std of the outer scores, the mean
+        inner score and the optimism (inner minus outer) of the inner estimate.
+    """
+    grouped = results.groupby("Model", sort=False)
+    summary = pd.DataFrame({
+        "Nested F2 Mean": grouped["Outer F2 Score"].mean(),
+        "Nested F2 Std": grouped["Outer F2 Score"].std(),
+        "Inner F2 Mean": grouped["Inner F2 Score"].mean(),
+    })
+    summary["Optimism"] = summary["Inner F2 Mean"] - summary["Nested F2 Mean"]
+    return summary
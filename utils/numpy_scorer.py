@@ -0,0 +1,249 @@
+import json
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder, OrdinalEncoder, StandardScaler
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
+
+
+def _flatten_preprocessor(column_transformer):
+    """
+    Turn a fitted ColumnTransformer into index and parameter arrays.
+    """
+    inputs = list(column_transformer.feature_names_in_)
+    spec = {"scale_src": [], "scale_out": [], "offset": [], "scale": [], "pass_src": [], "pass_out": [],
+            "onehot_src": [], "onehot_out": [], "onehot_ignore": [], "ordinal_src": [], "ordinal_out": [],
+            "categories": []}
+    n_out = 0
+    for name, transformer, columns in column_transformer.transformers_:
+        if transformer == "drop" or len(columns) == 0:
+            continue
+        src = [inputs.index(c) if isinstance(c, str) else int(c) for c in columns]
+        if transformer == "passthrough" or (isinstance(transformer, FunctionTransformer) and transformer.func is None):
+            spec["pass_src"] += src
+            spec["pass_out"] += list(range(n_out, n_out + len(src)))
+            n_out += len(src)
+        elif isinstance(transformer, StandardScaler):
+            spec["scale_src"] += src
+            spec["scale_out"] += list(range(n_out, n_out + len(src)))
+            spec["offset"] += list(transformer.mean_ if transformer.with_mean else np.zeros(len(src)))
+            spec["scale"] += list(transformer.scale_ if transformer.with_std else np.ones(len(src)))
+            n_out += len(src)
+        elif isinstance(transformer, OneHotEncoder):
+            if transformer.drop is not None or getattr(transformer, "_infrequent_enabled", False):
+                raise ValueError("OneHotEncoder with drop or infrequent categories is not supported")
+            for column, categories in zip(src, transformer.categories_):
+                spec["onehot_src"].append(column)
+                spec["onehot_out"].append(n_out)
+                spec["onehot_ignore"].append(transformer.handle_unknown != "error")
+                spec["categories"].append(np.asarray(categories, dtype=float))
+                n_out += len(categories)
+        elif isinstance(transformer, OrdinalEncoder):
+            if transformer.handle_unknown != "error":
+                raise ValueError("OrdinalEncoder with handle_unknown other than 'error' is not supported")
+            for column, categories in zip(src, transformer.categories_):
+                spec["ordinal_src"].append(column)
+                spec["ordinal_out"].append(n_out)
+                spec["categories"].append(np.asarray(categories, dtype=float))
+                n_out += 1
+        else:
+            raise ValueError(f"Transformer {name!r} ({type(transformer).__name__}) cannot be exported")
+    return inputs, n_out, spec
+
+
+def _flatten_classifier(model):
+    """
+    Turn a fitted SVC, LogisticRegression or DecisionTreeClassifier into plain arrays.
+    """
+    if len(model.classes_) != 2:
+        raise ValueError("Only binary classifiers can be exported")
+    if isinstance(model, SVC):
+        if model.kernel not in ("rbf", "linear"):
+            raise ValueError(f"SVC kernel {model.kernel!r} is not supported")
+        return {"kind": f"svc_{model.kernel}", "support_vectors": np.asarray(model.support_vectors_, dtype=float),
+                "dual_coef": model.dual_coef_.ravel().astype(float), "intercept": model.intercept_.astype(float),
+                "gamma": np.array([model._gamma])}
+    if isinstance(model, LogisticRegression):
+        return {"kind": "linear", "coef": model.coef_.ravel().astype(float), "intercept": model.intercept_.astype(float)}
+    if isinstance(model, DecisionTreeClassifier):
+        tree = model.tree_
+        return {"kind": "tree", "left": tree.children_left.copy(), "right": tree.children_right.copy(),
+                "feature": tree.feature.copy(), "threshold": tree.threshold.copy(),
+                "leaf_class": tree.value[:, 0, :].argmax(axis=1)}
+    raise ValueError(f"Classifier {type(model).__name__} cannot be exported")
+
+
+class NumpyScorer:
+    """
+    Fitted preprocessor + classifier pipeline flattened into NumPy arrays.
+
+    Scaling is one vectorized (x - offset) / scale over precomputed vectors,
+    categories are looked up with ``searchsorted`` in the fitted category
+    tables, and the classifier is evaluated from its raw parameters (support
+    vectors and dual coefficients, a coefficient vector, or the tree node
+    arrays). There is no DataFrame or ColumnTransformer dispatch per call,
+    which dominates the latency of small batches in the scikit-learn pipeline.
+
+    Build it with ``export_numpy_scorer`` and persist it with ``save``/``load``.
+    """
+
+    def __init__(self, input_columns, n_features, preprocessing, model, classes):
+        self.input_columns = list(input_columns)
+        self.n_features = int(n_features)
+        self.preprocessing = preprocessing
+        self.model = model
+        self.classes_ = np.asarray(classes)
+
+    def _as_array(self, X):
+        if isinstance(X, pd.DataFrame):
+            X = X[self.input_columns]
+        X = np.asarray(X, dtype=float)
+        if X.ndim != 2 or X.shape[1] != len(self.input_columns):
+            raise ValueError(f"Expected {len(self.input_columns)} columns: {self.input_columns}")
+        return X
+
+    def transform(self, X):
+        """
+        Preprocess raw rows into the model's feature matrix.
+
+        Parameters
+        ----------
+        X : pandas.DataFrame or numpy.ndarray
+            Raw rows, with the columns the pipeline was fitted on (in that order for arrays).
+
+        Returns
+        -------
+        numpy.ndarray
+            Feature matrix, identical to the ColumnTransformer output.
+        """
+        X = self._as_array(X)
+        p = self.preprocessing
+        out = np.zeros((len(X), self.n_features))
+        out[:, p["scale_out"]] = (X[:, p["scale_src"]] - p["offset"]) / p["scale"]
+        out[:, p["pass_out"]] = X[:, p["pass_src"]]
+        rows = np.arange(len(X))
+        for k, (column, start) in enumerate(zip(p["onehot_src"], p["onehot_out"])):
+            codes, known = self._lookup(X[:, column], p["categories"][k], ignore=p["onehot_ignore"][k])
+            out[rows[known], start + codes[known]] = 1.0
+        n_onehot = len(p["onehot_src"])
+        for k, (column, position) in enumerate(zip(p["ordinal_src"], p["ordinal_out"])):
+            codes, _ = self._lookup(X[:, column], p["categories"][n_onehot + k])
+            out[:, position] = codes
+        return out
+
+    @staticmethod
+    def _lookup(values, categories, ignore=False):
+        codes = np.searchsorted(categories, values).clip(max=len(categories) - 1)
+        known = categories[codes] == values
+        if not ignore and not known.all():
+            raise ValueError(f"Found unknown categories {np.unique(values[~known]).tolist()}")
+        return codes, known
+
+    def decision_function(self, X):
+        """
+        Continuous score, positive for ``classes_[1]`` as in scikit-learn.
+
+        For decision trees the score is the predicted class index (0 or 1).
+        """
+        Z = self.transform(X)
+        m = self.model
+        if m["kind"] == "svc_rbf":
+            sv = m["support_vectors"]
+            sq_dist = (Z ** 2).sum(axis=1)[:, None] + (sv ** 2).sum(axis=1)[None, :] - 2 * Z @ sv.T
+            return np.exp(-m["gamma"][0] * np.maximum(sq_dist, 0)) @ m["dual_coef"] + m["intercept"][0]
+        if m["kind"] == "svc_linear":
+            return (Z @ m["support_vectors"].T) @ m["dual_coef"] + m["intercept"][0]
+        if m["kind"] == "linear":
+            return Z @ m["coef"] + m["intercept"][0]
+        # trees compare float32 features against float64 thresholds
+        Z = Z.astype(np.float32).astype(np.float64)
+        node = np.zeros(len(Z), dtype=np.int64)
+        active = m["left"][node] != -1
+        while active.any():
+            idx = np.flatnonzero(active)
+            current = node[idx]
+            go_left = Z[idx, m["feature"][current]] <= m["threshold"][current]
+            node[idx] = np.where(go_left, m["left"][current], m["right"][current])
+            active[idx] = m["left"][node[idx]] != -1
+        return m["leaf_class"][node].astype(float)
+
+    def predict(self, X):
+        """
+        Predicted class labels.
+        """
+        return self.classes_[(self.decision_function(X) > 0).astype(int)]
+
+    def to_arrays(self):
+        """
+        Flat name -> array mapping and JSON-serialisable metadata describing the scorer.
+        """
+        p, m = self.preprocessing, self.model
+        arrays = {f"pre_{key}": np.asarray(value) for key, value in p.items() if key != "categories"}
+        arrays.update({f"model_{key}": np.asarray(value) for key, value in m.items() if key != "kind"})
+        for k, categories in enumerate(p["categories"]):
+            arrays[f"category_{k}"] = categories
+        meta = {"input_columns": self.input_columns, "n_features": self.n_features, "kind": m["kind"],
+                "n_categories": len(p["categories"]), "classes": self.classes_.tolist()}
+        return arrays, meta
+
+    @classmethod
+    def from_arrays(cls, arrays, meta):
+        """
+        Rebuild a scorer from the output of ``to_arrays``; the arrays are used without copying.
+        """
+        preprocessing = {key[4:]: value for key, value in arrays.items() if key.startswith("pre_")}
+        preprocessing["categories"] = [arrays[f"category_{k}"] for k in range(meta["n_categories"])]
+        model = {key[6:]: value for key, value in arrays.items() if key.startswith("model_")}
+        model["kind"] = meta["kind"]
+        return cls(meta["input_columns"], meta["n_features"], preprocessing, model, meta["classes"])
+
+    def save(self, path):
+        """
+        Write the scorer to a NumPy ``.npz`` file (no pickled objects).
+        """
+        arrays, meta = self.to_arrays()
+        np.savez(path, meta=np.array(json.dumps(meta)), **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a scorer written by ``save``.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            arrays = {key: data[key] for key in data.files if key != "meta"}
+        return cls.from_arrays(arrays, meta)
+
+
+def export_numpy_scorer(pipeline):
+    """
+    Flatten a fitted (ColumnTransformer, classifier) pipeline into a NumpyScorer.
+
+    Supported steps are the ones this project fits: StandardScaler,
+    OneHotEncoder, OrdinalEncoder, passthrough and drop columns, followed by an
+    RBF or linear SVC, a LogisticRegression or a DecisionTreeClassifier.
+
+    Parameters
+    ----------
+    pipeline : sklearn.pipeline.Pipeline
+        Fitted two-step pipeline, e.g. ``final_model.pickle``.
+
+    Returns
+    -------
+    NumpyScorer
+        Scorer giving the same predictions from plain NumPy arrays.
+    """
+    if len(pipeline.steps) != 2:
+        raise ValueError("Expected a (preprocessor, classifier) pipeline")
+    preprocessor, model = pipeline[0], pipeline[-1]
+    inputs, n_out, spec = _flatten_preprocessor(preprocessor)
+    preprocessing = {key: np.asarray(value, dtype=float if key in ("offset", "scale") else None)
+                     for key, value in spec.items() if key != "categories"}
+    for key in ("scale_src", "scale_out", "pass_src", "pass_out", "onehot_src", "onehot_out",
+                "ordinal_src", "ordinal_out"):
+        preprocessing[key] = preprocessing[key].astype(np.int64)
+    preprocessing["onehot_ignore"] = preprocessing["onehot_ignore"].astype(bool)
+    preprocessing["categories"] = spec["categories"]
+    return NumpyScorer(inputs, n_out, preprocessing, _flatten_classifier(model), model.classes_)
@@ -1,20 +1,118 @@
-from sklearn.model_selection import RandomizedSearchCV
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import RandomizedSearchCV, HalvingRandomSearchCV
 from sklearn.metrics import fbeta_score, make_scorer
 from sklearn.pipeline import make_pipeline
+from sklearn.linear_model import LogisticRegression
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
 
-def tune_hyperparameters(X_train, y_train, model, preprocessor, param_dist, pos_label, beta, seed):
+from utils.search_cache import search_fingerprint, load_search, save_search
+from utils.fold_plan import hash_splits
+from utils.search_journal import journaled_search
+from utils.svm_kernel_search import tune_svm_kernel_reuse
+from utils.logreg_path_search import tune_logreg_path
+from utils.tree_depth_search import tune_tree_depth
+
+SEARCH_MODES = ("random", "halving", "path")
+
+# specialised tuners used by search="path", keyed on the classifier type
+PATH_TUNERS = {
+    SVC: tune_svm_kernel_reuse,
+    LogisticRegression: tune_logreg_path,
+    DecisionTreeClassifier: tune_tree_depth,
+}
+
+def tune_hyperparameters(X_train, y_train, model, preprocessor, param_dist, pos_label, beta, seed, cache_dir=None,
+                         search="random", resource="n_samples", memory=None, n_jobs=-1, journal=None,
+                         model_name=None, cv=5):
     """
     Tune the hyperparameters of the model using RandomizedSearchCV and return the fitted model
 
+    With ``search="halving"`` a HalvingRandomSearchCV is used instead: all candidates
+    are first scored on a small budget and only the best third moves on to the next,
+    three times larger, budget. The budget is the number of training rows by default,
+    with the same 10 candidates as the randomized search and a first budget chosen so
+    that the last round trains on all rows (rounded down to a multiple of that first budget);
+    any other ``resource`` (e.g. ``"logisticregression__max_iter"``) is taken out of
+    ``param_dist`` and its smallest and largest listed values become the budget range.
+
+    With ``search="path"`` models that have a specialised tuner in ``PATH_TUNERS``
+    evaluate the same candidates and folds as the randomized search while sharing
+    work between candidates (e.g. one RBF kernel per fold and gamma for the SVM, a
+    warm-started C path for logistic regression, one full-depth tree per fold for
+    the decision tree); other models fall back to the randomized search.
+
+    ``cv`` is the number of stratified folds or explicit (train, test) index arrays,
+    e.g. from ``utils.fold_plan.fold_plan_splits``, shared with other stages.
+
+    ``n_jobs`` is the number of workers the search uses (-1 for all CPUs); the
+    specialised path tuners use them to score folds in parallel.
+
+    ``memory`` is passed on to the pipeline (e.g. a ``utils.transform_cache.TransformCache``)
+    so the preprocessor is fitted once per fold and reused by every candidate.
+
+    With a ``journal`` (``utils.search_journal.SearchJournal``) the randomized search
+    records every finished (candidate, fold) score and skips the ones already in the
+    journal, so an interrupted search resumes where it stopped. ``model_name`` is
+    stored with the records. Halving and path searches are not journaled.
+
+    If ``cache_dir`` is given, the fitted search is looked up in (and stored to) that
+    directory under a fingerprint of the training data, preprocessor, parameter
+    distribution, scorer settings and seed, so unchanged reruns skip the fit.
+
     Returns
     -------
-    RandomizedSearchCV object that is fit on (X_train, y_train)
+    RandomizedSearchCV (HalvingRandomSearchCV or SearchResult) object that is fit on (X_train, y_train)
     """
     if param_dist == {} or beta < 0:
         raise ValueError
     if pos_label not in y_train.values:
         raise ValueError
-    model = make_pipeline(preprocessor, model)
-    search_model = RandomizedSearchCV(model, param_dist, return_train_score=True, random_state=seed,
-                                    n_jobs=-1, scoring=make_scorer(fbeta_score, pos_label=pos_label, beta=beta))
-    return search_model.fit(X_train, y_train)
\ No newline at end of file
+    if search not in SEARCH_MODES:
+        raise ValueError(f"search must be one of {SEARCH_MODES}, got {search!r}")
+    if search == "halving" and resource != "n_samples" and resource not in param_dist:
+        raise ValueError(f"resource {resource!r} is not a key of param_dist")
+
+    key = search_fingerprint(X_train, y_train, model, preprocessor, param_dist, pos_label, beta, seed,
+                             search=search, resource=resource, cv=hash_splits(cv))
+    if cache_dir is not None:
+        cached = load_search(cache_dir, key)
+        if cached is not None:
+            return cached
+
+    if search == "path" and type(model) in PATH_TUNERS:
+        search_model = PATH_TUNERS[type(model)](X_train, y_train, model, preprocessor, param_dist, pos_label, beta,
+                                                seed, cv=cv, memory=memory, n_jobs=n_jobs)
+    elif search == "random" and journal is not None:
+        search_model = journaled_search(X_train, y_train, make_pipeline(preprocessor, model, memory=memory),
+                                        param_dist, pos_label, beta, seed, journal, key, model_name=model_name,
+                                        cv=cv, n_jobs=n_jobs)
+    else:
+        search_model = _randomized_search(make_pipeline(preprocessor, model, memory=memory), param_dist,
+                                          pos_label, beta, seed, search, resource, n_jobs, cv)
+        search_model.fit(X_train, y_train)
+
+    if cache_dir is not None:
+        save_search(cache_dir, key, search_model)
+    return search_model
+
+
+def _randomized_search(model, param_dist, pos_label, beta, seed, search, resource, n_jobs, cv):
+    """
+    Build the (unfitted) randomized or successive-halving search for a pipeline.
+    """
+    scorer = make_scorer(fbeta_score, pos_label=pos_label, beta=beta)
+    if search == "halving":
+        budget = {"resource": resource}
+        if resource == "n_samples":
+            # the randomized search's 10 candidates, with the first budget chosen so the last round
+            # trains on the full training folds and its scores are comparable with the other modes
+            budget.update(n_candidates=10, min_resources="exhaust")
+        else:
+            values = param_dist[resource]
+            param_dist = {name: dist for name, dist in param_dist.items() if name != resource}
+            budget.update(min_resources=int(min(values)), max_resources=int(max(values)))
+        return HalvingRandomSearchCV(model, param_dist, return_train_score=True, random_state=seed,
+                                     n_jobs=n_jobs, scoring=scorer, cv=cv, **budget)
+    return RandomizedSearchCV(model, param_dist, return_train_score=True, random_state=seed,
+                              n_jobs=n_jobs, scoring=scorer, cv=cv)
@@ -0,0 +1,86 @@
+import time
+import warnings
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.model_selection import check_cv
+from sklearn.utils.parallel import Parallel, delayed
+
+SCORE_COLUMNS = ("fit_time", "score_time", "test_score", "train_score")
+
+
+def _fit_and_score_fold(name, pipeline, X, y, fold, train_idx, test_idx, scorer, return_train_score):
+    """
+    Fit one model on one fold and return its scores and timings.
+    """
+    estimator = clone(pipeline)
+    X_fold_train, y_fold_train = X.iloc[train_idx], y.iloc[train_idx]
+    record = {"model": name, "fold": fold}
+    start = time.time()
+    try:
+        estimator.fit(X_fold_train, y_fold_train)
+    except Exception as e:
+        warnings.warn(f"Fitting {name} failed on fold {fold}: {e}", UserWarning)
+        record.update(fit_time=time.time() - start, score_time=0.0, test_score=np.nan)
+        if return_train_score:
+            record["train_score"] = np.nan
+        return record
+    record["fit_time"] = time.time() - start
+
+    start = time.time()
+    record["test_score"] = scorer(estimator, X.iloc[test_idx], y.iloc[test_idx])
+    record["score_time"] = time.time() - start
+    if return_train_score:
+        record["train_score"] = scorer(estimator, X_fold_train, y_fold_train)
+    return record
+
+
+def cross_validate_models(pipelines, X, y, scoring, cv=5, n_jobs=-1, return_train_score=True, on_result=None):
+    """
+    Cross-validate several models at once, spreading every (model, fold) pair over one pool of workers.
+
+    The folds and scores are the ones ``cross_validate`` gives for each model
+    separately, but a slow model no longer holds up the others and adding
+    models adds work to the pool rather than another serial loop.
+
+    Parameters
+    ----------
+    pipelines : dict
+        Dictionary with model names as keys and unfitted pipelines as values.
+    X : pandas.DataFrame
+        Training features.
+    y : pandas.Series
+        Training target.
+    scoring : callable
+        Scorer called as ``scoring(estimator, X, y)``, e.g. from ``make_scorer``.
+    cv : int or iterable, optional
+        Cross-validation splitting strategy, by default 5 stratified folds.
+    n_jobs : int, optional
+        Number of workers, by default -1 (all CPUs).
+    return_train_score : bool, optional
+        Whether to also score each fold's training data, by default True.
+    on_result : callable, optional
+        Called with each (model, fold) result dict as soon as it finishes, in
+        completion order, by default None.
+
+    Returns
+    -------
+    dict
+        Dictionary with model names as keys and ``cross_validate``-style
+        dictionaries of per-fold arrays as values.
+    """
+    splits = list(check_cv(cv, y, classifier=True).split(X, y))
+    columns = [c for c in SCORE_COLUMNS if return_train_score or c != "train_score"]
+    scores = {name: {c: np.empty(len(splits)) for c in columns} for name in pipelines}
+
+    results = Parallel(n_jobs=n_jobs, return_as="generator_unordered")(
+        delayed(_fit_and_score_fold)(name, pipeline, X, y, fold, train_idx, test_idx, scoring, return_train_score)
+        for name, pipeline in pipelines.items()
+        for fold, (train_idx, test_idx) in enumerate(splits)
+    )
+    for record in results:
+        if on_result is not None:
+            on_result(record)
+        for c in columns:
+            scores[record["model"]][c][record["fold"]] = record[c]
+    return scores
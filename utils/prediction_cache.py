@@ -0,0 +1,182 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+
+from utils.artifact_store import load_model
+from utils.numpy_scorer import NumpyScorer
+
+# model methods whose per-row outputs are cached
+CACHED_METHODS = ("predict", "decision_function", "predict_proba")
+
+
+def model_feature_columns(model):
+    """
+    Input columns a fitted model actually uses.
+
+    Columns a ColumnTransformer drops (e.g. ``patient_id``) are left out, so
+    rows that differ only in them share a cache entry.
+
+    Parameters
+    ----------
+    model :
+        Fitted pipeline, NumpyScorer or estimator with ``feature_names_in_``.
+
+    Returns
+    -------
+    list of str
+        Used input columns, in the model's input order.
+    """
+    if isinstance(model, NumpyScorer):
+        p = model.preprocessing
+        used = np.unique(np.concatenate([p["scale_src"], p["pass_src"], p["onehot_src"], p["ordinal_src"]]))
+        return [model.input_columns[i] for i in used.astype(int)]
+    first = model[0] if isinstance(model, Pipeline) else model
+    if isinstance(first, ColumnTransformer):
+        used = set()
+        for _, transformer, columns in first.transformers_:
+            if not (isinstance(transformer, str) and transformer == "drop"):
+                used.update(columns)
+        return [c for c in first.feature_names_in_ if c in used]
+    return list(model.feature_names_in_)
+
+
+class CachedModel:
+    """
+    Bounded LRU cache of per-row predictions in front of a fitted model.
+
+    Rows are keyed on their canonicalized feature tuple (the used feature
+    columns as float64, with -0.0 and NaN normalized), so exact repeats are
+    answered without calling the model; repeats within one batch are scored
+    once. ``predict``, ``decision_function`` and ``predict_proba`` are cached
+    separately and only offered when the wrapped model has them.
+
+    With ``model_path`` the file is checked (size and modification time) at
+    most every ``check_interval`` seconds; when it changes the model is
+    reloaded and the cache cleared, so predictions of a replaced model are
+    never served.
+
+    Parameters
+    ----------
+    model :
+        Fitted model, or None to load it from ``model_path``.
+    maxsize : int, optional
+        Maximum number of cached (method, row) entries, by default 100000.
+    feature_columns : list of str, optional
+        Columns forming the key, by default ``model_feature_columns(model)``.
+    model_path : str, optional
+        Pickle or artifact the model was loaded from, watched for changes.
+    check_interval : float, optional
+        Seconds between checks of ``model_path``, by default 1.
+    """
+
+    def __init__(self, model=None, maxsize=100000, feature_columns=None, model_path=None, check_interval=1.0):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if model is None and model_path is None:
+            raise ValueError("Either model or model_path is needed")
+        self.maxsize = maxsize
+        self.model_path = model_path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._explicit_columns = feature_columns
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._signature = self._file_signature()
+        self._checked = time.monotonic()
+        self._set_model(model if model is not None else load_model(model_path))
+
+    def _set_model(self, model):
+        self.model = model
+        self.feature_columns = list(self._explicit_columns or model_feature_columns(model))
+
+    def _file_signature(self):
+        if self.model_path is None:
+            return None
+        stat = os.stat(self.model_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _check_model(self):
+        if self.model_path is None or time.monotonic() - self._checked < self.check_interval:
+            return
+        self._checked = time.monotonic()
+        signature = self._file_signature()
+        if signature != self._signature:
+            model = load_model(self.model_path)
+            with self._lock:
+                self._signature = signature
+                self._set_model(model)
+                self._entries.clear()
+                self.invalidations += 1
+
+    def __getattr__(self, name):
+        # only reached for attributes not set in __init__; "model" itself is missing while unpickling
+        if name == "model":
+            raise AttributeError(name)
+        if name in CACHED_METHODS and hasattr(self.model, name):
+            return lambda X: self._cached(name, X)
+        if name == "classes_":
+            return self.model.classes_
+        raise AttributeError(name)
+
+    def _keys(self, X):
+        values = X[self.feature_columns].to_numpy(dtype=np.float64) + 0.0
+        values[np.isnan(values)] = np.nan
+        return [row.tobytes() for row in np.ascontiguousarray(values)]
+
+    def _cached(self, method, X):
+        self._check_model()
+        keys = self._keys(X)
+        out = [None] * len(keys)
+        missing = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                entry = self._entries.get((method, key))
+                if entry is None:
+                    missing.setdefault(key, []).append(i)
+                else:
+                    self._entries.move_to_end((method, key))
+                    out[i] = entry
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            # score each distinct missing row once; duplicates in the batch reuse the result
+            values = getattr(self.model, method)(X.iloc[[positions[0] for positions in missing.values()]])
+            with self._lock:
+                for (key, positions), value in zip(missing.items(), values):
+                    self._entries[(method, key)] = value
+                    for i in positions:
+                        out[i] = value
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return np.array(out)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Cache statistics.
+
+        Returns
+        -------
+        dict
+            Hits and misses (rows answered from the cache or scored by the
+            model), hit rate, current size, maximum size, evictions and
+            invalidations after model changes.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses,
+                    "hit_rate": self.hits / lookups if lookups else None, "size": len(self._entries),
+                    "maxsize": self.maxsize, "evictions": self.evictions, "invalidations": self.invalidations}
@@ -0,0 +1,288 @@
+import glob
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+import sklearn
+
+from utils.search_cache import to_jsonable
+
+MANIFEST = "manifest.json"
+
+
+def file_fingerprint(path, block_size=1 << 20):
+    """
+    SHA-256 of a file's contents.
+
+    Parameters
+    ----------
+    path : str
+        File to hash.
+    block_size : int, optional
+        Bytes read at a time, by default 1 MiB.
+
+    Returns
+    -------
+    str
+        Hex digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def code_fingerprint(*paths):
+    """
+    Fingerprint of the code producing an artifact.
+
+    Hashes the contents of the given source files (directories contribute all
+    their ``.py`` files) together with the numpy, pandas and scikit-learn
+    versions, so any code or library change gives a new registry key.
+
+    Parameters
+    ----------
+    *paths : str
+        Source files or directories.
+
+    Returns
+    -------
+    str
+        Hex digest of the code and library versions.
+    """
+    files = []
+    for path in paths:
+        files += sorted(glob.glob(os.path.join(path, "*.py"))) if os.path.isdir(path) else [path]
+    digest = hashlib.sha256(f"numpy={np.__version__} pandas={pd.__version__} sklearn={sklearn.__version__}".encode())
+    for path in files:
+        digest.update(os.path.basename(path).encode())
+        digest.update(file_fingerprint(path).encode())
+    return digest.hexdigest()
+
+
+def remove_unwritten(outputs, written):
+    """
+    Delete the outputs a run did not write, so no file of an earlier run is left next to the new ones.
+
+    Parameters
+    ----------
+    outputs : dict
+        Mapping of name to the path of every file the stage can write.
+    written : iterable of str
+        Names of the files this run wrote.
+
+    Returns
+    -------
+    list of str
+        Paths that were deleted.
+    """
+    removed = []
+    for name, path in outputs.items():
+        if name not in written and os.path.exists(path):
+            os.remove(path)
+            removed.append(path)
+    return removed
+
+
+class ArtifactRegistry:
+    """
+    Local content-addressed store for pipeline outputs.
+
+    Each entry is a directory named after a key computed from everything that
+    determines the outputs (data fingerprints, code version, hyperparameters,
+    seed); it holds copies of the output files and a manifest. A stage looks
+    its key up before computing: on a hit the stored files are copied to the
+    paths the stage would write, otherwise the stage runs and stores them. As
+    entries are never overwritten, models trained on different inputs are
+    kept side by side.
+
+    Parameters
+    ----------
+    root : str
+        Registry directory.
+    max_bytes : int, optional
+        Size cap; after every store the least recently used entries are
+        removed until the registry fits, by default no cap.
+    """
+
+    def __init__(self, root, max_bytes=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.join(self.root, "objects"), exist_ok=True)
+
+    @staticmethod
+    def key(kind, **inputs):
+        """
+        Registry key of a stage's outputs.
+
+        Parameters
+        ----------
+        kind : str
+            Stage name, e.g. "preprocessing".
+        **inputs
+            Everything the outputs depend on (fingerprints, parameters, seed).
+
+        Returns
+        -------
+        str
+            Hex digest identifying the outputs.
+        """
+        spec = to_jsonable({"kind": kind, "inputs": inputs})
+        return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+    def _entry_dir(self, key):
+        return os.path.join(self.root, "objects", key[:2], key)
+
+    def lookup(self, key):
+        """
+        Manifest of a stored entry, or None if the key is not in the registry.
+
+        A hit marks the entry as recently used for garbage collection.
+        """
+        manifest_path = os.path.join(self._entry_dir(key), MANIFEST)
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return None
+        os.utime(manifest_path)
+        return manifest
+
+    def path(self, key, name):
+        """
+        Path of a stored file inside the registry (e.g. to load it without copying).
+        """
+        return os.path.join(self._entry_dir(key), "files", name)
+
+    def store(self, key, files, kind=None, inputs=None):
+        """
+        Copy output files into the registry under ``key``.
+
+        The entry is assembled in a temporary directory and renamed into
+        place, so readers never see a partial entry. Storing a key that is
+        already present keeps the existing entry.
+
+        Parameters
+        ----------
+        key : str
+            Key from ``key``.
+        files : dict
+            Mapping of name to the path of a file to store.
+        kind : str, optional
+            Stage name recorded in the manifest.
+        inputs : dict, optional
+            Human-readable description of the inputs recorded in the manifest.
+
+        Returns
+        -------
+        dict
+            Manifest of the entry.
+        """
+        existing = self.lookup(key)
+        if existing is not None:
+            return existing
+        tmp_dir = os.path.join(self.root, "tmp", uuid.uuid4().hex)
+        os.makedirs(os.path.join(tmp_dir, "files"))
+        manifest = {"key": key, "kind": kind, "created": time.time(), "inputs": to_jsonable(inputs or {}),
+                    "files": {}}
+        for name, path in files.items():
+            shutil.copyfile(path, os.path.join(tmp_dir, "files", name))
+            manifest["files"][name] = {"bytes": os.path.getsize(path), "sha256": file_fingerprint(path)}
+        with open(os.path.join(tmp_dir, MANIFEST), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        entry_dir = self._entry_dir(key)
+        os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # another process stored the same key first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        if self.max_bytes is not None:
+            self.gc(self.max_bytes, keep=key)
+        return self.lookup(key) or manifest
+
+    def restore(self, key, destinations):
+        """
+        Copy a stored entry's files to the paths a stage writes.
+
+        Parameters
+        ----------
+        key : str
+            Key from ``key``.
+        destinations : dict
+            Mapping of stored file name to destination path; stored files that
+            are not listed are left in the registry. Destinations the entry
+            does not hold (e.g. an optional output the stored run did not
+            write) are deleted, so they cannot be mistaken for its outputs.
+
+        Returns
+        -------
+        bool
+            True if the key was found and its files copied, False on a miss.
+        """
+        manifest = self.lookup(key)
+        if manifest is None:
+            return False
+        for name in manifest["files"]:
+            if name in destinations:
+                destination = destinations[name]
+                if os.path.dirname(destination):
+                    os.makedirs(os.path.dirname(destination), exist_ok=True)
+                shutil.copyfile(self.path(key, name), destination)
+        remove_unwritten(destinations, manifest["files"])
+        return True
+
+    def entries(self):
+        """
+        Stored entries, least recently used first.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per entry with columns key, kind, bytes, created and last_used.
+        """
+        rows = []
+        for manifest_path in glob.glob(os.path.join(self.root, "objects", "*", "*", MANIFEST)):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            rows.append({"key": manifest["key"], "kind": manifest["kind"],
+                         "bytes": sum(file["bytes"] for file in manifest["files"].values()),
+                         "created": manifest["created"], "last_used": os.path.getmtime(manifest_path)})
+        columns = ["key", "kind", "bytes", "created", "last_used"]
+        return pd.DataFrame(rows, columns=columns).sort_values("last_used", ignore_index=True)
+
+    def gc(self, max_bytes, keep=None):
+        """
+        Remove least recently used entries until the registry holds at most ``max_bytes``.
+
+        Parameters
+        ----------
+        max_bytes : int
+            Size cap in bytes of the stored files.
+        keep : str, optional
+            Key that is never removed (e.g. the entry just stored), by default None.
+
+        Returns
+        -------
+        list of str
+            Keys of the removed entries.
+        """
+        entries = self.entries()
+        total = int(entries["bytes"].sum())
+        removed = []
+        for entry in entries.itertuples():
+            if total <= max_bytes:
+                break
+            if entry.key == keep:
+                continue
+            shutil.rmtree(self._entry_dir(entry.key), ignore_errors=True)
+            total -= entry.bytes
+            removed.append(entry.key)
+        return removed
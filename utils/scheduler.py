@@ -0,0 +1,66 @@
+from joblib import effective_n_jobs
+from sklearn.utils.parallel import Parallel, delayed
+
+
+def allocate_n_jobs(n_jobs, n_tasks):
+    """
+    Split a single worker budget between concurrent tasks.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Total number of workers; negative values count back from the number
+        of CPUs as in joblib (-1 means all CPUs).
+    n_tasks : int
+        Number of tasks that should run concurrently.
+
+    Returns
+    -------
+    list of int
+        Inner worker count for each task. The list has one entry per task that
+        runs at the same time (the outer parallelism), and the entries add up
+        to at most the budget.
+    """
+    if n_tasks < 1:
+        raise ValueError("n_tasks must be at least 1")
+    budget = effective_n_jobs(n_jobs)
+    outer = min(n_tasks, budget)
+    inner, extra = divmod(budget, outer)
+    return [inner + 1 if i < extra else inner for i in range(outer)]
+
+
+def run_concurrently(func, tasks, n_jobs=-1):
+    """
+    Run ``func`` once per task, concurrently, within a single worker budget.
+
+    Each task runs in its own worker process and ``func`` receives its share of
+    the budget as the ``n_jobs`` keyword, so inner parallelism (e.g. the folds
+    of a search) uses the remaining cores. Tasks beyond the outer parallelism
+    start as soon as a worker frees up. With a budget of one worker the tasks
+    run sequentially in the current process.
+
+    Parameters
+    ----------
+    func : callable
+        Function to run. Must accept an ``n_jobs`` keyword argument.
+    tasks : dict
+        Dictionary with task names as keys and keyword arguments for ``func`` as values.
+    n_jobs : int, optional
+        Total worker budget, by default -1 (all CPUs).
+
+    Returns
+    -------
+    dict
+        Dictionary with task names as keys and the return values of ``func`` as values.
+    """
+    names = list(tasks)
+    inner = allocate_n_jobs(n_jobs, len(names))
+    if len(inner) == 1:
+        return {name: func(**tasks[name], n_jobs=inner[0]) for name in names}
+
+    # tasks that wait for a free worker get the smallest share
+    shares = [inner[i] if i < len(inner) else inner[-1] for i in range(len(names))]
+    results = Parallel(n_jobs=len(inner), backend="loky")(
+        delayed(func)(**tasks[name], n_jobs=share) for name, share in zip(names, shares)
+    )
+    return dict(zip(names, results))
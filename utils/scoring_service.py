@@ -0,0 +1,310 @@
+import json
+import queue
+import threading
+import time
+import warnings
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+from pandera.errors import SchemaWarning
+from sklearn import config_context, get_config
+
+from utils.batch_predict import predict_frame
+from utils.heart_schema import record_schema
+from utils.prediction_cache import CachedModel
+
+
+class LatencyStats:
+    """
+    Thread-safe request latency and throughput counters of a scoring service.
+
+    Parameters
+    ----------
+    window : int, optional
+        Number of most recent request latencies kept for the percentiles, by default 10000.
+    """
+
+    def __init__(self, window=10000):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self._started = time.monotonic()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.errors = 0
+
+    def record_request(self, seconds, rows, ok=True):
+        with self._lock:
+            self._latencies.append(seconds)
+            self.requests += 1
+            self.rows += rows
+            self.errors += not ok
+
+    def record_batch(self):
+        with self._lock:
+            self.batches += 1
+
+    def snapshot(self):
+        """
+        Current metrics.
+
+        Returns
+        -------
+        dict
+            Request, row, batch and error counts, p50/p99 latency in milliseconds
+            over the recent window, mean batch size and rows scored per second
+            since startup.
+        """
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            uptime = time.monotonic() - self._started
+            return {
+                "requests": self.requests,
+                "rows": self.rows,
+                "batches": self.batches,
+                "errors": self.errors,
+                "p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else None,
+                "p99_ms": float(np.percentile(latencies, 99)) if len(latencies) else None,
+                "mean_batch_rows": self.rows / self.batches if self.batches else None,
+                "rows_per_s": self.rows / uptime if uptime > 0 else None,
+            }
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent scoring requests into micro-batches.
+
+    Requests queue up while a batch is being scored; a background thread takes
+    the first waiting request, keeps collecting until ``max_batch_rows`` rows
+    or ``max_wait_ms`` milliseconds, scores all of them with one call and
+    hands each request its own slice of the result. Per-call overhead (pandas,
+    validation, ColumnTransformer) is then paid once per batch instead of once
+    per request.
+
+    Parameters
+    ----------
+    score : callable
+        Function scoring a DataFrame and returning a DataFrame with one row per input row.
+    max_batch_rows : int, optional
+        Maximum number of rows scored together, by default 256.
+    max_wait_ms : float, optional
+        Longest time the first request of a batch waits for others, by default 2.
+    stats : LatencyStats, optional
+        Counters updated with every batch, by default None.
+    """
+
+    def __init__(self, score, max_batch_rows=256, max_wait_ms=2.0, stats=None):
+        if max_batch_rows < 1:
+            raise ValueError("max_batch_rows must be at least 1")
+        self.score = score
+        self.max_batch_rows = max_batch_rows
+        self.max_wait = max_wait_ms / 1000
+        self.stats = stats
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, frame):
+        """
+        Queue a DataFrame of records for scoring.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the scored rows of ``frame``, or to the exception raised while scoring them.
+        """
+        future = Future()
+        self._queue.put((frame, future))
+        return future
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            rows = len(item[0])
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while rows < self.max_batch_rows:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                rows += len(item[0])
+            self._score_batch(batch)
+            if stop:
+                return
+
+    def _score_batch(self, batch):
+        if self.stats is not None:
+            self.stats.record_batch()
+        try:
+            scored = self.score(pd.concat([frame for frame, _ in batch], ignore_index=True))
+        except Exception:
+            # score requests one by one so an invalid record only fails its own request
+            for frame, future in batch:
+                try:
+                    future.set_result(self.score(frame.reset_index(drop=True)))
+                except Exception as e:
+                    future.set_exception(e)
+            return
+        start = 0
+        for frame, future in batch:
+            future.set_result(scored.iloc[start:start + len(frame)].reset_index(drop=True))
+            start += len(frame)
+
+
+class ScoringService:
+    """
+    Validate records against the heart disease schema and score them with a fitted model.
+
+    Parameters
+    ----------
+    model :
+        Fitted pipeline (preprocessor + classifier), loaded once.
+    scores : bool, optional
+        Also return the decision score for ``pos_label``, by default False.
+    pos_label : str or int, optional
+        Positive class label for scores and thresholds, by default None.
+    threshold : float, optional
+        Decision threshold on the score, by default the model's own rule.
+    max_batch_rows : int, optional
+        Maximum number of rows scored together, by default 256.
+    max_wait_ms : float, optional
+        Longest time a request waits for others to batch with, by default 2.
+    """
+
+    def __init__(self, model, scores=False, pos_label=None, threshold=None, max_batch_rows=256, max_wait_ms=2.0):
+        self.model = model
+        self.schema = record_schema()
+        self.columns = list(self.schema.columns)
+        self.options = dict(scores=scores, pos_label=pos_label, threshold=threshold)
+        # scikit-learn settings such as transform_output are per thread, so the batching thread reuses the caller's
+        self.config = get_config()
+        self.stats = LatencyStats()
+        self.batcher = MicroBatcher(self._score, max_batch_rows=max_batch_rows, max_wait_ms=max_wait_ms,
+                                    stats=self.stats)
+
+    def _score(self, frame):
+        with warnings.catch_warnings(), config_context(**self.config):
+            # outlier checks only warn; they would be repeated for every batch
+            warnings.simplefilter("ignore", SchemaWarning)
+            validated = self.schema.validate(frame, lazy=True)
+            return predict_frame(self.model, validated, **self.options)
+
+    def predict(self, records):
+        """
+        Score a list of records, batched with any concurrent requests.
+
+        Parameters
+        ----------
+        records : list of dict
+            Records with every feature column of the schema.
+
+        Returns
+        -------
+        list of dict
+            One output record ("prediction" and optionally "score") per input record.
+        """
+        start = time.monotonic()
+        ok = False
+        try:
+            if not isinstance(records, list) or not records:
+                raise ValueError("Expected a non-empty list of records")
+            frame = pd.DataFrame.from_records(records)
+            missing = [c for c in self.columns if c not in frame.columns]
+            if missing:
+                raise ValueError(f"Records are missing the columns {missing}")
+            result = self.batcher.submit(frame[self.columns]).result()
+            ok = True
+            return result.to_dict(orient="records")
+        finally:
+            self.stats.record_request(time.monotonic() - start, len(records) if isinstance(records, list) else 0, ok)
+
+    def metrics(self):
+        """
+        Latency and throughput metrics, plus the prediction cache statistics when the model has a cache.
+        """
+        metrics = self.stats.snapshot()
+        if isinstance(self.model, CachedModel):
+            metrics["cache"] = self.model.stats()
+        return metrics
+
+    def close(self):
+        self.batcher.close()
+
+
+def _handler(service):
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def _send(self, status, body):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send(200, {"status": "ok"})
+            elif self.path == "/metrics":
+                self._send(200, service.metrics())
+            else:
+                self._send(404, {"error": f"Unknown path {self.path}"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                self._send(404, {"error": f"Unknown path {self.path}"})
+                return
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                records = body["records"] if isinstance(body, dict) else body
+                self._send(200, {"predictions": service.predict(records)})
+            except Exception as e:
+                self._send(400, {"error": f"{type(e).__name__}: {e}"})
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def make_server(service, host="127.0.0.1", port=8000):
+    """
+    HTTP server exposing a ScoringService.
+
+    Endpoints: ``POST /predict`` with ``{"records": [...]}`` (or a bare list),
+    ``GET /metrics`` and ``GET /health``. Each connection is handled in its own
+    thread, so concurrent requests reach the micro-batcher together.
+
+    Parameters
+    ----------
+    service : ScoringService
+        Service answering the requests.
+    host : str, optional
+        Interface to bind, by default "127.0.0.1" (local only).
+    port : int, optional
+        Port to listen on; 0 picks a free port, by default 8000.
+
+    Returns
+    -------
+    http.server.ThreadingHTTPServer
+        Server ready for ``serve_forever``.
+    """
+    server = ThreadingHTTPServer((host, port), _handler(service))
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,138 @@
+import hashlib
+import json
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+
+def to_jsonable(value):
+    """
+    Convert parameter values (numpy arrays, numpy scalars, estimators) into
+    something ``json.dumps`` can serialise deterministically.
+    """
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return repr(value)
+
+
+def hash_frame(df):
+    """
+    Hash the contents of a pandas DataFrame or Series.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pandas.Series
+        Data to hash. Column names and values are included, the index is not.
+
+    Returns
+    -------
+    str
+        Hex digest identifying the data.
+    """
+    digest = hashlib.sha256()
+    if isinstance(df, pd.DataFrame):
+        digest.update(json.dumps([str(c) for c in df.columns]).encode())
+    else:
+        digest.update(str(df.name).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def search_fingerprint(X_train, y_train, model, preprocessor, param_dist, pos_label, beta, seed, **settings):
+    """
+    Build a fingerprint for a hyperparameter search.
+
+    Parameters
+    ----------
+    X_train : pandas.DataFrame
+        Training features.
+    y_train : pandas.Series
+        Training target.
+    model :
+        Unfitted scikit-learn classifier.
+    preprocessor :
+        scikit-learn transformer placed in front of the model.
+    param_dist : dict
+        Hyperparameter distribution searched over.
+    pos_label : str or int
+        Positive class label used by the F-beta scorer.
+    beta : float
+        Beta used by the F-beta scorer.
+    seed : int
+        Random seed of the search.
+    **settings
+        Any further search settings that change the result (e.g. search mode).
+
+    Returns
+    -------
+    str
+        Hex digest that changes whenever any of the inputs change.
+    """
+    spec = {
+        "X_train": hash_frame(X_train),
+        "y_train": hash_frame(y_train),
+        "model": to_jsonable(model.get_params(deep=True)),
+        "model_class": type(model).__name__,
+        "preprocessor": hashlib.sha256(pickle.dumps(preprocessor)).hexdigest(),
+        "param_dist": to_jsonable(param_dist),
+        "pos_label": to_jsonable(pos_label),
+        "beta": float(beta),
+        "seed": seed,
+        "settings": to_jsonable(settings),
+    }
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+
+def load_search(cache_dir, key):
+    """
+    Load a previously fitted search from the cache.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory holding cached searches.
+    key : str
+        Fingerprint returned by ``search_fingerprint``.
+
+    Returns
+    -------
+    object or None
+        The fitted search object, or None if it is not cached.
+    """
+    path = os.path.join(cache_dir, f"{key}.pickle")
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def save_search(cache_dir, key, search):
+    """
+    Store a fitted search in the cache.
+
+    The file is written to a temporary name first and then renamed, so an
+    interrupted write never leaves a truncated entry behind.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory holding cached searches.
+    key : str
+        Fingerprint returned by ``search_fingerprint``.
+    search : object
+        Fitted search object (e.g. RandomizedSearchCV).
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{key}.pickle")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(search, f)
+    os.replace(tmp_path, path)
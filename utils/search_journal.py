@@ -0,0 +1,169 @@
+import json
+import os
+import time
+
+import numpy as np
+from sklearn.model_selection import ParameterSampler, check_cv
+from sklearn.utils.parallel import Parallel, delayed
+
+from utils.search_cache import to_jsonable
+from utils.search_results import build_search_result, fit_and_score
+
+
+class SearchJournal:
+    """
+    Append-only on-disk journal of finished (model, candidate, fold) evaluations.
+
+    Each evaluation is written as one JSON line as soon as it finishes, with a
+    single ``write`` on a file opened in append mode, so several worker processes
+    can share one journal. After an interruption the journal tells a rerun which
+    evaluations it can skip.
+
+    Parameters
+    ----------
+    path : str
+        Path of the journal file (JSON lines).
+    resume : bool, optional
+        Keep the existing entries (True) or start a new journal (False), by default
+        False. A new journal never deletes an existing one: the old file is renamed
+        with a timestamp suffix and its path kept in ``previous``.
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.previous = None
+        # whether a partial last line left by a crash has been terminated yet
+        self._tail_checked = False
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not resume and os.path.exists(path):
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            previous, n = f"{path}.{stamp}", 1
+            while os.path.exists(previous):
+                previous, n = f"{path}.{stamp}-{n}", n + 1
+            os.replace(path, previous)
+            self.previous = previous
+
+    def append(self, record):
+        """
+        Durably append one finished evaluation to the journal.
+
+        If the journal ends in a line cut short by a crash, the first append
+        starts a new line, so the record is not glued onto the fragment.
+
+        Parameters
+        ----------
+        record : dict
+            JSON-serialisable evaluation record.
+        """
+        line = (json.dumps(record) + "\n").encode()
+        fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if not self._tail_checked:
+                size = os.fstat(fd).st_size
+                if size > 0 and os.pread(fd, 1, size - 1) != b"\n":
+                    line = b"\n" + line
+                self._tail_checked = True
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def completed(self, search_key):
+        """
+        Return the evaluations already recorded for one search.
+
+        Parameters
+        ----------
+        search_key : str
+            Fingerprint of the search.
+
+        Returns
+        -------
+        dict
+            Dictionary with (candidate, fold) tuples as keys and records as values.
+        """
+        done = {}
+        if not os.path.exists(self.path):
+            return done
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # a write cut short by the interruption; that evaluation is simply redone
+                    continue
+                if record.get("search") == search_key:
+                    done[(record["candidate"], record["fold"])] = record
+        return done
+
+
+def journaled_search(X_train, y_train, pipeline, param_dist, pos_label, beta, seed, journal, search_key,
+                     model_name=None, n_iter=10, cv=5, n_jobs=-1):
+    """
+    Randomized search that records every (candidate, fold) result in a journal and
+    skips the ones a previous, interrupted run already recorded.
+
+    The candidates, folds and scores are the ones ``RandomizedSearchCV`` would
+    produce with the same seed.
+
+    Parameters
+    ----------
+    X_train : pandas.DataFrame
+        Training features.
+    y_train : pandas.Series
+        Training target.
+    pipeline : sklearn.pipeline.Pipeline
+        Unfitted preprocessor + model pipeline.
+    param_dist : dict
+        Hyperparameter distribution to sample candidates from.
+    pos_label : str or int
+        Positive class label for fbeta_score.
+    beta : float
+        Beta parameter for fbeta_score.
+    seed : int
+        Random seed for candidate sampling.
+    journal : SearchJournal
+        Journal to read finished evaluations from and append new ones to.
+    search_key : str
+        Fingerprint identifying this search in the journal.
+    model_name : str, optional
+        Model name stored with each record for readability, by default None.
+    n_iter : int, optional
+        Number of candidates to sample, by default 10.
+    cv : int or iterable, optional
+        Cross-validation splitting strategy, by default 5 stratified folds.
+    n_jobs : int, optional
+        Number of workers evaluating candidates, by default -1 (all CPUs).
+
+    Returns
+    -------
+    SearchResult
+        Search result with a ``cv_results_`` table and the best pipeline refitted on all data.
+    """
+    candidates = list(ParameterSampler(param_dist, n_iter=n_iter, random_state=seed))
+    splits = list(check_cv(cv, y_train, classifier=True).split(X_train, y_train))
+    done = journal.completed(search_key)
+    pending = [(i, k) for i in range(len(candidates)) for k in range(len(splits)) if (i, k) not in done]
+
+    def evaluate(i, k):
+        record = fit_and_score(pipeline, candidates[i], X_train, y_train, *splits[k], pos_label, beta)
+        return dict(record, candidate=i, fold=k)
+
+    results = Parallel(n_jobs=n_jobs, return_as="generator_unordered")(
+        delayed(evaluate)(i, k) for i, k in pending
+    )
+    for record in results:
+        record.update(search=search_key, model=model_name, params=to_jsonable(candidates[record["candidate"]]))
+        journal.append(record)
+        done[(record["candidate"], record["fold"])] = record
+
+    shape = (len(candidates), len(splits))
+    columns = {name: np.empty(shape) for name in ("test_score", "train_score", "fit_time", "score_time")}
+    for (i, k), record in done.items():
+        if i < len(candidates) and k < len(splits):
+            for name, values in columns.items():
+                values[i, k] = record[name]
+    return build_search_result(candidates, columns["test_score"], columns["train_score"], columns["fit_time"],
+                               columns["score_time"], pipeline, X_train, y_train)
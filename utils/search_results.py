@@ -0,0 +1,135 @@
+import time
+import warnings
+
+import numpy as np
+from scipy.stats import rankdata
+from sklearn.base import clone
+from sklearn.metrics import fbeta_score
+
+
+class SearchResult:
+    """
+    Fitted result of a custom hyperparameter search.
+
+    Exposes the same attributes ``hyperparameter_tuning.py`` reads from a fitted
+    ``RandomizedSearchCV`` (``cv_results_``, ``best_index_``, ``best_score_``,
+    ``best_params_``, ``best_estimator_``), so specialised tuners can be swapped
+    in for the generic search.
+    """
+
+    def __init__(self, cv_results, best_index, best_estimator, n_splits, refit_time):
+        self.cv_results_ = cv_results
+        self.best_index_ = best_index
+        self.best_score_ = float(cv_results["mean_test_score"][best_index])
+        self.best_params_ = cv_results["params"][best_index]
+        self.best_estimator_ = best_estimator
+        self.n_splits_ = n_splits
+        self.refit_time_ = refit_time
+
+    def predict(self, X):
+        """
+        Predict with the refitted best estimator.
+        """
+        return self.best_estimator_.predict(X)
+
+
+def build_search_result(candidates, test_scores, train_scores, fit_times, score_times, estimator, X, y):
+    """
+    Assemble a ``cv_results_`` table and refit the best candidate on the full data.
+
+    Parameters
+    ----------
+    candidates : list of dict
+        Parameter settings that were evaluated, in sampling order.
+    test_scores, train_scores, fit_times, score_times : array-like of shape (n_candidates, n_splits)
+        Per-candidate, per-fold validation scores, training scores and timings.
+    estimator :
+        Unfitted pipeline that the best parameters are set on before refitting.
+    X : pandas.DataFrame
+        Full training features.
+    y : pandas.Series
+        Full training target.
+
+    Returns
+    -------
+    SearchResult
+        Search result with the best estimator refitted on (X, y).
+    """
+    test_scores = np.asarray(test_scores, dtype=float)
+    train_scores = np.asarray(train_scores, dtype=float)
+    fit_times = np.asarray(fit_times, dtype=float)
+    score_times = np.asarray(score_times, dtype=float)
+    n_splits = test_scores.shape[1]
+
+    results = {
+        "mean_fit_time": fit_times.mean(axis=1),
+        "std_fit_time": fit_times.std(axis=1),
+        "mean_score_time": score_times.mean(axis=1),
+        "std_score_time": score_times.std(axis=1),
+    }
+    for name in sorted({name for params in candidates for name in params}):
+        results[f"param_{name}"] = np.ma.MaskedArray(
+            [params.get(name) for params in candidates],
+            mask=[name not in params for params in candidates],
+            dtype=object,
+        )
+    results["params"] = list(candidates)
+    for prefix, scores in [("test", test_scores), ("train", train_scores)]:
+        for split in range(n_splits):
+            results[f"split{split}_{prefix}_score"] = scores[:, split]
+        results[f"mean_{prefix}_score"] = scores.mean(axis=1)
+        results[f"std_{prefix}_score"] = scores.std(axis=1)
+        if prefix == "test":
+            # same convention as scikit-learn: failed candidates rank last
+            means = np.where(np.isnan(results["mean_test_score"]), -np.inf, results["mean_test_score"])
+            results["rank_test_score"] = rankdata(-means, method="min").astype(np.int32)
+
+    best_index = int(results["rank_test_score"].argmin())
+    start = time.time()
+    best_estimator = clone(estimator).set_params(**candidates[best_index]).fit(X, y)
+    return SearchResult(results, best_index, best_estimator, n_splits, time.time() - start)
+
+
+def fit_and_score(pipeline, params, X, y, train_idx, test_idx, pos_label, beta):
+    """
+    Fit one candidate on one fold and return its F-beta scores and timings.
+
+    A failed fit is reported with a warning and NaN scores, as in ``RandomizedSearchCV``.
+
+    Parameters
+    ----------
+    pipeline : sklearn.pipeline.Pipeline
+        Unfitted pipeline; a clone with ``params`` set is fitted.
+    params : dict
+        Candidate parameters.
+    X : pandas.DataFrame
+        Features.
+    y : pandas.Series
+        Target.
+    train_idx, test_idx : numpy.ndarray
+        Row positions of the fold's training and validation sets.
+    pos_label : str or int
+        Positive class label for fbeta_score.
+    beta : float
+        Beta parameter for fbeta_score.
+
+    Returns
+    -------
+    dict
+        Dictionary with "test_score", "train_score", "fit_time" and "score_time".
+    """
+    estimator = clone(pipeline).set_params(**params)
+    X_fold_train, y_fold_train = X.iloc[train_idx], y.iloc[train_idx]
+    start = time.time()
+    try:
+        estimator.fit(X_fold_train, y_fold_train)
+    except Exception as e:
+        warnings.warn(f"Fitting failed for {params}: {e}", UserWarning)
+        return {"test_score": np.nan, "train_score": np.nan, "fit_time": time.time() - start, "score_time": 0.0}
+    fit_time = time.time() - start
+
+    start = time.time()
+    test_score = fbeta_score(y.iloc[test_idx], estimator.predict(X.iloc[test_idx]), pos_label=pos_label, beta=beta)
+    score_time = time.time() - start
+    train_score = fbeta_score(y_fold_train, estimator.predict(X_fold_train), pos_label=pos_label, beta=beta)
+    return {"test_score": test_score, "train_score": train_score, "fit_time": fit_time, "score_time": score_time}
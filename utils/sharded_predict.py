@@ -0,0 +1,187 @@
+import io
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from sklearn import get_config, set_config
+
+from utils.artifact_store import load_model
+from utils.batch_predict import output_columns, predict_frame
+from utils.prediction_cache import CachedModel
+
+# model loaded once per worker process by _init_worker
+_worker_model = None
+
+
+def byte_range_shards(path, n_shards):
+    """
+    Split a CSV into byte ranges that start and end on line boundaries.
+
+    The data after the header line is cut into ``n_shards`` ranges of about
+    equal size, and every cut is moved forward to just after the next
+    newline, so each row falls in exactly one range. Quoted fields must not
+    contain newlines (true for the numeric heart disease data).
+
+    Parameters
+    ----------
+    path : str
+        CSV file with a header line.
+    n_shards : int
+        Number of ranges.
+
+    Returns
+    -------
+    tuple of (bytes, list of tuple)
+        The header line and the (start, end) byte offsets of each range; ranges may be empty.
+    """
+    if n_shards < 1:
+        raise ValueError("n_shards must be at least 1")
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.readline()
+        data_start = len(header)
+        cuts = [data_start]
+        for k in range(1, n_shards):
+            target = max(data_start + (size - data_start) * k // n_shards, cuts[-1])
+            if target <= data_start:
+                cuts.append(data_start)
+                continue
+            # a cut right after a newline is already a line start
+            f.seek(target - 1)
+            f.readline()
+            cuts.append(min(f.tell(), size))
+    cuts.append(size)
+    return header, list(zip(cuts[:-1], cuts[1:]))
+
+
+class _ByteRangeReader(io.RawIOBase):
+    """
+    Read-only stream of a header followed by one byte range of a file.
+    """
+
+    def __init__(self, path, header, start, end):
+        self._file = open(path, "rb")
+        self._file.seek(start)
+        self._pending = header
+        self._remaining = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._pending:
+            n = min(len(buffer), len(self._pending))
+            buffer[:n] = self._pending[:n]
+            self._pending = self._pending[n:]
+            return n
+        n = min(len(buffer), self._remaining)
+        if n == 0:
+            return 0
+        data = self._file.read(n)
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def _init_worker(model_path, config, cache_size):
+    global _worker_model
+    set_config(**config)
+    model = load_model(model_path)
+    _worker_model = CachedModel(model, maxsize=cache_size, model_path=model_path) if cache_size > 0 else model
+
+
+def _score_shard(input_path, header, start, end, part_path, chunksize, kwargs):
+    rows = 0
+    with open(part_path, "w", newline="") as out:
+        if end > start:
+            with io.BufferedReader(_ByteRangeReader(input_path, header, start, end)) as reader:
+                for chunk in pd.read_csv(reader, chunksize=chunksize):
+                    predict_frame(_worker_model, chunk, **kwargs).to_csv(out, header=rows == 0, index=False)
+                    rows += len(chunk)
+    return rows
+
+
+def predict_csv_sharded(model_path, input_path, output_path, n_workers=None, n_shards=None, chunksize=10000,
+                        cache_size=0, **kwargs):
+    """
+    Score a large CSV with a pool of processes, one byte range of the file per task.
+
+    Each worker loads the model once (a memory-mapped ``.artifact`` shares its
+    pages between workers), streams its byte range in chunks through
+    ``predict_frame`` and writes its own part file; the parts are then
+    concatenated in shard order, so the output rows are in input order.
+
+    Parameters
+    ----------
+    model_path : str
+        Fitted model pickle or artifact, loaded with ``utils.artifact_store.load_model``.
+    input_path : str
+        CSV with the feature columns.
+    output_path : str
+        CSV to write the predictions to.
+    n_workers : int, optional
+        Number of worker processes; None, 0 or -1 use the number of CPUs, by default None.
+    n_shards : int, optional
+        Number of byte ranges, by default ``n_workers``.
+    chunksize : int, optional
+        Rows per chunk within a shard, by default 10000.
+    cache_size : int, optional
+        Entries of a per-worker prediction cache, by default 0 (no cache).
+    **kwargs
+        Passed to ``predict_frame`` (scores, pos_label, threshold, id_col).
+
+    Returns
+    -------
+    dict
+        Dictionary with "rows", "seconds", "rows_per_s" and "shards".
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if n_workers is not None and n_workers < -1:
+        raise ValueError("n_workers must be positive, or None, 0 or -1 for all CPUs")
+    if n_workers in (None, 0, -1):
+        n_workers = os.cpu_count() or 1
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    header, shards = byte_range_shards(input_path, n_shards or n_workers)
+    parts = [f"{output_path}.part{k}" for k in range(len(shards))]
+    try:
+        # transform_output and other scikit-learn settings are per process
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(model_path, get_config(), cache_size)) as pool:
+            counts = list(pool.map(_score_shard, [input_path] * len(shards), [header] * len(shards),
+                                   [s for s, _ in shards], [e for _, e in shards], parts,
+                                   [chunksize] * len(shards), [kwargs] * len(shards)))
+
+        wrote_header = False
+        with open(output_path, "wb") as out:
+            for part, count in zip(parts, counts):
+                if count == 0:
+                    continue
+                with open(part, "rb") as f:
+                    if wrote_header:
+                        f.readline()
+                    shutil.copyfileobj(f, out)
+                wrote_header = True
+        if not wrote_header:
+            # no data rows at all: same header-only output as the single-process path
+            with open(output_path, "w", newline="") as out:
+                pd.DataFrame(columns=output_columns(**kwargs)).to_csv(out, index=False)
+    finally:
+        for part in parts:
+            if os.path.exists(part):
+                os.remove(part)
+
+    rows = sum(counts)
+    seconds = time.perf_counter() - start
+    return {"rows": rows, "seconds": seconds, "rows_per_s": rows / seconds if seconds > 0 else float("nan"),
+            "shards": len(shards)}
@@ -0,0 +1,138 @@
+import time
+from collections import defaultdict
+
+import numpy as np
+from sklearn.metrics import fbeta_score
+from sklearn.metrics.pairwise import rbf_kernel
+from sklearn.model_selection import ParameterSampler, check_cv
+from sklearn.pipeline import make_pipeline
+from sklearn.svm import SVC
+from sklearn.utils.parallel import Parallel, delayed
+
+from utils.search_results import build_search_result
+from utils.transform_cache import transform_fold
+
+SVC_PARAMS = ("svc__C", "svc__gamma")
+
+
+def resolve_gamma(gamma, X):
+    """
+    Turn SVC's "scale"/"auto" gamma settings into a number for the given training matrix.
+
+    Parameters
+    ----------
+    gamma : {"scale", "auto"} or float
+        ``SVC.gamma`` setting.
+    X : numpy.ndarray
+        Matrix the SVC is trained on (after preprocessing).
+
+    Returns
+    -------
+    float
+        The gamma SVC uses for that matrix.
+    """
+    if gamma == "scale":
+        variance = X.var()
+        return 1.0 / (X.shape[1] * variance) if variance != 0 else 1.0
+    if gamma == "auto":
+        return 1.0 / X.shape[1]
+    return float(gamma)
+
+
+def _score_fold(X_train, y_train, train_idx, test_idx, preprocessor, base_params, candidates, by_gamma, pos_label, beta,
+                memory):
+    """
+    Score every candidate on one fold, computing one kernel pair per gamma.
+
+    Returns the fold's test scores, train scores, fit times and score times, one entry per candidate.
+    """
+    Xt_train, Xt_test = transform_fold(preprocessor, X_train.iloc[train_idx], X_train.iloc[test_idx],
+                                       y_train.iloc[train_idx], memory)
+    y = np.asarray(y_train)
+    y_fold_train, y_fold_test = y[train_idx], y[test_idx]
+    test_scores, train_scores = np.empty(len(candidates)), np.empty(len(candidates))
+    fit_times, score_times = np.empty(len(candidates)), np.empty(len(candidates))
+    for gamma, members in by_gamma.items():
+        start = time.time()
+        gamma_value = resolve_gamma(gamma, Xt_train)
+        K_train = rbf_kernel(Xt_train, gamma=gamma_value)
+        K_test = rbf_kernel(Xt_test, Xt_train, gamma=gamma_value)
+        kernel_time = (time.time() - start) / len(members)
+
+        for i in members:
+            svc = SVC(**{**base_params, "kernel": "precomputed", "C": candidates[i].get("svc__C", base_params["C"])})
+            start = time.time()
+            svc.fit(K_train, y_fold_train)
+            fit_times[i] = time.time() - start + kernel_time
+
+            start = time.time()
+            test_scores[i] = fbeta_score(y_fold_test, svc.predict(K_test), pos_label=pos_label, beta=beta)
+            score_times[i] = time.time() - start
+            train_scores[i] = fbeta_score(y_fold_train, svc.predict(K_train), pos_label=pos_label, beta=beta)
+    return test_scores, train_scores, fit_times, score_times
+
+
+def tune_svm_kernel_reuse(X_train, y_train, model, preprocessor, param_dist, pos_label, beta, seed,
+                          n_iter=10, cv=5, memory=None, n_jobs=None):
+    """
+    Tune C and gamma of an RBF SVC, computing each kernel matrix once per (fold, gamma).
+
+    The candidates and folds are the ones ``RandomizedSearchCV`` would use with the
+    same seed. For every fold and every sampled gamma the train/train and
+    validation/train RBF kernels are computed once, and every C value sharing that
+    gamma is fitted on the precomputed kernel. Folds are scored in parallel.
+
+    Parameters
+    ----------
+    X_train : pandas.DataFrame
+        Training features.
+    y_train : pandas.Series
+        Training target.
+    model : sklearn.svm.SVC
+        Unfitted SVC with an RBF kernel; its other settings are kept.
+    preprocessor :
+        scikit-learn transformer applied before the SVC.
+    param_dist : dict
+        Distribution over "svc__C" and "svc__gamma".
+    pos_label : str or int
+        Positive class label for fbeta_score.
+    beta : float
+        Beta parameter for fbeta_score.
+    seed : int
+        Random seed for candidate sampling.
+    n_iter : int, optional
+        Number of candidates to sample, by default 10.
+    cv : int or iterable, optional
+        Cross-validation splitting strategy, by default 5 stratified folds.
+    memory : TransformCache, optional
+        Cache for the per-fold preprocessor transforms, by default None.
+    n_jobs : int, optional
+        Number of workers scoring folds, by default None (one; -1 uses all CPUs).
+
+    Returns
+    -------
+    SearchResult
+        Search result with a ``cv_results_`` table and the best rbf pipeline refitted on all data.
+    """
+    if not isinstance(model, SVC) or model.kernel != "rbf":
+        raise ValueError("kernel reuse requires an SVC with kernel='rbf'")
+    unknown = set(param_dist) - set(SVC_PARAMS)
+    if unknown:
+        raise ValueError(f"kernel reuse only tunes {SVC_PARAMS}, got {sorted(unknown)}")
+
+    candidates = list(ParameterSampler(param_dist, n_iter=n_iter, random_state=seed))
+    base_params = model.get_params()
+    by_gamma = defaultdict(list)
+    for i, params in enumerate(candidates):
+        by_gamma[params.get("svc__gamma", base_params["gamma"])].append(i)
+
+    splits = list(check_cv(cv, y_train, classifier=True).split(X_train, y_train))
+    folds = Parallel(n_jobs=n_jobs)(
+        delayed(_score_fold)(X_train, y_train, train_idx, test_idx, preprocessor, base_params, candidates, by_gamma,
+                             pos_label, beta, memory)
+        for train_idx, test_idx in splits
+    )
+    test_scores, train_scores, fit_times, score_times = (np.column_stack(columns) for columns in zip(*folds))
+
+    return build_search_result(candidates, test_scores, train_scores, fit_times, score_times,
+                               make_pipeline(preprocessor, model, memory=memory), X_train, y_train)
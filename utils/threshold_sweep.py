@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.model_selection import cross_val_predict
+
+
+def score_method(model):
+    """
+    Name of the method giving continuous scores: decision_function if available, else predict_proba.
+    """
+    return "decision_function" if hasattr(model, "decision_function") else "predict_proba"
+
+
+def _orient_scores(raw, classes, pos_label):
+    """
+    Turn decision_function or predict_proba output into scores where larger means pos_label.
+    """
+    classes = list(classes)
+    if pos_label not in classes:
+        raise ValueError(f"pos_label {pos_label!r} is not one of the classes {classes}")
+    raw = np.asarray(raw, dtype=float)
+    if raw.ndim == 2:
+        return raw[:, classes.index(pos_label)]
+    # binary decision_function is positive for classes[1]
+    return raw if classes.index(pos_label) == 1 else -raw
+
+
+def positive_scores(model, X, pos_label):
+    """
+    Continuous scores of a fitted classifier, larger meaning more likely pos_label.
+
+    Parameters
+    ----------
+    model :
+        Fitted scikit-learn classifier or pipeline with ``decision_function`` or ``predict_proba``.
+    X : pandas.DataFrame
+        Features to score.
+    pos_label : str or int
+        Positive class label.
+
+    Returns
+    -------
+    numpy.ndarray
+        One score per row of ``X``.
+    """
+    return _orient_scores(getattr(model, score_method(model))(X), model.classes_, pos_label)
+
+
+def out_of_fold_scores(model, X, y, pos_label, cv=5, n_jobs=None):
+    """
+    Cross-validated continuous scores, so thresholds are not tuned on data the model was fitted on.
+
+    Parameters
+    ----------
+    model :
+        scikit-learn classifier or pipeline (it is cloned and refitted per fold).
+    X : pandas.DataFrame
+        Training features.
+    y : pandas.Series
+        Training target.
+    pos_label : str or int
+        Positive class label.
+    cv : int or iterable, optional
+        Cross-validation splitting strategy, by default 5 stratified folds.
+    n_jobs : int, optional
+        Number of workers fitting folds, by default None (one).
+
+    Returns
+    -------
+    numpy.ndarray
+        Out-of-fold score of each training row.
+    """
+    method = score_method(model)
+    raw = cross_val_predict(clone(model), X, y, cv=cv, method=method, n_jobs=n_jobs)
+    return _orient_scores(raw, np.unique(y), pos_label)
+
+
+def threshold_curve(y_true, scores, pos_label, beta=2.0):
+    """
+    Precision, recall and F-beta at every distinct decision threshold.
+
+    The scores are sorted once; cumulative sums of positives and negatives then
+    give the confusion counts of every threshold in a single pass. A row is
+    predicted positive when its score is at least the threshold.
+
+    Parameters
+    ----------
+    y_true : array-like
+        True labels.
+    scores : array-like
+        Continuous scores, larger meaning more likely pos_label.
+    pos_label : str or int
+        Positive class label.
+    beta : float, optional
+        Beta parameter of the F-beta score, by default 2.0.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per distinct threshold, from the highest to the lowest, with the
+        counts of true and false positives and the three scores.
+    """
+    y_true = np.asarray(y_true)
+    scores = np.asarray(scores, dtype=float)
+    if len(y_true) != len(scores):
+        raise ValueError("y_true and scores must have the same length")
+    if len(y_true) == 0:
+        raise ValueError("Cannot sweep thresholds over empty scores")
+
+    order = np.argsort(-scores, kind="mergesort")
+    sorted_scores = scores[order]
+    positive = (y_true[order] == pos_label).astype(np.int64)
+    tp = np.cumsum(positive)
+    fp = np.cumsum(1 - positive)
+    # the last row of each group of tied scores is where that threshold's counts end
+    last = np.r_[np.flatnonzero(np.diff(sorted_scores)), len(sorted_scores) - 1]
+    tp, fp = tp[last], fp[last]
+    fn = positive.sum() - tp
+
+    b2 = beta ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+        recall = np.where(tp + fn > 0, tp / (tp + fn), 0.0)
+        denom = (1 + b2) * tp + b2 * fn + fp
+        fbeta = np.where(denom > 0, (1 + b2) * tp / denom, 0.0)
+    return pd.DataFrame({
+        "Threshold": sorted_scores[last],
+        "True Positives": tp,
+        "False Positives": fp,
+        "Precision": precision,
+        "Recall": recall,
+        f"F{beta:g} Score": fbeta,
+    })
+
+
+def best_threshold(curve):
+    """
+    Row of the threshold curve with the highest F-beta score.
+
+    Ties go to the highest threshold, i.e. the fewest positive predictions.
+
+    Parameters
+    ----------
+    curve : pandas.DataFrame
+        Output of ``threshold_curve``.
+
+    Returns
+    -------
+    pandas.Series
+        The selected row.
+    """
+    return curve.loc[curve.iloc[:, -1].idxmax()]
@@ -0,0 +1,128 @@
+import os
+
+import numpy as np
+from joblib import Memory
+from sklearn import get_config
+from sklearn.base import clone
+from sklearn.pipeline import make_pipeline
+
+STATS_FILE = "transform_cache_stats.log"
+
+
+class TransformCache:
+    """
+    On-disk cache for fitted preprocessor transforms, shared across CV folds,
+    hyperparameter candidates, models and pipeline stages.
+
+    Pass it as ``memory`` to ``sklearn.pipeline.make_pipeline``: the pipeline
+    then fits and transforms the preprocessor once per distinct (preprocessor,
+    fold data) pair and loads the transformed matrix from disk for every other
+    model or candidate trained on the same fold. The active ``transform_output``
+    setting is part of the key, so stages that run with pandas output and stages
+    that run with numpy output never read each other's transforms. Hits and
+    misses are appended to
+    a small log in the cache directory so counts survive worker processes;
+    ``stats`` reports the calls made since this object was created.
+
+    Parameters
+    ----------
+    location : str
+        Directory where cached transforms and counters are stored.
+    """
+
+    def __init__(self, location):
+        self.location = location
+        self.memory = Memory(location=location, verbose=0)
+        os.makedirs(location, exist_ok=True)
+        self._stats_path = os.path.join(location, STATS_FILE)
+        self._stats_offset = os.path.getsize(self._stats_path) if os.path.exists(self._stats_path) else 0
+
+    def cache(self, func):
+        """
+        Wrap ``func`` so its results are cached and every call is counted.
+
+        Parameters
+        ----------
+        func : callable
+            Function to cache (the pipeline passes ``_fit_transform_one``).
+
+        Returns
+        -------
+        callable
+            Cached, counting version of ``func``.
+        """
+        return _CountingFunc(self.memory.cache(_call_under_output_config), func, self._stats_path)
+
+    def stats(self):
+        """
+        Return the number of cache hits and misses recorded since this cache was created.
+
+        Returns
+        -------
+        dict
+            Dictionary with "hits" and "misses" keys.
+        """
+        if not os.path.exists(self._stats_path):
+            return {"hits": 0, "misses": 0}
+        with open(self._stats_path) as f:
+            f.seek(self._stats_offset)
+            records = f.read()
+        return {"hits": records.count("H"), "misses": records.count("M")}
+
+
+class _CountingFunc:
+    """
+    Cached function that records whether each call was served from the cache.
+    """
+
+    def __init__(self, memorized_func, func, stats_path):
+        self.memorized_func = memorized_func
+        self.func = func
+        self.stats_path = stats_path
+
+    def __call__(self, *args, **kwargs):
+        key_args = (self.func, get_config()["transform_output"], *args)
+        hit = self.memorized_func.check_call_in_cache(*key_args, **kwargs)
+        # a single short O_APPEND write is atomic, so concurrent workers don't interleave
+        with open(self.stats_path, "a") as f:
+            f.write("H" if hit else "M")
+        return self.memorized_func(*key_args, **kwargs)
+
+
+def _call_under_output_config(func, transform_output, *args, **kwargs):
+    # transform_output is the active setting; it is an argument only to make it part of the cache key
+    return func(*args, **kwargs)
+
+
+def transform_fold(preprocessor, X_train, X_test, y_train=None, memory=None):
+    """
+    Fit a preprocessor on one training fold and transform both sides of the fold.
+
+    Used by the specialised tuners that train on raw matrices instead of
+    pipelines. The preprocessor is fitted as the first step of a pipeline
+    ending in "passthrough", so with ``memory`` it goes through the same
+    cached ``_fit_transform_one`` call as the model pipelines: a fold fitted
+    here is a cache hit for a pipeline trained on the same rows and vice versa.
+
+    Parameters
+    ----------
+    preprocessor :
+        Unfitted (or fitted, it is cloned) scikit-learn transformer.
+    X_train : pandas.DataFrame
+        Training rows of the fold.
+    X_test : pandas.DataFrame
+        Validation rows of the fold.
+    y_train : pandas.Series, optional
+        Training target of the fold; part of the cache key, as in the pipelines.
+    memory : TransformCache, optional
+        Cache for the fitted transform, by default None.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Transformed training and validation matrices as float arrays.
+    """
+    pipeline = make_pipeline(clone(preprocessor), "passthrough", memory=memory)
+    Xt_train = pipeline.fit_transform(X_train, y_train)
+    Xt_test = pipeline.transform(X_test)
+    return np.asarray(Xt_train, dtype=float), np.asarray(Xt_test, dtype=float)
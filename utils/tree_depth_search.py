@@ -0,0 +1,146 @@
+import time
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.metrics import fbeta_score
+from sklearn.model_selection import ParameterSampler, check_cv
+from sklearn.pipeline import make_pipeline
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.utils.parallel import Parallel, delayed
+
+from utils.search_results import build_search_result
+from utils.transform_cache import transform_fold
+
+TREE_PARAMS = ("decisiontreeclassifier__max_depth",)
+
+
+def predict_by_depth(tree, X, depths):
+    """
+    Predict with a fitted decision tree truncated at each of several depths.
+
+    Every sample is routed through the tree once; its prediction at depth d is the
+    majority class of the node it reaches after d splits (or of its leaf, if the
+    leaf is shallower).
+
+    Parameters
+    ----------
+    tree : sklearn.tree.DecisionTreeClassifier
+        Fitted decision tree.
+    X : numpy.ndarray
+        Feature matrix.
+    depths : list of int
+        Depths to predict at.
+
+    Returns
+    -------
+    dict
+        Dictionary with depths as keys and predicted labels as values.
+    """
+    paths = tree.decision_path(X).tocsr()
+    path_lengths = np.diff(paths.indptr)
+    # node ids increase from the root down a path, so each row of indices is ordered by depth
+    node_at = {}
+    for depth in depths:
+        position = paths.indptr[:-1] + np.minimum(depth, path_lengths - 1)
+        node_at[depth] = paths.indices[position]
+    values = tree.tree_.value[:, 0, :]
+    return {depth: tree.classes_[values[nodes].argmax(axis=1)] for depth, nodes in node_at.items()}
+
+
+def _score_fold(X_train, y_train, train_idx, test_idx, model, preprocessor, depths, pos_label, beta, memory):
+    """
+    Score every candidate depth on one fold from a single tree grown to the largest depth.
+
+    Returns the fold's test scores, train scores, fit times and score times, one entry per candidate.
+    """
+    Xt_train, Xt_test = transform_fold(preprocessor, X_train.iloc[train_idx], X_train.iloc[test_idx],
+                                       y_train.iloc[train_idx], memory)
+    y = np.asarray(y_train)
+    y_fold_train, y_fold_test = y[train_idx], y[test_idx]
+
+    start = time.time()
+    tree = clone(model).set_params(max_depth=max(depths)).fit(Xt_train, y_fold_train)
+    fit_time = time.time() - start
+
+    start = time.time()
+    test_predictions = predict_by_depth(tree, Xt_test, set(depths))
+    score_time = (time.time() - start) / len(depths)
+    train_predictions = predict_by_depth(tree, Xt_train, set(depths))
+
+    test_scores = np.array([fbeta_score(y_fold_test, test_predictions[depth], pos_label=pos_label, beta=beta)
+                            for depth in depths])
+    train_scores = np.array([fbeta_score(y_fold_train, train_predictions[depth], pos_label=pos_label, beta=beta)
+                             for depth in depths])
+    return test_scores, train_scores, np.full(len(depths), fit_time), np.full(len(depths), score_time)
+
+
+def tune_tree_depth(X_train, y_train, model, preprocessor, param_dist, pos_label, beta, seed,
+                    n_iter=10, cv=5, memory=None, n_jobs=None):
+    """
+    Tune max_depth of a decision tree by growing one tree per fold.
+
+    The candidates and folds are the ones ``RandomizedSearchCV`` would use with the
+    same seed. In each fold a single tree is grown to the largest sampled depth and
+    every candidate depth is scored on that tree's truncated predictions. Folds
+    are scored in parallel.
+
+    The truncated tree equals a tree grown with that max_depth whenever the best
+    split of each node is unique. When several splits are equally good (common in
+    small, deep nodes) scikit-learn picks one by a random feature order, and a tree
+    stopped at a shallower depth draws that order differently. Scores can then
+    differ slightly from ``RandomizedSearchCV`` (by less than 0.01 mean F2 on the
+    heart data).
+
+    Parameters
+    ----------
+    X_train : pandas.DataFrame
+        Training features.
+    y_train : pandas.Series
+        Training target.
+    model : sklearn.tree.DecisionTreeClassifier
+        Unfitted decision tree; its other settings are kept.
+    preprocessor :
+        scikit-learn transformer applied before the tree.
+    param_dist : dict
+        Distribution over "decisiontreeclassifier__max_depth".
+    pos_label : str or int
+        Positive class label for fbeta_score.
+    beta : float
+        Beta parameter for fbeta_score.
+    seed : int
+        Random seed for candidate sampling.
+    n_iter : int, optional
+        Number of candidates to sample, by default 10.
+    cv : int or iterable, optional
+        Cross-validation splitting strategy, by default 5 stratified folds.
+    memory : TransformCache, optional
+        Cache for the per-fold preprocessor transforms, by default None.
+    n_jobs : int, optional
+        Number of workers scoring folds, by default None (one; -1 uses all CPUs).
+
+    Returns
+    -------
+    SearchResult
+        Search result with a ``cv_results_`` table and the best pipeline refitted on all data.
+    """
+    if not isinstance(model, DecisionTreeClassifier):
+        raise ValueError("the depth sweep requires a DecisionTreeClassifier")
+    unknown = set(param_dist) - set(TREE_PARAMS)
+    if unknown:
+        raise ValueError(f"the depth sweep only tunes {TREE_PARAMS}, got {sorted(unknown)}")
+
+    candidates = list(ParameterSampler(param_dist, n_iter=n_iter, random_state=seed))
+    depths = [params.get("decisiontreeclassifier__max_depth", model.max_depth) for params in candidates]
+    if any(depth is None for depth in depths):
+        raise ValueError("the depth sweep requires integer max_depth values")
+    depths = [int(depth) for depth in depths]
+
+    splits = list(check_cv(cv, y_train, classifier=True).split(X_train, y_train))
+    folds = Parallel(n_jobs=n_jobs)(
+        delayed(_score_fold)(X_train, y_train, train_idx, test_idx, model, preprocessor, depths, pos_label, beta, memory)
+        for train_idx, test_idx in splits
+    )
+    test_scores, train_scores, fit_times, score_times = (np.column_stack(columns) for columns in zip(*folds))
+
+    return build_search_result(candidates, test_scores, train_scores, fit_times, score_times,
+                               make_pipeline(preprocessor, model, memory=memory), X_train, y_train)